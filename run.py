@@ -9,6 +9,7 @@ Usage:
     python run.py eval claude-sonnet-4                # Eval a model (with LLM judge scoring)
     python run.py eval claude-sonnet-4 --ids C01 L02  # Specific prompts
     python run.py eval claude-sonnet-4 --category coding --difficulty hard
+    python run.py eval claude-sonnet-4 --rerun --no-cache  # Re-run without reusing cached responses
 
     python run.py rejudge                              # Rejudge all models with current judge
     python run.py rejudge gpt-4o                      # Rejudge one model
@@ -28,26 +29,29 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
 import os
+import statistics
 import sys
 import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
-import yaml
-from dotenv import load_dotenv
+from scripts import jsonio
 
-load_dotenv()
-
-from scripts.providers import get_provider, sanitize_error
-from scripts.checks import check_response
-from scripts.judge import judge_response
-from scripts.dashboard import generate_dashboard
+# Providers, judges, the dashboard and their dependencies (httpx, yaml,
+# dotenv) are imported inside the commands that use them, so listing
+# commands like `models` and `prompts` start without loading them.
 
 
 RESULTS_DIR = "results"
 EVAL_FILE = "evals/default.json"
+# Below this many prompts a batch job isn't worth its turnaround time
+BATCH_MIN_PROMPTS = 20
+# rejudge stops sending a judge work once this many of its judgements have
+# finished and more than judge_max_failure_rate of them failed
+JUDGE_FAILURE_MIN_SAMPLES = 10
 
 
 # ── Data layer ──
@@ -56,29 +60,109 @@ def model_path(model_name: str) -> str:
     return os.path.join(RESULTS_DIR, f"{model_name}.json")
 
 
+def runs_log_path(model_name: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{model_name}.runs.jsonl")
+
+
 def load_model_results(model_name: str) -> dict:
+    try:
+        data = jsonio.load(model_path(model_name))
+    except FileNotFoundError:
+        data = {
+            "model_name": model_name,
+            "created": datetime.now().isoformat(),
+            "runs": {},
+        }
+    return _replay_runs_log(model_name, data)
+
+
+_INDEX_META_KEYS = ("model_name", "created", "updated")
+
+
+def _strip_run(entry: dict) -> dict:
+    """Drop the bulky text fields (response body, judge rationales) from a run entry."""
+    entry.pop("content", None)
+    for js in entry.get("judge_scores", {}).values():
+        if isinstance(js, dict):
+            js.pop("rationale", None)
+    return entry
+
+
+def load_model_runs_index(model_name: str) -> dict:
+    """Like load_model_results, but without response text or judge rationales.
+
+    For callers that only need scores, flags, latency and tokens (compare,
+    models). With ijson installed the file is stream-parsed so only one run
+    entry's text is in memory at a time; otherwise it's loaded and stripped.
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
     path = model_path(model_name)
-    if Path(path).exists():
-        with open(path) as f:
-            return json.load(f)
-    return {
-        "model_name": model_name,
-        "created": datetime.now().isoformat(),
-        "runs": {},
-    }
+    try:
+        data = _stream_runs_index(path, ijson) if ijson else jsonio.load(path)
+    except FileNotFoundError:
+        data = {"model_name": model_name, "runs": {}}
+    data = _replay_runs_log(model_name, data)
+    for entries in data["runs"].values():
+        for entry in entries:
+            _strip_run(entry)
+    return data
+
+
+def _stream_runs_index(path: str, ijson) -> dict:
+    data = {"runs": {}}
+    pid = entry_prefix = builder = None
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                if event == "end_map" and prefix == entry_prefix:
+                    data["runs"][pid].append(_strip_run(builder.value))
+                    builder = None
+                else:
+                    builder.event(event, value)
+            elif prefix == "runs" and event == "map_key":
+                pid, entry_prefix = value, f"runs.{value}.item"
+                data["runs"][pid] = []
+            elif event == "start_map" and prefix == entry_prefix:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix in _INDEX_META_KEYS and event == "string":
+                data[prefix] = value
+    return data
+
 
+def _replay_runs_log(model_name: str, data: dict) -> dict:
+    """Merge run entries appended to the JSONL log but not yet consolidated."""
+    return jsonio.merge_runs_log(runs_log_path(model_name), data)
 
-def save_model_results(model_name: str, data: dict):
+
+def append_run(model_name: str, pid: str, entry: dict):
+    """Append one run entry to the model's JSONL log without rewriting prior runs."""
     os.makedirs(RESULTS_DIR, exist_ok=True)
-    data["updated"] = datetime.now().isoformat()
+    with open(runs_log_path(model_name), "a", encoding="utf-8") as f:
+        f.write(jsonio.dumps({"pid": pid, **entry}) + "\n")
+
+
+def consolidate_model_results(model_name: str, data: dict):
+    """Write the full results JSON and drop the now-redundant JSONL log."""
+    save_model_results(model_name, data)
+    try:
+        os.remove(runs_log_path(model_name))
+    except FileNotFoundError:
+        pass
+
+
+def save_model_results(model_name: str, data: dict, updated_at: str = None):
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    data["updated"] = updated_at or datetime.now().isoformat()
     target = model_path(model_name)
     tmp = target + ".tmp"
     try:
-        with open(tmp, "w") as f:
-            json.dump(data, f, indent=2)
+        jsonio.dump_pretty(data, tmp)
         # Validate before replacing
-        with open(tmp) as f:
-            json.load(f)
+        jsonio.load(tmp)
         os.replace(tmp, target)
     except Exception:
         if os.path.exists(tmp):
@@ -87,18 +171,31 @@ def save_model_results(model_name: str, data: dict):
 
 
 def list_evaluated_models() -> list[str]:
-    if not Path(RESULTS_DIR).exists():
+    """Models with a results file or a runs log that hasn't been consolidated yet."""
+    try:
+        with os.scandir(RESULTS_DIR) as it:
+            return sorted({
+                e.name[:-len(".runs.jsonl")] if e.name.endswith(".runs.jsonl") else e.name[:-5]
+                for e in it
+                if e.name.endswith((".json", ".runs.jsonl")) and e.name != "comparison.json"
+            })
+    except FileNotFoundError:
         return []
-    return sorted(Path(f).stem for f in Path(RESULTS_DIR).glob("*.json") if f.stem != "comparison")
 
 
 def load_eval(eval_file: str = None) -> list[dict]:
     path = eval_file or EVAL_FILE
-    with open(path) as f:
-        return json.load(f)["prompts"]
+    return jsonio.load(path)["prompts"]
+
+
+def _load_env():
+    """Load API keys from .env for commands that call providers."""
+    from dotenv import load_dotenv
+    load_dotenv()
 
 
 def load_config(path: str = "config.yaml") -> dict:
+    import yaml
     if not Path(path).exists():
         print(f"Config not found: {path}")
         print("Copy config.example.yaml to config.yaml and add your API keys.")
@@ -108,16 +205,15 @@ def load_config(path: str = "config.yaml") -> dict:
 
 
 def filter_prompts(prompts, ids=None, categories=None, difficulty=None):
-    out = prompts
-    if ids:
-        out = [p for p in out if p["id"] in ids]
-    if categories:
-        cats = [c.lower() for c in categories]
-        out = [p for p in out if p["category"].lower() in cats]
-    if difficulty:
-        diffs = [d.lower() for d in difficulty]
-        out = [p for p in out if p["difficulty"].lower() in diffs]
-    return out
+    id_set = set(ids) if ids else None
+    cat_set = {c.lower() for c in categories} if categories else None
+    diff_set = {d.lower() for d in difficulty} if difficulty else None
+    return [
+        p for p in prompts
+        if (id_set is None or p["id"] in id_set)
+        and (cat_set is None or p["category"].lower() in cat_set)
+        and (diff_set is None or p["difficulty"].lower() in diff_set)
+    ]
 
 
 def latest_run(model_data: dict, pid: str) -> dict:
@@ -125,9 +221,278 @@ def latest_run(model_data: dict, pid: str) -> dict:
     return runs[-1] if runs else {}
 
 
+def regenerate_dashboard_in_background():
+    """Rebuild the dashboard in a detached process so the command returns immediately.
+
+    The process writes its output to results/.dashboard.log, and the next
+    call warns if that log shows the previous rebuild crashed.
+    """
+    import subprocess
+    log_path = os.path.join(RESULTS_DIR, ".dashboard.log")
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            if "Traceback" in f.read():
+                print(f"  Warning: the last dashboard rebuild failed - see {log_path}")
+    except FileNotFoundError:
+        pass
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "scripts.dashboard"],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    print(f"  Dashboard regenerating in background (log: {log_path})...")
+
+
 # ── eval command ──
 
+def _response_entry(pmeta, api_model, content, usage, latency, cached=False):
+    """Build the run entry and first log line for a model response.
+
+    latency is None for responses from a batch job, which have no
+    meaningful per-prompt latency.
+    """
+    from scripts.checks import check_response
+    auto = check_response(pmeta, content)
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "api_model": api_model,
+        "content": content,
+        "latency_s": round(latency, 2) if latency is not None else None,
+        "input_tokens": usage.get("input_tokens"),
+        "output_tokens": usage.get("output_tokens"),
+        "auto_checks": auto,
+        "judge_scores": {},
+        "judge_score_avg": None,
+        "judge_score_median": None,
+        "judge_count": 0,
+    }
+    if cached:
+        entry["cached"] = True
+
+    latency_str = f"{latency:.1f}s" if latency is not None else "batch"
+    flag_str = f" ⚠ {', '.join(auto['flags'])}" if auto["flags"] else ""
+    cached_str = " (cached)" if cached else ""
+    return entry, [f"✓ {latency_str}, {usage.get('output_tokens', '?')} tok{cached_str}{flag_str}"]
+
+
+def _error_entry(api_model, error, latency):
+    """Build the run entry and log line for a failed model call."""
+    from scripts.providers import sanitize_error
+    entry = {
+        "timestamp": datetime.now().isoformat(),
+        "api_model": api_model,
+        "content": "",
+        "latency_s": round(latency, 2) if latency is not None else None,
+        "error": sanitize_error(str(error)),
+        "auto_checks": {"flags": ["API_ERROR"], "auto_scores": {}, "passed": False},
+        "judge_scores": {},
+        "judge_score_avg": None,
+        "judge_score_median": None,
+        "judge_count": 0,
+    }
+    return entry, [f"✗ Error: {sanitize_error(str(error))}"]
+
+
+async def _complete_prompt(pmeta, provider, params, api_model, cache_dir=None, endpoint=""):
+    """Run one prompt through the model and the auto-checks.
+
+    Returns (entry, log_lines). Errors are recorded on the entry rather than
+    raised so one failing prompt doesn't abort the rest of the batch.
+    Pass cache_dir to reuse stored responses for identical requests to the
+    same endpoint (see scripts.cache.endpoint_id).
+    """
+    from scripts.cache import cached_acomplete
+    t0 = time.time()
+    try:
+        if cache_dir:
+            content, usage, latency, cached = await cached_acomplete(provider, pmeta["prompt"], params, api_model, cache_dir, endpoint)
+        else:
+            content, usage = await provider.acomplete(pmeta["prompt"], params)
+            latency, cached = time.time() - t0, False
+        return _response_entry(pmeta, api_model, content, usage, latency, cached)
+    except Exception as e:
+        return _error_entry(api_model, e, time.time() - t0)
+
+
+async def _complete_batch(prompts, provider, params, api_model, cache_dir=None, endpoint=""):
+    """Complete prompts through the provider's batch API.
+
+    Cached responses are reused and only the misses are submitted.
+    Returns {pid: (entry, log_lines)}.
+    """
+    from scripts.cache import cache_get, cache_put, completion_key
+    out, todo = {}, []
+    for pmeta in prompts:
+        hit = cache_get(completion_key(api_model, pmeta["prompt"], params, endpoint), cache_dir) if cache_dir else None
+        if hit is not None:
+            out[pmeta["id"]] = _response_entry(pmeta, api_model, hit["content"], hit["usage"], hit["latency_s"], cached=True)
+        else:
+            todo.append(pmeta)
+    if not todo:
+        return out
+
+    print(f"  Submitting {len(todo)} prompts as a batch job (this can take a while)...")
+    try:
+        results = await asyncio.to_thread(provider.batch_complete, [p["prompt"] for p in todo], params)
+    except Exception as e:
+        results = [e] * len(todo)
+
+    for pmeta, result in zip(todo, results):
+        if isinstance(result, Exception):
+            out[pmeta["id"]] = _error_entry(api_model, result, None)
+            continue
+        content, usage = result
+        if cache_dir:
+            cache_put(completion_key(api_model, pmeta["prompt"], params, endpoint),
+                      {"content": content, "usage": usage, "latency_s": None}, cache_dir)
+        out[pmeta["id"]] = _response_entry(pmeta, api_model, content, usage, None)
+        out[pmeta["id"]][0]["batch"] = True
+    return out
+
+
+async def _score_entry(pmeta, entry, log, judge_providers, config, judge_cache_dir=None):
+    """Judge and DeepEval-score a completed entry in place, appending to log."""
+    from scripts.cache import cached_ajudge_response
+    from scripts.judge import ajudge_response, auto_judgement, judge_ensemble, judge_summary
+    content, auto = entry["content"], entry["auto_checks"]
+
+    async def judge_one(jname, provider, params, *item):
+        jr = judge_providers[jname].get("skip_empty") and auto_judgement(content)
+        if jr:
+            return jr
+        if judge_cache_dir:
+            return await cached_ajudge_response(jname, provider, params, *item, judge_cache_dir)
+        return await ajudge_response(provider, params, *item)
+
+    try:
+        if judge_providers:
+            judges = {jname: (jinfo["provider"], jinfo["params"]) for jname, jinfo in judge_providers.items()}
+            result = await judge_ensemble(judges, pmeta, content, auto, judge=judge_one)
+            judged_at = datetime.now().isoformat()
+            for jname, js in result["judge_scores"].items():
+                entry["judge_scores"][jname] = {**js, "judged_at": judged_at}
+                score_str = f"{js['score']}/5" if js["score"] else "failed"
+                log.append(f"    Judge ({jname}): {score_str}")
+            entry.update(judge_summary(entry["judge_scores"]))
+    except Exception as e:
+        log.append(f"    Judge error: {e}")
+
+    # DeepEval scoring (inline during eval if enabled)
+    deepeval_cfg = config.get("deepeval", {})
+    if deepeval_cfg.get("enabled"):
+        try:
+            from scripts.deepeval_scorer import score_with_deepeval
+            de = await asyncio.to_thread(score_with_deepeval, pmeta, content, config)
+            entry["deepeval_scores"] = de["deepeval_scores"]
+            entry["deepeval_avg"] = de["deepeval_avg"]
+            if de["deepeval_avg"] is not None:
+                log.append(f"    DeepEval: {de['deepeval_avg']:.2f} ({', '.join(f'{k}={v:.2f}' for k, v in de['deepeval_scores'].items() if v is not None)})")
+            else:
+                log.append(f"    DeepEval: failed")
+        except Exception as e2:
+            log.append(f"    DeepEval error: {e2}")
+
+
+def requests_per_minute(eval_cfg: dict) -> float | None:
+    """Model request rate limit: eval.requests_per_minute, else derived from
+    delay_between_calls. None means unlimited."""
+    rpm = eval_cfg.get("requests_per_minute")
+    if rpm:
+        return rpm
+    delay = eval_cfg.get("delay_between_calls", 1.0)
+    return 60 / delay if delay else None
+
+
+def _limited_judges(judges, rpm=None):
+    """Wrap each judge's provider in its own request limiter, plus a token
+    limiter when the judge sets tokens_per_minute.
+
+    A judge's own requests_per_minute overrides rpm; with neither set the
+    judge is only retried, not throttled.
+    """
+    from scripts.ratelimit import AsyncTokenBucket, LimitedProvider
+    limited = {}
+    for jname, jinfo in judges.items():
+        jrpm = jinfo.get("rpm") or rpm
+        tpm = jinfo.get("tpm")
+        limited[jname] = LimitedProvider(
+            jinfo["provider"],
+            AsyncTokenBucket(jrpm) if jrpm else None,
+            token_limiter=AsyncTokenBucket(tpm, burst=tpm) if tpm else None,
+        )
+    return limited
+
+
+async def _eval_prompts(model_name, model_cfg, model_data, prompts, provider, judge_providers, config,
+                        use_cache=True):
+    """Evaluate prompts concurrently, logging each result as it completes.
+
+    Each entry is appended to the model's JSONL run log; the consolidated
+    results JSON is written once at the end.
+    """
+    from scripts.cache import endpoint_id
+    from scripts.ratelimit import AsyncTokenBucket, LimitedProvider
+    eval_cfg = config.get("eval", {})
+    params = model_cfg.get("params", {})
+    concurrency = eval_cfg.get("concurrency", 8)
+    rpm = requests_per_minute(eval_cfg)
+    provider = LimitedProvider(provider, AsyncTokenBucket(rpm) if rpm else None)
+    # The eval rpm is the evaluated model's limit; judges only get their own
+    limited = _limited_judges(judge_providers)
+    judge_providers = {jname: {**jinfo, "provider": limited[jname]} for jname, jinfo in judge_providers.items()}
+    sem = asyncio.Semaphore(concurrency)
+    judge_sem = asyncio.Semaphore(eval_cfg.get("judge_concurrency", concurrency))
+    cache_dir = os.path.join(RESULTS_DIR, ".cache") if use_cache else None
+    judge_cache_dir = os.path.join(RESULTS_DIR, ".judge_cache") if use_cache else None
+    endpoint = endpoint_id(model_cfg)
+
+    batched = None
+    if model_cfg.get("use_batch_api") and provider.supports_batch and len(prompts) >= BATCH_MIN_PROMPTS:
+        batched = await _complete_batch(prompts, provider, params, model_cfg["model"], cache_dir, endpoint)
+
+    async def run_one(pmeta):
+        if batched is not None:
+            entry, log = batched[pmeta["id"]]
+        else:
+            async with sem:
+                entry, log = await _complete_prompt(pmeta, provider, params, model_cfg["model"], cache_dir, endpoint)
+        # Scoring happens outside the eval slot, so the next prompt's model
+        # call starts while this one is still being judged.
+        if "error" not in entry:
+            async with judge_sem:
+                await _score_entry(pmeta, entry, log, judge_providers, config, judge_cache_dir)
+        return pmeta, entry, log
+
+    try:
+        for i, fut in enumerate(asyncio.as_completed([run_one(p) for p in prompts]), 1):
+            pmeta, entry, log = await fut
+            pid = pmeta["id"]
+            print(f"  [{i}/{len(prompts)}] {pid} — {pmeta['subcategory']}... {log[0]}")
+            for line in log[1:]:
+                print(line)
+
+            model_data["runs"].setdefault(pid, []).append(entry)
+            try:
+                append_run(model_name, pid, entry)
+            except Exception as e:
+                print(f"  ⚠ Log append failed: {e}")
+    finally:
+        for prov in (provider, *(jinfo["provider"] for jinfo in judge_providers.values())):
+            await prov.aclose()
+            prov.close()
+
+    try:
+        consolidate_model_results(model_name, model_data)
+    except Exception as e:
+        print(f"  ⚠ Save failed (runs kept in {runs_log_path(model_name)}): {e}")
+
+
 def cmd_eval(args):
+    from scripts.providers import get_provider
+    _load_env()
     config = load_config(args.config)
     model_name = args.model
 
@@ -144,8 +509,9 @@ def cmd_eval(args):
         print("No prompts match your filters.")
         sys.exit(1)
 
+    # Loaded in full once: the run itself appends to this same data
     model_data = load_model_results(model_name)
-    already_done = set(model_data["runs"].keys())
+    already_done = set(model_data["runs"])
     overlap = {p["id"] for p in prompts} & already_done
 
     if overlap and not args.rerun:
@@ -162,9 +528,6 @@ def cmd_eval(args):
         print(f"Error: {e}")
         sys.exit(1)
 
-    params = model_cfg.get("params", {})
-    delay = config.get("eval", {}).get("delay_between_calls", 1.0)
-
     # Set up LLM judges
     judges_cfg = config.get("judges", [])
     judge_providers = {}
@@ -178,97 +541,26 @@ def cmd_eval(args):
             continue
         try:
             jprov = get_provider(models_cfg[jname])
-            judge_providers[jname] = {"provider": jprov, "params": jcfg.get("params", {})}
+            judge_providers[jname] = {"provider": jprov, "params": jcfg.get("params", {}),
+                                      "skip_empty": jcfg.get("skip_empty", False),
+                                      "rpm": jcfg.get("requests_per_minute"),
+                                      "tpm": jcfg.get("tokens_per_minute")}
         except ValueError as e:
             print(f"  Warning: could not init judge provider '{jname}': {e}")
 
+    concurrency = config.get("eval", {}).get("concurrency", 8)
+    rpm = requests_per_minute(config.get("eval", {}))
+
     print(f"\n{'='*60}")
     print(f"  Evaluating: {model_name} ({model_cfg['model']})")
     if judge_providers:
         print(f"  Judges: {', '.join(judge_providers.keys())}")
-    print(f"  Prompts: {len(prompts)}")
+    rate_str = f", {rpm:g} req/min" if rpm else ""
+    print(f"  Prompts: {len(prompts)} (concurrency: {concurrency}{rate_str})")
     print(f"{'='*60}\n")
 
-    for i, pmeta in enumerate(prompts, 1):
-        pid = pmeta["id"]
-        print(f"  [{i}/{len(prompts)}] {pid} — {pmeta['subcategory']}...", end=" ", flush=True)
-
-        t0 = time.time()
-        try:
-            content, usage = provider.complete(pmeta["prompt"], params)
-            latency = time.time() - t0
-            auto = check_response(pmeta, content)
-
-            entry = {
-                "timestamp": datetime.now().isoformat(),
-                "api_model": model_cfg["model"],
-                "content": content,
-                "latency_s": round(latency, 2),
-                "input_tokens": usage.get("input_tokens"),
-                "output_tokens": usage.get("output_tokens"),
-                "auto_checks": auto,
-                "judge_scores": {},
-                "judge_score_avg": None,
-                "judge_count": 0,
-            }
-
-            flag_str = f" ⚠ {', '.join(auto['flags'])}" if auto["flags"] else ""
-            print(f"✓ {latency:.1f}s, {usage.get('output_tokens', '?')} tok{flag_str}")
-
-            if judge_providers:
-                for jname, jinfo in judge_providers.items():
-                    jr = judge_response(jinfo["provider"], jinfo["params"], pmeta, content, auto)
-                    entry["judge_scores"][jname] = {
-                        "score": jr["judge_score"],
-                        "rationale": jr["judge_rationale"],
-                        "judged_at": datetime.now().isoformat(),
-                    }
-                    score_str = f"{jr['judge_score']}/5" if jr["judge_score"] else "failed"
-                    print(f"    Judge ({jname}): {score_str}")
-                valid = [v["score"] for v in entry["judge_scores"].values() if v["score"] is not None]
-                entry["judge_score_avg"] = round(sum(valid) / len(valid), 2) if valid else None
-                entry["judge_count"] = len(valid)
-
-            # DeepEval scoring (inline during eval if enabled)
-            deepeval_cfg = config.get("deepeval", {})
-            if deepeval_cfg.get("enabled"):
-                try:
-                    from scripts.deepeval_scorer import score_with_deepeval
-                    de = score_with_deepeval(pmeta, content, config)
-                    entry["deepeval_scores"] = de["deepeval_scores"]
-                    entry["deepeval_avg"] = de["deepeval_avg"]
-                    if de["deepeval_avg"] is not None:
-                        print(f"    DeepEval: {de['deepeval_avg']:.2f} ({', '.join(f'{k}={v:.2f}' for k, v in de['deepeval_scores'].items() if v is not None)})")
-                    else:
-                        print(f"    DeepEval: failed")
-                except Exception as e2:
-                    print(f"    DeepEval error: {e2}")
-
-        except Exception as e:
-            latency = time.time() - t0
-            entry = {
-                "timestamp": datetime.now().isoformat(),
-                "api_model": model_cfg["model"],
-                "content": "",
-                "latency_s": round(latency, 2),
-                "error": sanitize_error(str(e)),
-                "auto_checks": {"flags": ["API_ERROR"], "auto_scores": {}, "passed": False},
-                "judge_scores": {},
-                "judge_score_avg": None,
-                "judge_count": 0,
-            }
-            print(f"✗ Error: {sanitize_error(str(e))}")
-
-        if pid not in model_data["runs"]:
-            model_data["runs"][pid] = []
-        model_data["runs"][pid].append(entry)
-        try:
-            save_model_results(model_name, model_data)
-        except Exception as e:
-            print(f"  ⚠ Save failed (will retry next prompt): {e}")
-
-        if i < len(prompts):
-            time.sleep(delay)
+    asyncio.run(_eval_prompts(model_name, model_cfg, model_data, prompts, provider, judge_providers, config,
+                              use_cache=not args.no_cache))
 
     flagged = sum(
         1 for p in prompts
@@ -283,13 +575,21 @@ def cmd_eval(args):
     print(f"\n  Next step: python run.py compare")
 
     # Auto-regenerate dashboard
-    path = generate_dashboard()
-    if path:
-        print(f"  Dashboard updated: {path}")
+    regenerate_dashboard_in_background()
 
 
 # ── compare command ──
 
+def _judge_median(run: dict) -> float:
+    """A run's median judge score; runs saved before the median was stored
+    get it from their judge_scores, or fall back to the mean."""
+    if run.get("judge_score_median") is not None:
+        return run["judge_score_median"]
+    valid = [js["score"] for js in run.get("judge_scores", {}).values()
+             if isinstance(js, dict) and js.get("score") is not None]
+    return statistics.median(valid) if valid else run["judge_score_avg"]
+
+
 def cmd_compare(args):
     config = load_config(args.config)
     eval_file = config.get("eval", {}).get("eval_file", EVAL_FILE)
@@ -304,7 +604,7 @@ def cmd_compare(args):
 
     models = {}
     for name in model_names:
-        data = load_model_results(name)
+        data = load_model_runs_index(name)
         if data["runs"]:
             models[name] = data
 
@@ -314,6 +614,12 @@ def cmd_compare(args):
 
     col_w = max(len(n) for n in models) + 2
 
+    # Resolve each (model, prompt) latest run once; every section below reads from this.
+    latest_by_model = {
+        name: {pid: latest_run(data, pid) for pid in pids}
+        for name, data in models.items()
+    }
+
     # Load composite weights
     comp_cfg = config.get("composite", {})
     judge_weight = comp_cfg.get("judge_weight", 0.5)
@@ -323,31 +629,41 @@ def cmd_compare(args):
     print(f"  MODEL COMPARISON — {len(pids)} prompts")
     print(f"{'='*80}\n")
 
-    header = f"{'Model':<{col_w}} {'Composite':>10} {'Score':>9} {'Scored':>7} {'Flagged':>8} {'Latency':>8} {'Tokens':>8}"
+    header = (f"{'Model':<{col_w}} {'Composite':>10} {'Score':>9} {'Median':>7} {'Scored':>7} {'Flagged':>8}"
+              f" {'Latency':>8} {'Tokens':>8}")
     print(header)
     print("─" * len(header))
 
+    # One pass per model over its latest runs; per-prompt judge scores are kept
+    # so the category breakdown below doesn't have to revisit the runs.
     leaderboard = []
-    for name, data in models.items():
-        scores, latencies, tokens = [], [], []
+    score_rows = {}
+    for name, latest in latest_by_model.items():
+        scores, medians, latencies, tokens = [], [], [], []
         de_avgs = []
         flagged = 0
+        total = 0
+        row = score_rows[name] = {}
         for pid in pids:
-            run = latest_run(data, pid)
+            run = latest[pid]
             if not run:
                 continue
+            total += 1
             if run.get("judge_score_avg") is not None:
                 scores.append(run["judge_score_avg"])
+                row[pid] = run["judge_score_avg"]
+                medians.append(_judge_median(run))
             if run.get("auto_checks", {}).get("flags"):
                 flagged += 1
-            latencies.append(run.get("latency_s", 0))
+            if run.get("latency_s") is not None:
+                latencies.append(run["latency_s"])
             tokens.append(run.get("output_tokens", 0) or 0)
             de_avg = run.get("deepeval_avg")
             if de_avg is not None:
                 de_avgs.append(de_avg)
 
-        total = sum(1 for pid in pids if latest_run(data, pid))
         avg_s = sum(scores) / len(scores) if scores else 0
+        med_s = sum(medians) / len(medians) if medians else 0
         avg_l = sum(latencies) / len(latencies) if latencies else 0
         avg_t = sum(tokens) / len(tokens) if tokens else 0
         deepeval_avg = sum(de_avgs) / len(de_avgs) if de_avgs else None
@@ -363,18 +679,22 @@ def cmd_compare(args):
         else:
             composite = None
 
-        leaderboard.append((name, avg_s, len(scores), total, flagged, avg_l, avg_t, composite))
+        leaderboard.append((name, avg_s, med_s, len(scores), total, flagged, avg_l, avg_t, composite))
 
-    leaderboard.sort(key=lambda x: (x[2] > 0, x[7] or 0), reverse=True)
+    leaderboard.sort(key=lambda x: (x[3] > 0, x[8] or 0), reverse=True)
 
-    for name, avg_s, scored, total, flagged, avg_l, avg_t, composite in leaderboard:
+    for name, avg_s, med_s, scored, total, flagged, avg_l, avg_t, composite in leaderboard:
         s = f"{avg_s:.2f}/5" if scored else "  —  "
+        m = f"{med_s:.2f}" if scored else "  —  "
         c = f"{composite:.2f}" if composite is not None else "  —  "
-        print(f"{name:<{col_w}} {c:>10} {s:>9} {scored:>3}/{total:<3} {flagged:>8} {avg_l:>7.1f}s {avg_t:>7.0f}")
+        print(f"{name:<{col_w}} {c:>10} {s:>9} {m:>7} {scored:>3}/{total:<3} {flagged:>8} {avg_l:>7.1f}s {avg_t:>7.0f}")
 
     # Category breakdown
     if not args.category:
-        categories = sorted(set(p["category"] for p in prompts))
+        pids_by_cat = defaultdict(list)
+        for p in prompts:
+            pids_by_cat[p["category"]].append(p["id"])
+        categories = sorted(pids_by_cat)
         print(f"\n{'─'*70}")
         print("BY CATEGORY\n")
 
@@ -386,15 +706,11 @@ def cmd_compare(args):
         print("─" * len(ch))
 
         for cat in categories:
-            cat_pids = [p["id"] for p in prompts if p["category"] == cat]
+            cat_pids = pids_by_cat[cat]
             row = f"{cat:<22}"
             for name, *_ in leaderboard:
-                data = models[name]
-                sc = [
-                    latest_run(data, pid).get("judge_score_avg")
-                    for pid in cat_pids
-                    if latest_run(data, pid) and latest_run(data, pid).get("judge_score_avg") is not None
-                ]
+                model_scores = score_rows[name]
+                sc = [model_scores[pid] for pid in cat_pids if pid in model_scores]
                 row += f" {(f'{sum(sc)/len(sc):.2f}' if sc else '—'):>{cw}}"
             print(row)
 
@@ -405,7 +721,7 @@ def cmd_compare(args):
     for pid in pids:
         row_flags = {}
         for name in [n for n, *_ in leaderboard]:
-            run = latest_run(models[name], pid)
+            run = latest_by_model[name][pid]
             if run:
                 fl = run.get("auto_checks", {}).get("flags", [])
                 if fl:
@@ -423,7 +739,8 @@ def cmd_compare(args):
     if args.save:
         os.makedirs(RESULTS_DIR, exist_ok=True)
         path = os.path.join(RESULTS_DIR, "comparison.md")
-        _save_comparison_md(path, leaderboard, models, prompts, prompts_by_id)
+        with open(path, "w", buffering=1 << 16) as f:
+            _save_comparison_md(f, leaderboard, latest_by_model, prompts, prompts_by_id)
         print(f"\nReport saved: {path}")
 
 
@@ -435,13 +752,18 @@ def cmd_models(args):
 
     print(f"\nEvaluated models ({len(models)}):\n")
     for name in models:
-        data = load_model_results(name)
+        data = load_model_runs_index(name)
         total = len(data["runs"])
-        scored = sum(1 for rs in data["runs"].values() if rs and rs[-1].get("judge_score_avg") is not None)
-        de_scored = sum(
-            1 for rs in data["runs"].values()
-            if rs and rs[-1].get("deepeval_scores") and any(v is not None for v in rs[-1]["deepeval_scores"].values())
-        )
+        scored = de_scored = 0
+        for rs in data["runs"].values():
+            if not rs:
+                continue
+            run = rs[-1]
+            if run.get("judge_score_avg") is not None:
+                scored += 1
+            de = run.get("deepeval_scores")
+            if de and any(v is not None for v in de.values()):
+                de_scored += 1
         updated = data.get("updated", data.get("created", "?"))[:10]
         print(f"  {name:<30} {total:>2} prompts, {scored:>2} judged, {de_scored:>2} deepeval  (updated: {updated})")
 
@@ -457,41 +779,145 @@ def cmd_prompts(args):
         print(f"  {p['id']:<6} {cat:<24} {p['difficulty']:<8} {short}")
 
 
-def _save_comparison_md(path, leaderboard, models, prompts, prompts_by_id):
-    lines = [
-        "# LLM Comparison Report",
-        f"*Generated: {datetime.now().isoformat()}*\n",
-        "## Leaderboard\n",
-        "| Model | Composite | Avg Score | Scored | Flagged | Avg Latency | Avg Tokens |",
-        "|---|---|---|---|---|---|---|",
-    ]
-    for name, avg_s, scored, total, flagged, avg_l, avg_t, composite in leaderboard:
+def _save_comparison_md(f, leaderboard, latest_by_model, prompts, prompts_by_id):
+    """Write the comparison report to an open text file, line by line."""
+    def line(s=""):
+        f.write(s)
+        f.write("\n")
+
+    line("# LLM Comparison Report")
+    line(f"*Generated: {datetime.now().isoformat()}*\n")
+    line("## Leaderboard\n")
+    line("| Model | Composite | Avg Score | Avg Median | Scored | Flagged | Avg Latency | Avg Tokens |")
+    line("|---|---|---|---|---|---|---|---|")
+    for name, avg_s, med_s, scored, total, flagged, avg_l, avg_t, composite in leaderboard:
         s = f"{avg_s:.2f}/5" if scored else "-"
+        m = f"{med_s:.2f}" if scored else "-"
         c = f"{composite:.2f}" if composite is not None else "-"
-        lines.append(f"| {name} | {c} | {s} | {scored}/{total} | {flagged} | {avg_l:.1f}s | {avg_t:.0f} |")
+        line(f"| {name} | {c} | {s} | {m} | {scored}/{total} | {flagged} | {avg_l:.1f}s | {avg_t:.0f} |")
 
-    lines.append("\n## Per-Prompt Detail\n")
+    line("\n## Per-Prompt Detail\n")
     for p in prompts:
         pid = p["id"]
-        lines.append(f"### {pid} — {p['subcategory']} ({p['difficulty']})\n")
+        line(f"### {pid} — {p['subcategory']} ({p['difficulty']})\n")
         for name, *_ in leaderboard:
-            run = latest_run(models[name], pid)
+            run = latest_by_model[name][pid]
             if not run:
                 continue
             score = run.get("judge_score_avg", "—")
             fl = run.get("auto_checks", {}).get("flags", [])
             flag_str = f" ⚠ {', '.join(fl)}" if fl else ""
-            judge_details = ""
-            for jn, js in run.get("judge_scores", {}).items():
-                if js.get("score") is not None:
-                    judge_details += f" [{jn}: {js['score']}/5]"
-            lines.append(f"**{name}**: score={score}{flag_str}{judge_details}\n")
+            judge_details = "".join(
+                f" [{jn}: {js['score']}/5]"
+                for jn, js in run.get("judge_scores", {}).items()
+                if js.get("score") is not None
+            )
+            line(f"**{name}**: score={score}{flag_str}{judge_details}\n")
+
+
+class JudgeAborted(RuntimeError):
+    """A judgement skipped because its judge was failing too often."""
+
+
+async def _judge_pending(model_name, pending, judges, concurrency, rpm, cache_dir=None, max_failure_rate=None):
+    """Judge (pid, judge name, prompt meta, response, auto_checks) items concurrently.
+
+    Each judge gets its own rate limiter. A judge with batch_size > 1 scores up
+    to that many of its items per call, and one with skip_empty scores empty
+    responses locally. Results come back in pending order; a failed judgement
+    is returned as its exception. cache_dir=None skips the judge cache.
+    With max_failure_rate set, a judge whose failure rate goes over it (after
+    JUDGE_FAILURE_MIN_SAMPLES judgements) gets no more calls; its remaining
+    items come back as JudgeAborted.
+    """
+    from scripts.cache import cache_get, cache_put, cached_ajudge_response, judge_cache_key
+    from scripts.judge import ajudge_batch, ajudge_response, auto_judgement, judge_all_async
+    limited = _limited_judges(judges, rpm)
+
+    # Each group of pending indexes is one judge call
+    results = [None] * len(pending)
+    groups, batched = [], {}
+    for i, item in enumerate(pending):
+        jname = item[1]
+        if judges[jname].get("skip_empty") and (jr := auto_judgement(item[3])):
+            results[i] = jr
+            print(f"    {model_name}/{item[0]} judge={jname}... {jr['judge_score']}/5 (empty)")
+        elif judges[jname].get("batch_size", 1) > 1:
+            batched.setdefault(jname, []).append(i)
+        else:
+            groups.append([i])
+    for jname, idxs in batched.items():
+        size = judges[jname]["batch_size"]
+        groups.extend(idxs[k:k + size] for k in range(0, len(idxs), size))
+
+    async def judge_single(pid, jname, pmeta, content, auto_checks):
+        params = judges[jname]["params"]
+        if cache_dir is None:
+            return await ajudge_response(limited[jname], params, pmeta, content, auto_checks)
+        return await cached_ajudge_response(jname, limited[jname], params, pmeta, content, auto_checks, cache_dir)
+
+    async def judge_batch(jname, idxs):
+        jinfo = judges[jname]
+        # Batched scores are cached apart from single-item ones
+        key_params = {**jinfo["params"], "batch_size": jinfo["batch_size"]}
+        keys = [judge_cache_key(jname, key_params, *pending[i][2:]) for i in idxs]
+        results = [cache_get(k, cache_dir) if cache_dir else None for k in keys]
+        misses = [n for n, jr in enumerate(results) if jr is None]
+        if misses:
+            fresh = await ajudge_batch(limited[jname], jinfo["params"], [pending[idxs[n]][2:] for n in misses])
+            for n, jr in zip(misses, fresh):
+                results[n] = jr
+                if cache_dir and jr["judge_score"] is not None:
+                    cache_put(keys[n], jr, cache_dir)
+        return results
+
+    finished, failed, aborted = {}, {}, set()
+
+    async def judge_group(idxs):
+        jname = pending[idxs[0]][1]
+        if jname in aborted:
+            raise JudgeAborted(f"{jname} failure rate over {max_failure_rate:.0%}")
+        if judges[jname].get("batch_size", 1) > 1:
+            return await judge_batch(jname, idxs)
+        return [await judge_single(*pending[idxs[0]])]
+
+    def on_done(g, results):
+        if isinstance(results, JudgeAborted):
+            return
+        for n, i in enumerate(groups[g]):
+            pid, jname = pending[i][:2]
+            jr = results if isinstance(results, Exception) else results[n]
+            if isinstance(jr, Exception):
+                status = f"error: {jr}"
+            else:
+                status = f"{jr['judge_score']}/5" if jr["judge_score"] else "failed"
+            print(f"    {model_name}/{pid} judge={jname}... {status}")
+            if max_failure_rate is None or jname in aborted:
+                continue
+            finished[jname] = finished.get(jname, 0) + 1
+            failed[jname] = failed.get(jname, 0) + (isinstance(jr, Exception) or jr["judge_score"] is None)
+            if finished[jname] >= JUDGE_FAILURE_MIN_SAMPLES and failed[jname] / finished[jname] > max_failure_rate:
+                aborted.add(jname)
+                print(f"    {jname}: {failed[jname]}/{finished[jname]} judgements failed - skipping its remaining items")
+
+    try:
+        group_results = await judge_all_async([(idxs,) for idxs in groups], concurrency,
+                                              judge=judge_group, on_done=on_done)
+    finally:
+        # Async clients are bound to this event loop; drop them before it closes
+        for jinfo in judges.values():
+            await jinfo["provider"].aclose()
 
-    with open(path, "w") as f:
-        f.write("\n".join(lines))
+    for idxs, group in zip(groups, group_results):
+        for n, i in enumerate(idxs):
+            results[i] = group if isinstance(group, Exception) else group[n]
+    return results
 
 
 def cmd_rejudge(args):
+    from scripts.judge import judge_preflight, judge_summary
+    from scripts.providers import get_provider
+    _load_env()
     config = load_config(args.config)
     models_cfg = config.get("models", {})
 
@@ -508,7 +934,11 @@ def cmd_rejudge(args):
             continue
         try:
             jprov = get_provider(models_cfg[jname])
-            judge_providers[jname] = {"provider": jprov, "params": jcfg.get("params", {})}
+            judge_providers[jname] = {"provider": jprov, "params": jcfg.get("params", {}),
+                                      "batch_size": jcfg.get("batch_size", 1),
+                                      "skip_empty": jcfg.get("skip_empty", False),
+                                      "rpm": jcfg.get("requests_per_minute"),
+                                      "tpm": jcfg.get("tokens_per_minute")}
         except ValueError as e:
             print(f"  Warning: could not init judge provider '{jname}': {e}")
 
@@ -532,130 +962,148 @@ def cmd_rejudge(args):
     eval_file = config.get("eval", {}).get("eval_file", EVAL_FILE)
     prompts = load_eval(eval_file)
     prompts_by_id = {p["id"]: p for p in prompts}
-    delay = config.get("eval", {}).get("delay_between_calls", 1.0)
+    eval_cfg = config.get("eval", {})
+    rpm = requests_per_minute(eval_cfg)
+    concurrency = eval_cfg.get("judge_concurrency", eval_cfg.get("concurrency", 8))
+    max_failure_rate = eval_cfg.get("judge_max_failure_rate", 0.5)
+    # --force means a fresh judgement, so it bypasses the judge cache
+    judge_cache_dir = None if args.force else os.path.join(RESULTS_DIR, ".judge_cache")
 
     print(f"\n{'='*60}")
     print(f"  Rejudging with: {', '.join(judge_providers.keys())}")
-    print(f"  Models: {len(model_names)}")
+    print(f"  Models: {len(model_names)} (concurrency: {concurrency})")
     print(f"  Force: {args.force}")
     print(f"{'='*60}\n")
 
     total_judged = 0
     total_skipped = 0
     total_errors = 0
+    preflighted = set()
 
-    for model_name in model_names:
-        # Filter out judges that match the model being evaluated (self-judge exclusion)
-        applicable_judges = {jn: jp for jn, jp in judge_providers.items() if jn != model_name}
-        if not applicable_judges:
-            print(f"  Skipping {model_name} (all judges excluded due to self-judge)")
-            continue
-
-        model_data = load_model_results(model_name)
-        if not model_data["runs"]:
-            print(f"  Skipping {model_name} (no results)")
-            continue
-
-        pids = list(model_data["runs"].keys())
-        changed = False
-        judges_needed_by_pid = {}
-
-        for pid in pids:
-            runs = model_data.get("runs", {}).get(pid, [])
-            if not runs:
-                continue
-            run = runs[-1]
-            if run.get("error"):
+    try:
+        for model_name in model_names:
+            # Filter out judges that match the model being evaluated (self-judge exclusion)
+            applicable_judges = {jn: jp for jn, jp in judge_providers.items() if jn != model_name}
+            if not applicable_judges:
+                print(f"  Skipping {model_name} (all judges excluded due to self-judge)")
                 continue
 
-            pmeta = prompts_by_id.get(pid)
-            if not pmeta:
+            model_data = load_model_results(model_name)
+            if not model_data["runs"]:
+                print(f"  Skipping {model_name} (no results)")
                 continue
 
-            # Ensure judge_scores dict exists on the latest run
-            if "judge_scores" not in run:
-                run["judge_scores"] = {}
+            pids = list(model_data["runs"].keys())
+            changed = False
+            judges_needed_by_pid = {}
+            pending = []  # (pid, judge name, prompt meta, response, auto_checks)
 
-            # Determine which judges need to score this prompt
-            judges_needed = []
-            for jname in applicable_judges:
-                if not args.force and jname in run["judge_scores"] and run["judge_scores"][jname].get("score") is not None:
-                    total_skipped += 1
+            for pid in pids:
+                runs = model_data.get("runs", {}).get(pid, [])
+                if not runs:
+                    continue
+                run = runs[-1]
+                if run.get("error"):
                     continue
-                judges_needed.append(jname)
 
-            if not judges_needed:
-                continue
+                pmeta = prompts_by_id.get(pid)
+                if not pmeta:
+                    continue
 
-            judges_needed_by_pid[pid] = judges_needed
-            auto_checks = run.get("auto_checks", {"flags": [], "auto_scores": {}, "passed": True})
+                # Ensure judge_scores dict exists on the latest run
+                if "judge_scores" not in run:
+                    run["judge_scores"] = {}
 
-            for jname in judges_needed:
-                jinfo = applicable_judges[jname]
-                print(f"    {model_name}/{pid} judge={jname}...", end=" ", flush=True)
+                # Determine which judges need to score this prompt
+                judges_needed = []
+                for jname in applicable_judges:
+                    if not args.force and jname in run["judge_scores"] and run["judge_scores"][jname].get("score") is not None:
+                        total_skipped += 1
+                        continue
+                    judges_needed.append(jname)
 
-                try:
-                    jr = judge_response(jinfo["provider"], jinfo["params"], pmeta, run["content"], auto_checks)
+                if not judges_needed:
+                    continue
 
-                    run["judge_scores"][jname] = {
-                        "score": jr["judge_score"],
-                        "rationale": jr["judge_rationale"],
-                        "judged_at": datetime.now().isoformat(),
-                    }
+                judges_needed_by_pid[pid] = judges_needed
+                auto_checks = run.get("auto_checks", {"flags": [], "auto_scores": {}, "passed": True})
+                for jname in judges_needed:
+                    pending.append((pid, jname, pmeta, run["content"], auto_checks))
 
-                    score_str = f"{jr['judge_score']}/5" if jr["judge_score"] else "failed"
-                    print(f"{score_str}")
-                    if jr["judge_score"] is not None:
-                        total_judged += 1
-                    else:
-                        total_errors += 1
-                    changed = True
-                except Exception as e:
-                    print(f"error: {e}")
-                    total_errors += 1
+            # Fail fast on a misconfigured judge (bad key, base_url, model), once it has work
+            for jname in sorted({item[1] for item in pending} - preflighted):
+                preflighted.add(jname)
+                try:
+                    judge_preflight(judge_providers[jname]["provider"], judge_providers[jname]["params"])
+                except RuntimeError as e:
+                    print(f"  Warning: {jname}: {e} - skipping this judge")
+                    judge_providers.pop(jname)["provider"].close()
+                    applicable_judges.pop(jname)
+            if not judge_providers:
+                print("No judges passed the preflight check.")
+                sys.exit(1)
+            pending = [item for item in pending if item[1] in applicable_judges]
+            if not pending:
+                continue
 
-                time.sleep(delay)
+            results = asyncio.run(_judge_pending(model_name, pending, applicable_judges, concurrency, rpm,
+                                                 judge_cache_dir, max_failure_rate))
+            # One timestamp for the whole pass, shared by its scores and the file
+            judged_at = datetime.now().isoformat()
+            for (pid, jname, *_), jr in zip(pending, results):
+                if isinstance(jr, Exception):
+                    total_errors += 1
+                    continue
+                model_data["runs"][pid][-1]["judge_scores"][jname] = {
+                    "score": jr["judge_score"],
+                    "rationale": jr["judge_rationale"],
+                    "judged_at": judged_at,
+                }
+                if jr["judge_score"] is not None:
+                    total_judged += 1
+                else:
+                    total_errors += 1
+                changed = True
 
-            # Recompute aggregates after all judges scored this prompt
-            valid = [v["score"] for v in run["judge_scores"].values() if v["score"] is not None]
-            run["judge_score_avg"] = round(sum(valid) / len(valid), 2) if valid else None
-            run["judge_count"] = len(valid)
+            # Recompute aggregates after all judges scored each prompt
+            for pid in judges_needed_by_pid:
+                run = model_data["runs"][pid][-1]
+                run.update(judge_summary(run["judge_scores"]))
 
-        if changed:
-            try:
-                # Re-read file to avoid clobbering scores written by concurrent processes
-                fresh_data = load_model_results(model_name)
-                for pid in model_data["runs"]:
-                    fresh_runs = fresh_data.get("runs", {}).get(pid, [])
-                    if not fresh_runs:
-                        continue
-                    fresh_run = fresh_runs[-1]
-                    if "judge_scores" not in fresh_run:
-                        fresh_run["judge_scores"] = {}
-                    # Merge our judge scores into the fresh data
-                    source_run = model_data["runs"][pid][-1]
-                    for jname, jdata in source_run.get("judge_scores", {}).items():
-                        if jname in judges_needed_by_pid.get(pid, []):
-                            fresh_run["judge_scores"][jname] = jdata
-                    # Recompute aggregates
-                    valid = [v["score"] for v in fresh_run["judge_scores"].values() if isinstance(v, dict) and v.get("score") is not None]
-                    fresh_run["judge_score_avg"] = round(sum(valid) / len(valid), 2) if valid else None
-                    fresh_run["judge_count"] = len(valid)
-                save_model_results(model_name, fresh_data)
-            except Exception as e:
-                print(f"    Save failed: {e}")
+            if changed:
+                try:
+                    # Re-read file to avoid clobbering scores written by concurrent processes
+                    fresh_data = load_model_results(model_name)
+                    for pid in model_data["runs"]:
+                        fresh_runs = fresh_data.get("runs", {}).get(pid, [])
+                        if not fresh_runs:
+                            continue
+                        fresh_run = fresh_runs[-1]
+                        if "judge_scores" not in fresh_run:
+                            fresh_run["judge_scores"] = {}
+                        # Merge our judge scores into the fresh data
+                        source_run = model_data["runs"][pid][-1]
+                        for jname, jdata in source_run.get("judge_scores", {}).items():
+                            if jname in judges_needed_by_pid.get(pid, []):
+                                fresh_run["judge_scores"][jname] = jdata
+                        # Recompute aggregates
+                        fresh_run.update(judge_summary(fresh_run["judge_scores"]))
+                    save_model_results(model_name, fresh_data, updated_at=judged_at)
+                except Exception as e:
+                    print(f"    Save failed: {e}")
+    finally:
+        for jinfo in judge_providers.values():
+            jinfo["provider"].close()
 
     print(f"\n  Done: {total_judged} judged, {total_skipped} skipped, {total_errors} errors")
 
     # Auto-regenerate dashboard
-    path = generate_dashboard()
-    if path:
-        print(f"  Dashboard updated: {path}")
+    regenerate_dashboard_in_background()
 
 
 def cmd_deepeval(args):
     from scripts.deepeval_scorer import score_with_deepeval
-
+    _load_env()
     config = load_config(args.config)
 
     # Determine which models to score
@@ -740,6 +1188,7 @@ def cmd_deepeval(args):
                     "auto_checks": run.get("auto_checks", {"flags": [], "auto_scores": {}, "passed": True}),
                     "judge_scores": run.get("judge_scores", {}),
                     "judge_score_avg": run.get("judge_score_avg"),
+                    "judge_score_median": run.get("judge_score_median"),
                     "judge_count": run.get("judge_count", 0),
                     "deepeval_scores": de["deepeval_scores"],
                     "deepeval_avg": de["deepeval_avg"],
@@ -769,9 +1218,7 @@ def cmd_deepeval(args):
     print(f"\n  Done: {total_scored} scored, {total_skipped} skipped, {total_errors} errors")
 
     # Auto-regenerate dashboard
-    path = generate_dashboard()
-    if path:
-        print(f"  Dashboard updated: {path}")
+    regenerate_dashboard_in_background()
 
 
 def cmd_migrate_judges(args):
@@ -825,6 +1272,7 @@ def cmd_migrate_judges(args):
                     }
                 }
                 run["judge_score_avg"] = float(old_score) if old_score is not None else None
+                run["judge_score_median"] = old_score
                 run["judge_count"] = 1 if old_score is not None else 0
 
                 # Remove old fields
@@ -843,6 +1291,7 @@ def cmd_migrate_judges(args):
 
 
 def cmd_dashboard(args):
+    from scripts.dashboard import generate_dashboard
     path = generate_dashboard(args.output if hasattr(args, "output") else None)
     if path:
         print(f"Dashboard generated: {path}")
@@ -866,6 +1315,7 @@ def main():
     p.add_argument("--category", nargs="+")
     p.add_argument("--difficulty", nargs="+")
     p.add_argument("--rerun", action="store_true", help="Re-run already evaluated prompts")
+    p.add_argument("--no-cache", action="store_true", help="Always call the API, ignoring cached responses")
 
     p = sub.add_parser("compare", help="Compare models")
     p.add_argument("models", nargs="*")
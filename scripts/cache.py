@@ -0,0 +1,135 @@
+"""Content-addressed on-disk cache for model and judge responses.
+
+Model responses are stored as results/.cache/<sha256>.json, keyed on
+everything that determines the response (provider, endpoint, model,
+prompt, params), so
+re-running a byte-identical request skips the API call entirely.
+Judgements live in results/.judge_cache/, keyed on the judge, its params,
+the judge prompt template, the prompt's text, ideal answer and criteria,
+the response and the auto-check results shown to the judge.
+Recently used entries are also kept in memory so repeat lookups within a
+run skip the file read.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+from scripts import judge
+from scripts.judge import ajudge_response
+
+
+CACHE_DIR = os.path.join("results", ".cache")
+JUDGE_CACHE_DIR = os.path.join("results", ".judge_cache")
+
+# Everything about the judge prompt that isn't per-item; editing the rubric
+# or the truncation caps retires every cached judgement
+_JUDGE_TEMPLATE = hashlib.sha256(json.dumps([
+    judge.JUDGE_PROMPT, judge.JUDGE_PROMPT_BATCH, judge.JUDGE_JSON_REMINDER,
+    judge.JUDGE_MAX_RESPONSE_CHARS, judge.JUDGE_MAX_IDEAL_CHARS, judge.TRUNCATION_MARKER,
+]).encode()).hexdigest()[:16]
+
+# In-process LRU over (cache_dir, key); misses are not remembered
+_MEMO: OrderedDict = OrderedDict()
+_MEMO_SIZE = 4096
+
+
+def cache_key(*parts) -> str:
+    """Stable SHA-256 over JSON-serialisable key parts."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def cache_get(key: str, cache_dir: str = CACHE_DIR) -> dict | None:
+    """Return the cached value for key, or None on a miss or unreadable entry."""
+    memo_key = (cache_dir, key)
+    if memo_key in _MEMO:
+        _MEMO.move_to_end(memo_key)
+        return dict(_MEMO[memo_key])
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json")) as f:
+            value = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    _remember(memo_key, value)
+    return dict(value)
+
+
+def _remember(memo_key: tuple, value: dict):
+    _MEMO[memo_key] = value
+    _MEMO.move_to_end(memo_key)
+    if len(_MEMO) > _MEMO_SIZE:
+        _MEMO.popitem(last=False)
+
+
+def cache_put(key: str, value: dict, cache_dir: str = CACHE_DIR):
+    """Write value atomically so concurrent readers never see a partial file."""
+    os.makedirs(cache_dir, exist_ok=True)
+    target = os.path.join(cache_dir, f"{key}.json")
+    tmp = f"{target}.{os.getpid()}.{id(value)}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp, target)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    _remember((cache_dir, key), dict(value))
+
+
+def endpoint_id(model_cfg: dict) -> str:
+    """Provider type and endpoint of a configured model.
+
+    The same model string served by different APIs (OpenRouter vs native,
+    another Ollama host, Bedrock vs direct) must not share cached responses.
+    """
+    return "|".join(str(model_cfg.get(k) or "") for k in ("provider", "base_url", "region"))
+
+
+def completion_key(api_model: str, prompt: str, params: dict, endpoint: str = "") -> str:
+    return cache_key("complete", endpoint, api_model, prompt, params)
+
+
+async def cached_acomplete(provider, prompt: str, params: dict, api_model: str,
+                           cache_dir: str = CACHE_DIR, endpoint: str = "") -> tuple[str, dict, float, bool]:
+    """provider.acomplete() with the disk cache in front.
+
+    endpoint is the model's endpoint_id(). Returns (content, usage,
+    latency_s, cached). On a hit the latency of the original call is
+    returned so cached runs don't skew latency stats. Errors are never
+    cached.
+    """
+    key = completion_key(api_model, prompt, params, endpoint)
+    hit = cache_get(key, cache_dir)
+    if hit is not None:
+        return hit["content"], hit["usage"], hit["latency_s"], True
+
+    t0 = time.time()
+    content, usage = await provider.acomplete(prompt, params)
+    latency = round(time.time() - t0, 2)
+    cache_put(key, {"content": content, "usage": usage, "latency_s": latency}, cache_dir)
+    return content, usage, latency, False
+
+
+def judge_cache_key(judge_name: str, judge_params: dict, prompt_meta: dict,
+                    response: str, auto_checks: dict) -> str:
+    item = {k: prompt_meta.get(k) for k in ("id", "prompt", "ideal", "criteria")}
+    return cache_key("judge", judge_name, judge_params, _JUDGE_TEMPLATE, item, response, auto_checks)
+
+
+async def cached_ajudge_response(judge_name: str, judge_provider, judge_params: dict,
+                                 prompt_meta: dict, response: str, auto_checks: dict,
+                                 cache_dir: str = JUDGE_CACHE_DIR) -> dict:
+    """ajudge_response() with the disk cache in front. Failed judgements aren't cached."""
+    key = judge_cache_key(judge_name, judge_params, prompt_meta, response, auto_checks)
+    hit = cache_get(key, cache_dir)
+    if hit is not None:
+        return hit
+
+    jr = await ajudge_response(judge_provider, judge_params, prompt_meta, response, auto_checks)
+    if jr["judge_score"] is not None:
+        cache_put(key, jr, cache_dir)
+    return jr
@@ -1,15 +1,27 @@
 """Generate a self-contained HTML dashboard from eval results."""
 
+import base64
+import bisect
+import functools
+import gzip
+import hashlib
 import html as html_mod
 import json
 import math
 import os
+import pickle
+import re
+import statistics
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 import yaml
 
+from scripts import jsonio
+
 RESULTS_DIR = "results"
 EVAL_FILE = "evals/default.json"
 DOCS_DIR = "docs"
@@ -25,24 +37,96 @@ def load_config():
     return {}
 
 
+def _load_result_file(path):
+    try:
+        return jsonio.load(path)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"  Warning: skipping corrupt result file {os.path.basename(path)}: {e}")
+        return None
+
+
+def _result_paths(name):
+    """A model's result file and runs log (appended during an eval, until consolidated)."""
+    return os.path.join(RESULTS_DIR, f"{name}.json"), os.path.join(RESULTS_DIR, f"{name}.runs.jsonl")
+
+
+def _result_model_names():
+    """Sorted names of models with a result file or runs log in RESULTS_DIR ([] if it's missing)."""
+    try:
+        with os.scandir(RESULTS_DIR) as it:
+            return sorted({
+                e.name[:-len(".runs.jsonl")] if e.name.endswith(".runs.jsonl") else e.name[:-5]
+                for e in it
+                if e.name.endswith((".json", ".runs.jsonl")) and e.name != "comparison.json"
+            })
+    except FileNotFoundError:
+        return []
+
+
+def _load_model_results(name):
+    """A model's results with any unconsolidated runs log merged in."""
+    path, log_path = _result_paths(name)
+    if os.path.exists(path):
+        data = _load_result_file(path)
+        if data is None:
+            return None
+    else:
+        data = {"model_name": name, "runs": {}}
+    return jsonio.merge_runs_log(log_path, data)
+
+
 def load_all_results():
-    """Load all model result files."""
-    models = {}
-    for f in sorted(Path(RESULTS_DIR).glob("*.json")):
-        if f.stem == "comparison":
-            continue
-        try:
-            with open(f) as fh:
-                models[f.stem] = json.load(fh)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"  Warning: skipping corrupt result file {f.name}: {e}")
-    return models
+    """Load all model results, reading them in parallel."""
+    names = _result_model_names()
+    if not names:
+        return {}
+    # Reads and parses are independent per model; threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as pool:
+        loaded = list(pool.map(_load_model_results, names))
+    return {name: data for name, data in zip(names, loaded) if data is not None}
+
+
+def _stats_cache_path():
+    return os.path.join(RESULTS_DIR, ".dashboard_cache", "stats.pkl")
+
+
+def _stats_cache_key(eval_file, *settings):
+    """Fingerprint of everything compute_stats() output depends on.
+
+    Files are identified by path, mtime and size, so a rewritten result file,
+    eval set or dashboard module invalidates the cache without reading them.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    paths = [p for name in _result_model_names() for p in _result_paths(name) if os.path.exists(p)]
+    for path in (*paths, eval_file or EVAL_FILE, __file__):
+        st = os.stat(path)
+        h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    h.update(repr(settings).encode())
+    return h.hexdigest()
+
+
+def _cached_stats(key):
+    """Stats pickled under key, or None on a miss or unreadable cache."""
+    try:
+        with open(_stats_cache_path(), "rb") as f:
+            cached_key, stats = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    return stats if cached_key == key else None
+
+
+def _store_stats(key, stats):
+    path = _stats_cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump((key, stats), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
 
 
 def load_prompts(eval_file=None):
     path = eval_file or EVAL_FILE
-    with open(path) as f:
-        return json.load(f)["prompts"]
+    return jsonio.load(path)["prompts"]
 
 
 def latest_run(model_data, pid):
@@ -50,42 +134,86 @@ def latest_run(model_data, pid):
     return runs[-1] if runs else {}
 
 
+def _mean(values):
+    """Arithmetic mean of a non-empty list; sum() runs in C so no per-item Python work."""
+    return sum(values) / len(values)
+
+
+def _composite(judge_score, deepeval_avg, judge_weight, deepeval_weight):
+    """Weighted average of the judge score (1-5, normalised to 0-1) and DeepEval avg (0-1).
+
+    Falls back to whichever side is present; None if neither is.
+    """
+    if judge_score is None:
+        return round(deepeval_avg, 4) if deepeval_avg is not None else None
+    normalized_judge = (judge_score - 1) / 4
+    if deepeval_avg is None:
+        return round(normalized_judge, 4)
+    return round(judge_weight * normalized_judge + deepeval_weight * deepeval_avg, 4)
+
+
 def compute_stats(models, prompts, judge_models=None, composite_config=None, models_cfg=None):
     """Compute all stats needed for the dashboard."""
     judge_weight = (composite_config or {}).get("judge_weight", 0.5)
     deepeval_weight = (composite_config or {}).get("deepeval_weight", 0.5)
     models_cfg = models_cfg or {}
     pids = [p["id"] for p in prompts]
-    categories = sorted(set(p["category"] for p in prompts))
-    cat_pids = {c: [p["id"] for p in prompts if p["category"] == c] for c in categories}
+    prompt_by_id = {p["id"]: p for p in prompts}
     difficulties = ["easy", "medium", "hard"]
-    diff_pids = {d: [p["id"] for p in prompts if p["difficulty"] == d] for d in difficulties}
+    pid_to_cat = {p["id"]: p["category"] for p in prompts}
+    pid_to_diff = {p["id"]: p["difficulty"] for p in prompts}
+    categories = sorted(set(pid_to_cat.values()))
+
+    # Latest run per (model, prompt), resolved once and shared by every section below
+    latest_by_model = {}
+    # Per-prompt auto-check flags, collected in the same pass: pid -> {model: flags}
+    flags_by_pid = {pid: {} for pid in pids}
 
     leaderboard = []
     for name, data in models.items():
         latencies, tokens, errors = [], [], 0
         flagged = 0
+        total = scorable = de_scored = 0
+        cat_scorable = dict.fromkeys(categories, 0)
+        diff_scorable = dict.fromkeys(difficulties, 0)
         de_scores_all = {"correctness": [], "coherence": [], "instruction_following": []}
         de_avgs = []
-        runs_cache = {pid: latest_run(data, pid) for pid in pids}
+        # deepeval_avg per category/difficulty, including error runs that carry one
+        cat_de_vals = {cat: [] for cat in categories}
+        diff_de_vals = {d: [] for d in difficulties}
+        runs = data.get("runs", {})
+        runs_cache = latest_by_model[name] = {pid: (runs.get(pid) or [{}])[-1] for pid in pids}
 
         # Per-judge score breakdown (compute first - used for avg_score)
         judge_breakdown = {}
         judge_cat_breakdown = {cat: {} for cat in categories}
         judge_diff_breakdown = {d: {} for d in difficulties}
-        pid_to_cat = {p["id"]: p["category"] for p in prompts}
-        pid_to_diff = {p["id"]: p["difficulty"] for p in prompts}
 
         for pid in pids:
             run = runs_cache[pid]
             if not run:
                 continue
+            total += 1
+            fl = [f for f in run.get("auto_checks", {}).get("flags", [])
+                  if not f.startswith("API_ERROR") and f != "EMPTY_RESPONSE"]
+            if fl:
+                flags_by_pid[pid][name] = fl
+            de_avg = run.get("deepeval_avg")
+            if de_avg is not None:
+                cat_de_vals[pid_to_cat[pid]].append(de_avg)
+                if pid_to_diff[pid] in diff_de_vals:
+                    diff_de_vals[pid_to_diff[pid]].append(de_avg)
             if run.get("error"):
                 errors += 1
                 continue
+            scorable += 1
+            cat_scorable[pid_to_cat[pid]] += 1
+            if pid_to_diff[pid] in diff_scorable:
+                diff_scorable[pid_to_diff[pid]] += 1
             if run.get("auto_checks", {}).get("flags"):
                 flagged += 1
-            latencies.append(run.get("latency_s", 0))
+            if run.get("latency_s") is not None:
+                latencies.append(run["latency_s"])
             tokens.append(run.get("output_tokens", 0) or 0)
             # DeepEval scores
             de = run.get("deepeval_scores", {})
@@ -93,7 +221,8 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
                 val = de.get(metric_key)
                 if val is not None:
                     de_scores_all[metric_key].append(val)
-            de_avg = run.get("deepeval_avg")
+            if de and any(v is not None for v in de.values()):
+                de_scored += 1
             if de_avg is not None:
                 de_avgs.append(de_avg)
             # Collect per-judge scores (global, per-category, per-difficulty)
@@ -110,10 +239,7 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
 
         judge_averages = {}
         for jname, jscores in judge_breakdown.items():
-            judge_averages[jname] = round(sum(jscores) / len(jscores), 2) if jscores else None
-
-        # Count scorable prompts (non-error runs)
-        scorable = sum(1 for pid in pids if runs_cache[pid] and not runs_cache[pid].get("error"))
+            judge_averages[jname] = round(_mean(jscores), 2) if jscores else None
 
         # Only include judges with complete coverage (scored every scorable prompt)
         complete_judges = {
@@ -123,18 +249,17 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
 
         # avg_score = mean of complete judges only (fair comparison)
         cj_values = list(complete_judges.values())
-        avg_s = sum(cj_values) / len(cj_values) if cj_values else 0
+        avg_s = _mean(cj_values) if cj_values else 0
         scored_count = scorable
 
-        total = sum(1 for pid in pids if runs_cache[pid])
-        avg_l = sum(latencies) / len(latencies) if latencies else 0
-        avg_t = sum(tokens) / len(tokens) if tokens else 0
-        median_l = sorted(latencies)[len(latencies) // 2] if latencies else 0
+        avg_l = _mean(latencies) if latencies else 0
+        avg_t = _mean(tokens) if tokens else 0
+        median_l = statistics.median_high(latencies) if latencies else 0
 
         # Judge agreement (std dev) - only from complete judges
         if len(cj_values) >= 2:
-            mean_ja = sum(cj_values) / len(cj_values)
-            judge_std_dev = round((sum((x - mean_ja) ** 2 for x in cj_values) / len(cj_values)) ** 0.5, 2)
+            mean_ja = _mean(cj_values)
+            judge_std_dev = round(_mean([(x - mean_ja) ** 2 for x in cj_values]) ** 0.5, 2)
         else:
             judge_std_dev = None
 
@@ -142,60 +267,32 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
         cat_scores = {}
         cat_deepeval = {}
         cat_composite = {}
-        cat_scorable = {cat: sum(1 for pid in cat_pids[cat] if runs_cache[pid] and not runs_cache[pid].get("error")) for cat in categories}
         for cat in categories:
             # Only include judges that scored every scorable prompt in this category
             cat_ja_vals = []
             for jname, jscores in judge_cat_breakdown[cat].items():
                 if jscores and len(jscores) >= cat_scorable[cat]:
-                    cat_ja_vals.append(sum(jscores) / len(jscores))
-            cat_scores[cat] = round(sum(cat_ja_vals) / len(cat_ja_vals), 2) if cat_ja_vals else None
+                    cat_ja_vals.append(_mean(jscores))
+            cat_scores[cat] = round(_mean(cat_ja_vals), 2) if cat_ja_vals else None
             # DeepEval per-category average
-            cat_de = [
-                runs_cache[pid].get("deepeval_avg")
-                for pid in cat_pids[cat]
-                if runs_cache[pid] and runs_cache[pid].get("deepeval_avg") is not None
-            ]
-            cat_deepeval[cat] = round(sum(cat_de) / len(cat_de), 2) if cat_de else None
+            cat_de = cat_de_vals[cat]
+            cat_deepeval[cat] = round(_mean(cat_de), 2) if cat_de else None
             # Per-category composite
-            cat_nj = (cat_scores[cat] - 1) / 4 if cat_scores[cat] is not None else None
-            cat_da = cat_deepeval[cat]
-            if cat_nj is not None and cat_da is not None:
-                cat_composite[cat] = round(judge_weight * cat_nj + deepeval_weight * cat_da, 4)
-            elif cat_nj is not None:
-                cat_composite[cat] = round(cat_nj, 4)
-            elif cat_da is not None:
-                cat_composite[cat] = round(cat_da, 4)
-            else:
-                cat_composite[cat] = None
+            cat_composite[cat] = _composite(cat_scores[cat], cat_deepeval[cat], judge_weight, deepeval_weight)
 
         # Difficulty scores: mean of complete judges only per difficulty
         diff_scores = {}
         diff_deepeval = {}
         diff_composite = {}
-        diff_scorable = {d: sum(1 for pid in diff_pids[d] if runs_cache[pid] and not runs_cache[pid].get("error")) for d in difficulties}
         for d in difficulties:
             diff_ja_vals = []
             for jname, jscores in judge_diff_breakdown[d].items():
                 if jscores and len(jscores) >= diff_scorable[d]:
-                    diff_ja_vals.append(sum(jscores) / len(jscores))
-            diff_scores[d] = round(sum(diff_ja_vals) / len(diff_ja_vals), 2) if diff_ja_vals else None
-            d_de = [
-                runs_cache[pid].get("deepeval_avg")
-                for pid in diff_pids[d]
-                if runs_cache[pid] and runs_cache[pid].get("deepeval_avg") is not None
-            ]
-            diff_deepeval[d] = round(sum(d_de) / len(d_de), 2) if d_de else None
-            d_nj = (diff_scores[d] - 1) / 4 if diff_scores[d] is not None else None
-            d_da = diff_deepeval[d]
-            if d_nj is not None and d_da is not None:
-                diff_composite[d] = round(judge_weight * d_nj + deepeval_weight * d_da, 4)
-            elif d_nj is not None:
-                diff_composite[d] = round(d_nj, 4)
-            elif d_da is not None:
-                diff_composite[d] = round(d_da, 4)
-            else:
-                diff_composite[d] = None
+                    diff_ja_vals.append(_mean(jscores))
+            diff_scores[d] = round(_mean(diff_ja_vals), 2) if diff_ja_vals else None
+            d_de = diff_de_vals[d]
+            diff_deepeval[d] = round(_mean(d_de), 2) if d_de else None
+            diff_composite[d] = _composite(diff_scores[d], diff_deepeval[d], judge_weight, deepeval_weight)
 
         # Judge vs DeepEval divergence (complete judges only)
         # For each prompt, compute mean of complete judges' scores, normalize, compare to deepeval
@@ -212,17 +309,13 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
                     if jdata and jdata.get("score") is not None:
                         cj_scores.append(jdata["score"])
                 if cj_scores:
-                    js_mean = sum(cj_scores) / len(cj_scores)
+                    js_mean = _mean(cj_scores)
                     divergences.append(abs((js_mean - 1) / 4 - da))
-        avg_divergence = round(sum(divergences) / len(divergences), 4) if divergences else None
+        avg_divergence = round(_mean(divergences), 4) if divergences else None
 
         # Score distribution from complete judges only (integer 1-5)
-        dist = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-        for jname, jscores in judge_breakdown.items():
-            if jname in complete_judges:
-                for s in jscores:
-                    bucket = max(1, min(5, round(s)))
-                    dist[bucket] = dist.get(bucket, 0) + 1
+        buckets = Counter(max(1, min(5, round(s))) for jname in complete_judges for s in judge_breakdown[jname])
+        dist = {b: buckets[b] for b in range(1, 6)}
 
         # Efficiency = score / log2(avg_tokens) - rewards high scores with fewer tokens
         if avg_s > 0 and avg_t > 1:
@@ -231,30 +324,12 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
             efficiency = 0
 
         # DeepEval averages
-        deepeval_avg = round(sum(de_avgs) / len(de_avgs), 4) if de_avgs else None
+        deepeval_avg = round(_mean(de_avgs), 4) if de_avgs else None
         deepeval_metrics = {}
         for metric_key, vals in de_scores_all.items():
-            deepeval_metrics[metric_key] = round(sum(vals) / len(vals), 4) if vals else None
-
-        # Composite score: weighted average of normalized judge (0-1) and deepeval avg (0-1)
-        normalized_judge = (avg_s - 1) / 4 if cj_values else None
-        if normalized_judge is not None and deepeval_avg is not None:
-            composite_score = round(judge_weight * normalized_judge + deepeval_weight * deepeval_avg, 4)
-        elif normalized_judge is not None:
-            composite_score = round(normalized_judge, 4)
-        elif deepeval_avg is not None:
-            composite_score = round(deepeval_avg, 4)
-        else:
-            composite_score = None
+            deepeval_metrics[metric_key] = round(_mean(vals), 4) if vals else None
 
-        # Count prompts with non-None deepeval scores
-        de_scored = sum(
-            1 for pid in pids
-            if runs_cache[pid]
-            and not runs_cache[pid].get("error")
-            and runs_cache[pid].get("deepeval_scores")
-            and any(v is not None for v in runs_cache[pid]["deepeval_scores"].values())
-        )
+        composite_score = _composite(avg_s if cj_values else None, deepeval_avg, judge_weight, deepeval_weight)
 
         # Inject company and launch_date from config
         mcfg = models_cfg.get(name, {})
@@ -288,24 +363,20 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
             "avg_divergence": avg_divergence,
             "judge_averages": judge_averages,
             "judge_std_dev": judge_std_dev,
+            # Models with no scorable responses sink to the bottom; dropped after sorting
+            "_sort_key": (scored_count > 0, composite_score or 0),
         })
 
-    leaderboard.sort(key=lambda x: (x["scored"] > 0, x["composite_score"] or 0), reverse=True)
+    leaderboard.sort(key=itemgetter("_sort_key"), reverse=True)
+    for row in leaderboard:
+        del row["_sort_key"]
 
     # Per-prompt flags
-    flags = []
-    for pid in pids:
-        p = next(p for p in prompts if p["id"] == pid)
-        row = {}
-        for name in models:
-            run = latest_run(models[name], pid)
-            if run:
-                fl = [f for f in run.get("auto_checks", {}).get("flags", [])
-                      if not f.startswith("API_ERROR") and f != "EMPTY_RESPONSE"]
-                if fl:
-                    row[name] = fl
-        if row:
-            flags.append({"id": pid, "subcategory": p["subcategory"], "models": row})
+    flags = [
+        {"id": p["id"], "subcategory": p["subcategory"], "models": flags_by_pid[p["id"]]}
+        for p in prompts
+        if flags_by_pid[p["id"]]
+    ]
 
     companies = sorted(set(m.get("company", "Unknown") for m in leaderboard))
 
@@ -320,15 +391,15 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
             "prompt_text": p["prompt"][:200],
             "models": {},
         }
-        for name, data in models.items():
-            run = latest_run(data, p["id"])
+        for name, latest in latest_by_model.items():
+            run = latest[p["id"]]
             if run and not run.get("error"):
                 pr["models"][name] = {
                     "judge_score": run.get("judge_score_avg"),
                     "judge_scores": run.get("judge_scores", {}),
                     "judge_count": run.get("judge_count", 0),
                     "deepeval_avg": run.get("deepeval_avg"),
-                    "latency_s": round(run.get("latency_s", 0), 1),
+                    "latency_s": round(run.get("latency_s") or 0, 1),
                     "error": False,
                     "flags": run.get("auto_checks", {}).get("flags", []),
                 }
@@ -344,22 +415,20 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
 
     # --- Per-judge global aggregations ---
     # Collect all (judge, model, pid, score, deepeval_avg, category, difficulty) tuples
-    prompt_lookup = {p["id"]: p for p in prompts}
     judge_all_scores = {}  # judge -> list of scores
     judge_cat_scores = {}  # judge -> cat -> list of scores
     judge_diff_scores = {}  # judge -> diff -> list of scores
     judge_model_scores = {}  # judge -> model -> list of scores
-    judge_score_dists = {}  # judge -> {1:n, 2:n, ...}
     judge_deepeval_divs = {}  # judge -> list of abs divergences
     # For pairwise: prompt_key -> {judge: score}
     prompt_judge_map = {}  # (model, pid) -> {judge: score}
 
-    for name, data in models.items():
+    for name, latest in latest_by_model.items():
         for pid in pids:
-            run = latest_run(data, pid)
+            run = latest[pid]
             if not run or run.get("error"):
                 continue
-            p_info = prompt_lookup.get(pid, {})
+            p_info = prompt_by_id.get(pid, {})
             cat = p_info.get("category", "")
             diff = p_info.get("difficulty", "")
             de_avg = run.get("deepeval_avg")
@@ -381,11 +450,6 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
                 # By model
                 judge_model_scores.setdefault(jname, {}).setdefault(name, []).append(sc)
 
-                # Score distribution
-                if jname not in judge_score_dists:
-                    judge_score_dists[jname] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-                judge_score_dists[jname][sc] = judge_score_dists[jname].get(sc, 0) + 1
-
                 # DeepEval divergence per judge
                 if de_avg is not None:
                     norm_sc = (sc - 1) / 4
@@ -395,6 +459,12 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
                 key = (name, pid)
                 prompt_judge_map.setdefault(key, {})[jname] = sc
 
+    # Score distribution per judge: {1:n, 2:n, ...}
+    judge_score_dists = {
+        jname: {**dict.fromkeys(range(1, 6), 0), **Counter(scores)}
+        for jname, scores in judge_all_scores.items()
+    }
+
     # judge_global: each judge's global average
     judge_global = {}
     for jname, scores in judge_all_scores.items():
@@ -465,7 +535,7 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
         spread = max(vals) - min(vals)
         if spread > 0:
             model_name, pid = key
-            p_info = prompt_lookup.get(pid, {})
+            p_info = prompt_by_id.get(pid, {})
             biggest_disagreements.append({
                 "prompt_id": pid,
                 "model": model_name,
@@ -476,6 +546,7 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
     biggest_disagreements.sort(key=lambda x: x["spread"], reverse=True)
     biggest_disagreements = biggest_disagreements[:30]
 
+    generated = datetime.now()
     return {
         "leaderboard": leaderboard,
         "categories": categories,
@@ -484,7 +555,8 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
         "total_prompts": len(pids),
         "total_models": len(models),
         "judge_models": judge_models or [],
-        "generated": datetime.now().isoformat(),
+        "generated": generated.isoformat(),
+        "generated_display": generated.strftime("%b %d, %Y %H:%M"),
         "difficulties": difficulties,
         "prompt_results": prompt_results,
         "judge_global": judge_global,
@@ -499,19 +571,18 @@ def compute_stats(models, prompts, judge_models=None, composite_config=None, mod
     }
 
 
-def generate_html(stats):
-    """Generate the full HTML dashboard."""
-    data_json = json.dumps(stats)
+def _minify_css(css):
+    """Collapse whitespace in a stylesheet. Only safe for CSS without comments or
+    whitespace-sensitive strings, which holds for the page styles below."""
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([:{};,>])\s*", r"\1", css).strip()
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>BenchPress - LLM Evaluation Leaderboard</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-<style>
-  :root {{
+
+# Page stylesheets are static, so they are plain strings rather than part of
+# the f-string templates (no brace doubling, nothing to re-evaluate per build).
+# Each is minified once at import time.
+_DASHBOARD_CSS = _minify_css("""\
+  :root {
     --bg: #0f1117;
     --surface: #1a1d27;
     --surface2: #242836;
@@ -526,108 +597,108 @@ def generate_html(stats):
     --yellow: #eab308;
     --red: #ef4444;
     --orange: #f97316;
-  }}
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
     background: var(--bg);
     color: var(--text);
     line-height: 1.5;
     padding: 0;
-  }}
-  .header {{
+  }
+  .header {
     background: linear-gradient(135deg, #1a1d27 0%, #242836 100%);
     border-bottom: 1px solid var(--border);
     padding: 1.5rem 2.5rem;
-  }}
-  .header-inner {{
+  }
+  .header-inner {
     max-width: 1440px;
     margin: 0 auto;
-  }}
-  .header-top {{
+  }
+  .header-top {
     display: flex;
     justify-content: space-between;
     align-items: center;
     margin-bottom: 0.25rem;
-  }}
-  .header h1 {{
+  }
+  .header h1 {
     font-size: 1.5rem;
     font-weight: 700;
     letter-spacing: -0.02em;
     margin: 0;
-  }}
-  .header .byline {{
+  }
+  .header .byline {
     font-size: 0.85rem;
     color: var(--text2);
     margin: 0.2rem 0 0;
-  }}
-  .header .meta {{
+  }
+  .header .meta {
     font-size: 0.75rem;
     color: var(--text2);
     margin-top: 0.5rem;
-  }}
-  .container {{
+  }
+  .container {
     max-width: 1440px;
     margin: 0 auto;
     padding: 1.5rem 2.5rem 3rem;
-  }}
-  .kpi-row {{
+  }
+  .kpi-row {
     display: grid;
     grid-template-columns: repeat(4, 1fr);
     gap: 1rem;
     margin-bottom: 1.5rem;
-  }}
-  .kpi {{
+  }
+  .kpi {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.25rem;
-  }}
-  .kpi .label {{
+  }
+  .kpi .label {
     font-size: 0.75rem;
     color: var(--text2);
     text-transform: uppercase;
     letter-spacing: 0.05em;
     margin-bottom: 0.5rem;
-  }}
-  .kpi .value {{
+  }
+  .kpi .value {
     font-size: 1.8rem;
     font-weight: 700;
     font-variant-numeric: tabular-nums;
-  }}
-  .kpi .sub {{
+  }
+  .kpi .sub {
     font-size: 0.8rem;
     color: var(--text2);
     margin-top: 0.25rem;
-  }}
-  .grid-2 {{
+  }
+  .grid-2 {
     display: grid;
     grid-template-columns: 1fr 1fr;
     gap: 1.5rem;
     margin-bottom: 1.5rem;
     align-items: stretch;
-  }}
-  .grid-full {{
+  }
+  .grid-full {
     margin-bottom: 1.5rem;
-  }}
-  .card {{
+  }
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.5rem;
     display: flex;
     flex-direction: column;
-  }}
-  .card h2 {{
+  }
+  .card h2 {
     font-size: 1rem;
     font-weight: 600;
     margin-bottom: 1rem;
     color: var(--text);
-  }}
-  .card .chart-container {{
+  }
+  .card .chart-container {
     flex: 1;
-  }}
-  .info-tip {{
+  }
+  .info-tip {
     display: inline-block;
     position: relative;
     width: 16px;
@@ -642,8 +713,8 @@ def generate_html(stats):
     margin-left: 6px;
     cursor: default;
     vertical-align: middle;
-  }}
-  .info-tip:hover::after {{
+  }
+  .info-tip:hover::after {
     content: attr(data-info);
     position: absolute;
     top: 100%;
@@ -660,13 +731,13 @@ def generate_html(stats):
     z-index: 20;
     pointer-events: none;
     border: 1px solid var(--border);
-  }}
-  table {{
+  }
+  table {
     width: 100%;
     border-collapse: collapse;
     font-size: 0.85rem;
-  }}
-  th {{
+  }
+  th {
     text-align: left;
     padding: 0.6rem 0.75rem;
     border-bottom: 2px solid var(--border);
@@ -676,17 +747,17 @@ def generate_html(stats):
     text-transform: uppercase;
     letter-spacing: 0.04em;
     white-space: nowrap;
-  }}
-  th.num {{ text-align: right; }}
-  td {{
+  }
+  th.num { text-align: right; }
+  td {
     padding: 0.6rem 0.75rem;
     border-bottom: 1px solid var(--border);
     font-variant-numeric: tabular-nums;
-  }}
-  td.num {{ text-align: right; }}
-  tr:last-child td {{ border-bottom: none; }}
-  tr:hover td {{ background: var(--surface2); }}
-  .rank {{
+  }
+  td.num { text-align: right; }
+  tr:last-child td { border-bottom: none; }
+  tr:hover td { background: var(--surface2); }
+  .rank {
     width: 2rem;
     height: 2rem;
     display: inline-flex;
@@ -695,84 +766,84 @@ def generate_html(stats):
     border-radius: 6px;
     font-weight: 700;
     font-size: 0.8rem;
-  }}
-  .rank-1 {{ background: linear-gradient(135deg, #fbbf24, #f59e0b); color: #000; }}
-  .rank-2 {{ background: linear-gradient(135deg, #c0cfe0, #8da4bf); color: #1e293b; }}
-  .rank-3 {{ background: linear-gradient(135deg, #d97706, #b45309); color: #fff; }}
-  .rank-n {{ background: var(--surface2); color: var(--text2); }}
-  .score-bar {{
+  }
+  .rank-1 { background: linear-gradient(135deg, #fbbf24, #f59e0b); color: #000; }
+  .rank-2 { background: linear-gradient(135deg, #c0cfe0, #8da4bf); color: #1e293b; }
+  .rank-3 { background: linear-gradient(135deg, #d97706, #b45309); color: #fff; }
+  .rank-n { background: var(--surface2); color: var(--text2); }
+  .score-bar {
     display: flex;
     align-items: center;
     gap: 0.5rem;
-  }}
-  .score-bar .bar {{
+  }
+  .score-bar .bar {
     flex: 1;
     height: 8px;
     background: var(--surface2);
     border-radius: 4px;
     overflow: hidden;
-  }}
-  .score-bar .bar .fill {{
+  }
+  .score-bar .bar .fill {
     height: 100%;
     border-radius: 4px;
     transition: width 0.6s ease;
-  }}
-  .score-bar .val {{
+  }
+  .score-bar .val {
     font-weight: 700;
     min-width: 3rem;
     text-align: right;
-  }}
-  .badge {{
+  }
+  .badge {
     display: inline-block;
     padding: 0.15rem 0.5rem;
     border-radius: 4px;
     font-size: 0.75rem;
     font-weight: 600;
-  }}
-  .badge-error {{ background: rgba(239,68,68,0.15); color: var(--red); }}
-  .badge-flag {{ background: rgba(234,179,8,0.15); color: var(--yellow); }}
-  .badge-ok {{ background: rgba(34,197,94,0.15); color: var(--green); }}
-  .chart-container {{
+  }
+  .badge-error { background: rgba(239,68,68,0.15); color: var(--red); }
+  .badge-flag { background: rgba(234,179,8,0.15); color: var(--yellow); }
+  .badge-ok { background: rgba(34,197,94,0.15); color: var(--green); }
+  .chart-container {
     position: relative;
     width: 100%;
     min-height: 320px;
     height: 320px;
-  }}
-  .flags-list {{
+  }
+  .flags-list {
     max-height: 400px;
     overflow-y: auto;
-  }}
-  .flag-item {{
+  }
+  .flag-item {
     padding: 0.6rem 0;
     border-bottom: 1px solid var(--border);
-  }}
-  .flag-item:last-child {{ border-bottom: none; }}
-  .flag-id {{
+  }
+  .flag-item:last-child { border-bottom: none; }
+  .flag-id {
     font-weight: 600;
     color: var(--accent);
     font-size: 0.85rem;
-  }}
-  .flag-sub {{
+  }
+  .flag-sub {
     color: var(--text2);
     font-size: 0.8rem;
-  }}
-  .flag-models {{
+  }
+  .flag-models {
     margin-top: 0.3rem;
     font-size: 0.8rem;
     color: var(--text2);
-  }}
-  .flag-models span {{
+  }
+  .flag-models span {
     color: var(--yellow);
-  }}
-  .cat-table td.cat-name {{
+  }
+  .cat-table td.cat-name {
     font-weight: 600;
     text-transform: capitalize;
-  }}
-  td[data-tip] {{
+  }
+  td[data-tip] {
     position: relative;
     cursor: default;
-  }}
-  td[data-tip]:hover::after {{
+  }
+  td[data-tip]:hover::after {
     content: attr(data-tip);
     position: absolute;
     bottom: 100%;
@@ -788,17 +859,17 @@ def generate_html(stats):
     z-index: 10;
     pointer-events: none;
     border: 1px solid var(--border);
-  }}
-  .score-cell {{
+  }
+  .score-cell {
     font-weight: 600;
     font-variant-numeric: tabular-nums;
-  }}
-  .score-5 {{ color: var(--green); }}
-  .score-4 {{ color: var(--green-light); }}
-  .score-3 {{ color: var(--yellow); }}
-  .score-2 {{ color: var(--orange); }}
-  .score-1 {{ color: var(--red); }}
-  .company-dot {{
+  }
+  .score-5 { color: var(--green); }
+  .score-4 { color: var(--green-light); }
+  .score-3 { color: var(--yellow); }
+  .score-2 { color: var(--orange); }
+  .score-1 { color: var(--red); }
+  .company-dot {
     display: inline-block;
     width: 8px;
     height: 8px;
@@ -806,14 +877,14 @@ def generate_html(stats):
     margin-right: 6px;
     vertical-align: middle;
     flex-shrink: 0;
-  }}
-  .tabs {{
+  }
+  .tabs {
     display: flex;
     gap: 0.25rem;
     margin-bottom: 1rem;
     border-bottom: 1px solid var(--border);
-  }}
-  .tab {{
+  }
+  .tab {
     padding: 0.5rem 1rem;
     font-size: 0.85rem;
     font-weight: 500;
@@ -821,22 +892,22 @@ def generate_html(stats):
     cursor: pointer;
     border-bottom: 2px solid transparent;
     transition: all 0.2s;
-  }}
-  .tab:hover {{ color: var(--text); }}
-  .tab.active {{
+  }
+  .tab:hover { color: var(--text); }
+  .tab.active {
     color: var(--accent);
     border-bottom-color: var(--accent);
-  }}
-  .tab-content {{ display: none; }}
-  .tab-content.active {{ display: block; }}
-  .nav {{
+  }
+  .tab-content { display: none; }
+  .tab-content.active { display: block; }
+  .nav {
     display: flex;
     gap: 0.25rem;
     background: var(--surface2);
     border-radius: 8px;
     padding: 0.25rem;
-  }}
-  .nav-link {{
+  }
+  .nav-link {
     padding: 0.4rem 1rem;
     border-radius: 6px;
     font-size: 0.8rem;
@@ -844,10 +915,10 @@ def generate_html(stats):
     color: var(--text2);
     text-decoration: none;
     transition: all 0.2s;
-  }}
-  .nav-link:hover {{ color: var(--text); background: rgba(255,255,255,0.05); }}
-  .nav-link.active {{ color: var(--text); background: var(--accent); }}
-  .company-dot {{
+  }
+  .nav-link:hover { color: var(--text); background: rgba(255,255,255,0.05); }
+  .nav-link.active { color: var(--text); background: var(--accent); }
+  .company-dot {
     display: inline-block;
     width: 8px;
     height: 8px;
@@ -855,13 +926,13 @@ def generate_html(stats):
     margin-right: 6px;
     vertical-align: middle;
     flex-shrink: 0;
-  }}
-  .table-scroll {{
+  }
+  .table-scroll {
     overflow-x: auto;
     -webkit-overflow-scrolling: touch;
     position: relative;
-  }}
-  .table-scroll::after {{
+  }
+  .table-scroll::after {
     content: '';
     position: absolute;
     top: 0;
@@ -872,20 +943,20 @@ def generate_html(stats):
     background: linear-gradient(to left, var(--surface), transparent);
     opacity: 0;
     transition: opacity 0.2s;
-  }}
-  .table-scroll.has-overflow::after {{
+  }
+  .table-scroll.has-overflow::after {
     opacity: 1;
-  }}
-  th[data-sort] {{
+  }
+  th[data-sort] {
     cursor: pointer;
     user-select: none;
     position: relative;
     padding-right: 1.2rem;
-  }}
-  th[data-sort]:hover {{
+  }
+  th[data-sort]:hover {
     color: var(--text);
-  }}
-  th[data-sort]::after {{
+  }
+  th[data-sort]::after {
     content: '';
     position: absolute;
     right: 0.3rem;
@@ -895,30 +966,30 @@ def generate_html(stats):
     border-top-color: var(--text2);
     margin-top: 3px;
     opacity: 0.4;
-  }}
-  th[data-sort].asc::after {{
+  }
+  th[data-sort].asc::after {
     border-top-color: var(--accent);
     opacity: 1;
-  }}
-  th[data-sort].desc::after {{
+  }
+  th[data-sort].desc::after {
     border: 4px solid transparent;
     border-bottom-color: var(--accent);
     margin-top: -5px;
     opacity: 1;
-  }}
-  @media (max-width: 1100px) {{
-    .grid-2 {{ grid-template-columns: 1fr; }}
-  }}
-  @media (max-width: 900px) {{
-    .kpi-row {{ grid-template-columns: repeat(2, 1fr); }}
-    .container {{ padding: 1rem; }}
-    .header {{ padding: 1rem; }}
-    .header-top {{ flex-direction: column; align-items: flex-start; gap: 0.5rem; }}
-    .col-detail {{ display: none; }}
-    .show-all-cols .col-detail {{ display: table-cell; }}
-    .col-toggle {{ display: inline-block; }}
-  }}
-  .col-toggle {{
+  }
+  @media (max-width: 1100px) {
+    .grid-2 { grid-template-columns: 1fr; }
+  }
+  @media (max-width: 900px) {
+    .kpi-row { grid-template-columns: repeat(2, 1fr); }
+    .container { padding: 1rem; }
+    .header { padding: 1rem; }
+    .header-top { flex-direction: column; align-items: flex-start; gap: 0.5rem; }
+    .col-detail { display: none; }
+    .show-all-cols .col-detail { display: table-cell; }
+    .col-toggle { display: inline-block; }
+  }
+  .col-toggle {
     display: none;
     padding: 0.35rem 0.75rem;
     background: var(--surface2);
@@ -927,24 +998,78 @@ def generate_html(stats):
     border-radius: 6px;
     font-size: 0.75rem;
     cursor: pointer;
-  }}
-  .col-toggle:hover {{ color: var(--text); }}
-  @media (max-width: 600px) {{
-    .kpi-row {{ grid-template-columns: 1fr 1fr; gap: 0.75rem; }}
-    .kpi {{ padding: 1rem; }}
-    .kpi .value {{ font-size: 1.4rem; }}
-    .container {{ padding: 0.75rem; }}
-    .header {{ padding: 1rem 0.75rem; }}
-    .header h1 {{ font-size: 1.2rem; }}
-    .card {{ padding: 1rem; }}
-    .card h2 {{ font-size: 0.9rem; }}
-    table {{ font-size: 0.75rem; }}
-    th, td {{ padding: 0.4rem 0.5rem; }}
-    .score-bar .bar {{ display: none; }}
-    .score-bar {{ justify-content: flex-end; }}
-    .rank {{ width: 1.6rem; height: 1.6rem; font-size: 0.7rem; }}
-    .chart-container {{ height: 260px; }}
-  }}
+  }
+  .col-toggle:hover { color: var(--text); }
+  @media (max-width: 600px) {
+    .kpi-row { grid-template-columns: 1fr 1fr; gap: 0.75rem; }
+    .kpi { padding: 1rem; }
+    .kpi .value { font-size: 1.4rem; }
+    .container { padding: 0.75rem; }
+    .header { padding: 1rem 0.75rem; }
+    .header h1 { font-size: 1.2rem; }
+    .card { padding: 1rem; }
+    .card h2 { font-size: 0.9rem; }
+    table { font-size: 0.75rem; }
+    th, td { padding: 0.4rem 0.5rem; }
+    .score-bar .bar { display: none; }
+    .score-bar { justify-content: flex-end; }
+    .rank { width: 1.6rem; height: 1.6rem; font-size: 0.7rem; }
+    .chart-container { height: 260px; }
+  }""")
+
+
+DATA_FILE = "data.json"
+
+
+def _data_script(stats, compress=False, data_url=None, extra=None):
+    """Opening and closing JS that define the page's DATA constant from stats.
+
+    By default stats are inlined as a JSON literal. With compress, they're
+    embedded as base64 gzip and decoded with DecompressionStream, so the rest
+    of the page script runs inside an async wrapper once DATA is ready. With
+    data_url, stats are fetched from that shared JSON file instead, also
+    inside an async wrapper. extra holds page-only keys, always inlined.
+    """
+    if data_url:
+        start = f"(async () => {{\nconst DATA = await (await fetch({json.dumps(data_url)})).json();"
+        if extra:
+            start += f"\nObject.assign(DATA, {jsonio.dumps(extra)});"
+        return start, "})();\n"
+    data_json = jsonio.dumps({**stats, **extra} if extra else stats)
+    if not compress:
+        return f"const DATA = {data_json};", ""
+    blob = base64.b64encode(gzip.compress(data_json.encode())).decode()
+    start = (
+        "(async () => {\n"
+        f'const DATA = JSON.parse(await new Response(new Blob([Uint8Array.from(atob("{blob}"), c => c.charCodeAt(0))])'
+        ".stream().pipeThrough(new DecompressionStream('gzip'))).text());"
+    )
+    return start, "})();\n"
+
+
+def generate_html(stats, compress_data=False, data_url=None):
+    """Generate the full HTML dashboard."""
+    data_script_start, data_script_end = _data_script(stats, compress_data, data_url)
+    leaderboard = stats["leaderboard"]
+
+    # KPI totals in one sweep over the leaderboard
+    total_scored = total_flagged = 0
+    most_efficient = None
+    for m in leaderboard:
+        total_scored += m["scored"]
+        total_flagged += m["flagged"]
+        if most_efficient is None or m["efficiency"] > most_efficient["efficiency"]:
+            most_efficient = m
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>BenchPress - LLM Evaluation Leaderboard</title>
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
+<style>
+{_DASHBOARD_CSS}
 </style>
 </head>
 <body>
@@ -963,7 +1088,7 @@ def generate_html(stats):
       </nav>
     </div>
     <p class="byline">Opinionated in scope. Objective in execution.</p>
-    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {datetime.fromisoformat(stats['generated']).strftime('%b %d, %Y %H:%M')}</div>
+    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {stats['generated_display']}</div>
   </div>
 </div>
 
@@ -979,16 +1104,16 @@ def generate_html(stats):
   <div class="kpi">
     <div class="label">Models Evaluated</div>
     <div class="value">{stats['total_models']}</div>
-    <div class="sub">{sum(m['scored'] for m in stats['leaderboard'])} total scored responses</div>
+    <div class="sub">{total_scored} total scored responses</div>
   </div>
   <div class="kpi">
     <div class="label">Most Efficient</div>
-    <div class="value" style="color:var(--accent2)">{max((m['efficiency'] for m in stats['leaderboard']), default=0):.2f}</div>
-    <div class="sub">{max(stats['leaderboard'], key=lambda m: m['efficiency'])['name'] if stats['leaderboard'] else '-'}</div>
+    <div class="value" style="color:var(--accent2)">{most_efficient['efficiency'] if most_efficient else 0:.2f}</div>
+    <div class="sub">{most_efficient['name'] if most_efficient else '-'}</div>
   </div>
   <div class="kpi">
     <div class="label">Total Flags</div>
-    <div class="value">{sum(m['flagged'] for m in stats['leaderboard'])}</div>
+    <div class="value">{total_flagged}</div>
     <div class="sub">across all models</div>
   </div>
 </div>
@@ -1121,7 +1246,7 @@ def generate_html(stats):
 </div>
 
 <script>
-const DATA = {data_json};
+{data_script_start}
 const lb = DATA.leaderboard;
 const cats = DATA.categories;
 
@@ -1510,7 +1635,7 @@ function setParams(obj) {{
   }});
 }})();
 
-</script>
+{data_script_end}</script>
 
 </body>
 </html>"""
@@ -1545,18 +1670,15 @@ def _company_colors_js():
     return f"const COMPANY_COLORS = {{{pairs}, '_default': '{COMPANY_COLORS_DEFAULT}'}};\nfunction companyColor(name) {{ return COMPANY_COLORS[name] || COMPANY_COLORS['_default']; }}"
 
 
+# Lower bounds for score-2..score-5; a score equal to a bound takes the higher class
+_SCORE_THRESHOLDS = (1.5, 2.5, 3.5, 4.5)
+_SCORE_CLASSES = ("score-1", "score-2", "score-3", "score-4", "score-5")
+
+
 def _score_color(score):
     if score is None:
         return ""
-    if score >= 4.5:
-        return "score-5"
-    if score >= 3.5:
-        return "score-4"
-    if score >= 2.5:
-        return "score-3"
-    if score >= 1.5:
-        return "score-2"
-    return "score-1"
+    return _SCORE_CLASSES[bisect.bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def _deepeval_color(score):
@@ -1611,13 +1733,13 @@ def _judge_leniency_strip(stats):
     judge_global = stats.get("judge_global", {})
     if not judge_global:
         return ""
-    items = ""
+    items = []
     sorted_judges = sorted(judge_global.keys(), key=lambda j: judge_global[j], reverse=True)
     for jname in sorted_judges:
         avg = judge_global[jname]
         sc_color = _score_color(avg)
-        items += f'<span style="display:inline-flex;align-items:center;gap:0.4rem;padding:0.3rem 0.75rem;background:var(--surface);border:1px solid var(--border);border-radius:6px;font-size:0.8rem"><span style="color:var(--text2)">{html_mod.escape(jname)}:</span> <strong class="{sc_color}">{avg:.2f}/5</strong></span>'
-    return f'<div style="display:flex;flex-wrap:wrap;gap:0.5rem;margin-bottom:1rem;align-items:center"><span style="font-size:0.7rem;text-transform:uppercase;letter-spacing:0.05em;color:var(--text2);margin-right:0.25rem">Judge Averages</span>{items}</div>'
+        items.append(f'<span style="display:inline-flex;align-items:center;gap:0.4rem;padding:0.3rem 0.75rem;background:var(--surface);border:1px solid var(--border);border-radius:6px;font-size:0.8rem"><span style="color:var(--text2)">{html_mod.escape(jname)}:</span> <strong class="{sc_color}">{avg:.2f}/5</strong></span>')
+    return f'<div style="display:flex;flex-wrap:wrap;gap:0.5rem;margin-bottom:1rem;align-items:center"><span style="font-size:0.7rem;text-transform:uppercase;letter-spacing:0.05em;color:var(--text2);margin-right:0.25rem">Judge Averages</span>{"".join(items)}</div>'
 
 
 def _nav_html(active_page, stats):
@@ -1659,7 +1781,7 @@ def _deepeval_breakdown_card(leaderboard):
         return ""
 
     metric_names = {"correctness": "Correctness", "coherence": "Coherence", "instruction_following": "Instruction Following"}
-    rows = ""
+    rows = []
     sorted_lb = sorted(leaderboard, key=lambda m: m.get("deepeval_avg") or 0, reverse=True)
     for i, m in enumerate(sorted_lb):
         de_avg = m.get("deepeval_avg")
@@ -1667,22 +1789,23 @@ def _deepeval_breakdown_card(leaderboard):
         if de_avg is None:
             continue
 
-        cells = ""
+        cells = []
         for key in ["correctness", "coherence", "instruction_following"]:
             val = de_metrics.get(key)
             if val is not None:
                 color = _deepeval_color(val)
-                cells += f'<td class="num" style="font-weight:600;{color}">{val:.2f}</td>'
+                cells.append(f'<td class="num" style="font-weight:600;{color}">{val:.2f}</td>')
             else:
-                cells += '<td class="num" style="color:var(--text2)">-</td>'
+                cells.append('<td class="num" style="color:var(--text2)">-</td>')
 
         avg_color = _deepeval_color(de_avg)
-        cells += f'<td class="num" style="font-weight:700;{avg_color}">{de_avg:.2f}</td>'
+        cells.append(f'<td class="num" style="font-weight:700;{avg_color}">{de_avg:.2f}</td>')
 
-        rows += f'<tr><td style="font-weight:600">{m["name"]}</td>{cells}</tr>\n'
+        rows.append(f'<tr><td style="font-weight:600">{m["name"]}</td>{"".join(cells)}</tr>\n')
 
     if not rows:
         return ""
+    rows = "".join(rows)
 
     headers = "".join(f'<th class="num">{v}</th>' for v in metric_names.values())
 
@@ -1707,7 +1830,23 @@ def _deepeval_breakdown_card(leaderboard):
 </div>"""
 
 
+# Leaderboard fields a row renders; the row HTML is memoized on their values
+_LEADERBOARD_ROW_FIELDS = (
+    "name", "company", "composite_score", "avg_score", "deepeval_avg", "scored", "de_scored",
+    "total", "errors", "flagged", "avg_latency", "avg_tokens", "efficiency", "avg_divergence",
+    "judge_std_dev",
+)
+
+
 def _leaderboard_row(i, m):
+    fields = tuple((k, m[k]) for k in _LEADERBOARD_ROW_FIELDS if k in m)
+    return _leaderboard_row_html(i, fields, tuple(m.get("judge_averages", {}).items()))
+
+
+@functools.lru_cache(maxsize=256)
+def _leaderboard_row_html(i, fields, judge_averages):
+    m = dict(fields)
+    ja = dict(judge_averages)
     rank_cls = f"rank-{i+1}" if i < 3 else "rank-n"
     # Composite score (0-1 scale)
     comp_val = m.get("composite_score")
@@ -1753,19 +1892,19 @@ def _leaderboard_row(i, m):
         agree_color = "#eab308"
     else:
         agree_color = "#ef4444"
-    judge_count = len(m.get("judge_averages", {}))
+    judge_count = len(ja)
     agree_dot = f'<span style="display:inline-block;width:8px;height:8px;border-radius:50%;background:{agree_color};margin-left:4px;vertical-align:middle" title="Judge std dev: {jsd}"></span>' if judge_count > 0 else ''
 
     # Judge breakdown detail row with inline bar visualization
-    ja = m.get("judge_averages", {})
-    detail_bars = ""
+    detail_bars = []
     if ja:
         for jn, jv in ja.items():
             if jv is None:
                 continue
             bar_pct = (jv / 5) * 100
             bar_color = "#22c55e" if jv >= 4.5 else "#86efac" if jv >= 3.5 else "#eab308" if jv >= 2.5 else "#f97316" if jv >= 1.5 else "#ef4444"
-            detail_bars += f'<div style="display:flex;align-items:center;gap:0.5rem;margin-bottom:0.25rem"><span style="min-width:120px;font-size:0.75rem;color:var(--text2)">{jn}</span><div style="flex:1;max-width:200px;height:6px;background:var(--border);border-radius:3px;overflow:hidden"><div style="width:{bar_pct:.0f}%;height:100%;background:{bar_color};border-radius:3px"></div></div><span style="font-size:0.75rem;font-weight:600;color:{bar_color};min-width:3rem">{jv:.2f}/5</span></div>'
+            detail_bars.append(f'<div style="display:flex;align-items:center;gap:0.5rem;margin-bottom:0.25rem"><span style="min-width:120px;font-size:0.75rem;color:var(--text2)">{jn}</span><div style="flex:1;max-width:200px;height:6px;background:var(--border);border-radius:3px;overflow:hidden"><div style="width:{bar_pct:.0f}%;height:100%;background:{bar_color};border-radius:3px"></div></div><span style="font-size:0.75rem;font-weight:600;color:{bar_color};min-width:3rem">{jv:.2f}/5</span></div>')
+    detail_bars = "".join(detail_bars)
     # Chevron hint for expandable rows (shown next to judge score)
     chevron = '<span style="font-size:0.55rem;color:var(--text2);margin-left:3px;vertical-align:middle;transition:transform 0.2s" title="Click to see per-judge scores">&#9660;</span>' if detail_bars else ''
     detail_row = f'<tr class="judge-detail-row" data-parent="{safe_name}" style="display:none;background:var(--surface2)"><td></td><td colspan="13" style="padding:0.6rem 0.75rem"><div style="font-size:0.7rem;text-transform:uppercase;letter-spacing:0.05em;color:var(--text2);margin-bottom:0.4rem">Per-Judge Scores</div>{detail_bars}</td></tr>' if detail_bars else ''
@@ -1790,11 +1929,17 @@ def _leaderboard_row(i, m):
 
 
 def _category_row(cat, leaderboard):
-    cells = ""
-    for m in leaderboard:
-        comp = m.get("cat_composite", {}).get(cat)
-        s = m["cat_scores"].get(cat)
-        de = m.get("cat_deepeval", {}).get(cat)
+    scores = tuple(
+        (m.get("cat_composite", {}).get(cat), m["cat_scores"].get(cat), m.get("cat_deepeval", {}).get(cat))
+        for m in leaderboard
+    )
+    return _category_row_html(cat, scores)
+
+
+@functools.lru_cache(maxsize=256)
+def _category_row_html(cat, scores):
+    cells = []
+    for comp, s, de in scores:
         if comp is not None or s is not None:
             comp_color = _composite_color(comp)
             comp_str = f"{comp:.2f}" if comp is not None else "-"
@@ -1804,18 +1949,19 @@ def _category_row(cat, leaderboard):
             if de is not None:
                 tip_parts.append(f"DeepEval: {de:.2f}")
             tip = " | ".join(tip_parts)
-            cells += f'<td class="num" style="font-weight:600;{comp_color}" data-tip="{tip}">{comp_str}</td>'
+            cells.append(f'<td class="num" style="font-weight:600;{comp_color}" data-tip="{tip}">{comp_str}</td>')
         else:
-            cells += '<td class="num" style="color:var(--text2)">-</td>'
+            cells.append('<td class="num" style="color:var(--text2)">-</td>')
 
     display_cat = cat.replace("_", " ")
-    return f'<tr><td class="cat-name">{display_cat}</td>{cells}</tr>'
+    return f'<tr><td class="cat-name">{display_cat}</td>{"".join(cells)}</tr>'
 
 
 def _flag_item(flag):
-    models_html = ""
-    for name, flags in flag["models"].items():
-        models_html += f'<div class="flag-models">{name}: <span>{", ".join(flags)}</span></div>'
+    models_html = "".join(
+        f'<div class="flag-models">{name}: <span>{", ".join(flags)}</span></div>'
+        for name, flags in flag["models"].items()
+    )
     return f"""<div class="flag-item">
       <span class="flag-id">{flag['id']}</span>
       <span class="flag-sub"> - {flag['subcategory']}</span>
@@ -1823,51 +1969,8 @@ def _flag_item(flag):
     </div>"""
 
 
-def generate_categories_html(stats):
-    """Generate the categories detail page."""
-    data_json = json.dumps(stats)
-    categories = stats["categories"]
-
-    # Build winner cards
-    winner_cards = ""
-    for cat in categories:
-        best = None
-        best_score = 0
-        best_company = "Unknown"
-        for m in stats["leaderboard"]:
-            s = m.get("cat_composite", {}).get(cat)
-            if s is not None and s > best_score:
-                best_score = s
-                best = m["name"]
-                best_company = m.get("company", "Unknown")
-        display_cat = cat.replace("_", " ").title()
-        winner_clr = _company_color(best_company)
-        winner_cards += f"""<div class="winner-card">
-          <div class="winner-cat">{display_cat}</div>
-          <div class="winner-name" style="color:{winner_clr}">{best or '-'}</div>
-          <div class="winner-score">{best_score:.2f}</div>
-        </div>\n"""
-
-    # Build chart canvases
-    chart_sections = ""
-    for cat in categories:
-        display_cat = cat.replace("_", " ").title()
-        chart_sections += f"""<div class="card">
-      <h2>{display_cat}</h2>
-      <div class="chart-container-wide">
-        <canvas id="chart-{cat}"></canvas>
-      </div>
-    </div>\n"""
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>BenchPress - By Category</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-<style>
-  :root {{
+_CATEGORIES_CSS = _minify_css("""\
+  :root {
     --bg: #0f1117;
     --surface: #1a1d27;
     --surface2: #242836;
@@ -1881,40 +1984,40 @@ def generate_categories_html(stats):
     --yellow: #eab308;
     --red: #ef4444;
     --orange: #f97316;
-  }}
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
     background: var(--bg);
     color: var(--text);
     line-height: 1.5;
-  }}
-  .header {{
+  }
+  .header {
     background: linear-gradient(135deg, #1a1d27 0%, #242836 100%);
     border-bottom: 1px solid var(--border);
     padding: 1.5rem 2.5rem;
-  }}
-  .header-inner {{
+  }
+  .header-inner {
     max-width: 1440px;
     margin: 0 auto;
-  }}
-  .header-top {{
+  }
+  .header-top {
     display: flex;
     justify-content: space-between;
     align-items: center;
     margin-bottom: 0.25rem;
-  }}
-  .header h1 {{ font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }}
-  .header .byline {{ font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }}
-  .header .meta {{ font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }}
-  .nav {{
+  }
+  .header h1 { font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }
+  .header .byline { font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }
+  .header .meta { font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }
+  .nav {
     display: flex;
     gap: 0.25rem;
     background: var(--surface2);
     border-radius: 8px;
     padding: 0.25rem;
-  }}
-  .nav-link {{
+  }
+  .nav-link {
     padding: 0.4rem 1rem;
     border-radius: 6px;
     font-size: 0.8rem;
@@ -1922,72 +2025,72 @@ def generate_categories_html(stats):
     color: var(--text2);
     text-decoration: none;
     transition: all 0.2s;
-  }}
-  .nav-link:hover {{ color: var(--text); background: rgba(255,255,255,0.05); }}
-  .nav-link.active {{ color: var(--text); background: var(--accent); }}
-  .container {{
+  }
+  .nav-link:hover { color: var(--text); background: rgba(255,255,255,0.05); }
+  .nav-link.active { color: var(--text); background: var(--accent); }
+  .container {
     max-width: 1440px;
     margin: 0 auto;
     padding: 1.5rem 2.5rem 3rem;
-  }}
-  .winners {{
+  }
+  .winners {
     display: grid;
     grid-template-columns: repeat(4, 1fr);
     gap: 1rem;
     margin-bottom: 1.5rem;
-  }}
-  .winner-card {{
+  }
+  .winner-card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1rem;
     text-align: center;
-  }}
-  .winner-cat {{
+  }
+  .winner-cat {
     font-size: 0.7rem;
     color: var(--text2);
     text-transform: uppercase;
     letter-spacing: 0.05em;
     margin-bottom: 0.4rem;
-  }}
-  .winner-name {{
+  }
+  .winner-name {
     font-size: 1rem;
     font-weight: 700;
     color: var(--accent);
     margin-bottom: 0.2rem;
-  }}
-  .winner-score {{
+  }
+  .winner-score {
     font-size: 0.85rem;
     color: var(--green);
     font-weight: 600;
-  }}
-  .chart-grid {{
+  }
+  .chart-grid {
     display: grid;
     grid-template-columns: 1fr 1fr;
     gap: 1.5rem;
     margin-bottom: 1.5rem;
-  }}
-  .card {{
+  }
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.5rem;
-  }}
-  .card h2 {{
+  }
+  .card h2 {
     font-size: 1rem;
     font-weight: 600;
     margin-bottom: 1rem;
-  }}
-  .chart-container-wide {{
+  }
+  .chart-container-wide {
     position: relative;
     width: 100%;
     height: 300px;
-  }}
-  td[data-tip] {{
+  }
+  td[data-tip] {
     position: relative;
     cursor: default;
-  }}
-  td[data-tip]:hover::after {{
+  }
+  td[data-tip]:hover::after {
     content: attr(data-tip);
     position: absolute;
     bottom: 100%;
@@ -2003,26 +2106,99 @@ def generate_categories_html(stats):
     z-index: 10;
     pointer-events: none;
     border: 1px solid var(--border);
-  }}
-  @media (max-width: 1100px) {{
-    .chart-grid {{ grid-template-columns: 1fr; }}
-    .winners {{ grid-template-columns: repeat(2, 1fr); }}
-  }}
-  @media (max-width: 900px) {{
-    .header {{ padding: 1rem; }}
-    .header-top {{ flex-direction: column; align-items: flex-start; gap: 0.5rem; }}
-    .container {{ padding: 1rem; }}
-  }}
-  @media (max-width: 600px) {{
-    .winners {{ grid-template-columns: 1fr 1fr; gap: 0.75rem; }}
-    .winner-card {{ padding: 0.75rem; }}
-    .container {{ padding: 0.75rem; }}
-    .header {{ padding: 1rem 0.75rem; }}
-    .header h1 {{ font-size: 1.2rem; }}
-    .card {{ padding: 1rem; }}
-    .card h2 {{ font-size: 0.9rem; }}
-    .chart-container-wide {{ height: 250px; }}
-  }}
+  }
+  @media (max-width: 1100px) {
+    .chart-grid { grid-template-columns: 1fr; }
+    .winners { grid-template-columns: repeat(2, 1fr); }
+  }
+  @media (max-width: 900px) {
+    .header { padding: 1rem; }
+    .header-top { flex-direction: column; align-items: flex-start; gap: 0.5rem; }
+    .container { padding: 1rem; }
+  }
+  @media (max-width: 600px) {
+    .winners { grid-template-columns: 1fr 1fr; gap: 0.75rem; }
+    .winner-card { padding: 0.75rem; }
+    .container { padding: 0.75rem; }
+    .header { padding: 1rem 0.75rem; }
+    .header h1 { font-size: 1.2rem; }
+    .card { padding: 1rem; }
+    .card h2 { font-size: 0.9rem; }
+    .chart-container-wide { height: 250px; }
+  }""")
+
+
+# Composite chart bands, matching compositeColor() in the page scripts
+_COMPOSITE_THRESHOLDS = (0.70, 0.80, 0.85, 0.90, 0.95)
+_COMPOSITE_HEX = ("#ef4444", "#f97316", "#eab308", "#86efac", "#4ade80", "#22c55e")
+
+
+def _composite_hex(score):
+    return _COMPOSITE_HEX[bisect.bisect_right(_COMPOSITE_THRESHOLDS, score)]
+
+
+def _category_chart_entries(leaderboard, categories):
+    """Per-category chart bars: models with a composite score, best first,
+    each with its bar colour."""
+    entries = {}
+    for cat in categories:
+        scored = [
+            {"name": m["name"], "score": score, "color": _composite_hex(score)}
+            for m in leaderboard
+            if (score := m.get("cat_composite", {}).get(cat)) is not None
+        ]
+        scored.sort(key=lambda e: -e["score"])
+        entries[cat] = scored
+    return entries
+
+
+def generate_categories_html(stats, compress_data=False, data_url=None):
+    """Generate the categories detail page."""
+    categories = stats["categories"]
+    cat_entries = _category_chart_entries(stats["leaderboard"], categories)
+    data_script_start, data_script_end = _data_script(stats, compress_data, data_url, {"cat_entries": cat_entries})
+
+    # Build winner cards
+    winner_cards = []
+    for cat in categories:
+        best = None
+        best_score = 0
+        best_company = "Unknown"
+        for m in stats["leaderboard"]:
+            s = m.get("cat_composite", {}).get(cat)
+            if s is not None and s > best_score:
+                best_score = s
+                best = m["name"]
+                best_company = m.get("company", "Unknown")
+        display_cat = cat.replace("_", " ").title()
+        winner_clr = _company_color(best_company)
+        winner_cards.append(f"""<div class="winner-card">
+          <div class="winner-cat">{display_cat}</div>
+          <div class="winner-name" style="color:{winner_clr}">{best or '-'}</div>
+          <div class="winner-score">{best_score:.2f}</div>
+        </div>\n""")
+    winner_cards = "".join(winner_cards)
+
+    # Build chart canvases
+    chart_sections = "".join(
+        f"""<div class="card">
+      <h2>{cat.replace("_", " ").title()}</h2>
+      <div class="chart-container-wide">
+        <canvas id="chart-{cat}" data-cat="{cat}"></canvas>
+      </div>
+    </div>\n"""
+        for cat in categories
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>BenchPress - By Category</title>
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
+<style>
+{_CATEGORIES_CSS}
 </style>
 </head>
 <body>
@@ -2041,7 +2217,7 @@ def generate_categories_html(stats):
       </nav>
     </div>
     <p class="byline">Opinionated in scope. Objective in execution.</p>
-    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {datetime.fromisoformat(stats['generated']).strftime('%b %d, %Y %H:%M')}</div>
+    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {stats['generated_display']}</div>
   </div>
 </div>
 
@@ -2060,47 +2236,27 @@ def generate_categories_html(stats):
 </div>
 
 <script>
-const DATA = {data_json};
-const lb = DATA.leaderboard;
-const cats = DATA.categories;
-
+{data_script_start}
 const COLORS = [
   '#6c72ff', '#4ecdc4', '#f97316', '#22c55e', '#ec4899',
   '#eab308', '#8b5cf6', '#06b6d4', '#ef4444', '#84cc16',
   '#f59e0b', '#14b8a6'
 ];
 
-function compositeColor(s) {{
-  if (s >= 0.95) return '#22c55e';
-  if (s >= 0.90) return '#4ade80';
-  if (s >= 0.85) return '#86efac';
-  if (s >= 0.80) return '#eab308';
-  if (s >= 0.70) return '#f97316';
-  return '#ef4444';
-}}
-
 Chart.defaults.color = '#8b90a5';
 Chart.defaults.borderColor = '#2e3345';
 Chart.defaults.font.family = "'Inter', sans-serif";
 
-cats.forEach(cat => {{
-  // Get models with composite scores for this category, sorted descending
-  const entries = lb
-    .filter(m => m.cat_composite && m.cat_composite[cat] != null)
-    .map(m => ({{ name: m.name, score: m.cat_composite[cat] }}))
-    .sort((a, b) => b.score - a.score);
-
-  const canvas = document.getElementById('chart-' + cat);
-  if (!canvas) return;
-
+function renderChart(canvas) {{
+  const entries = DATA.cat_entries[canvas.dataset.cat];
   new Chart(canvas, {{
     type: 'bar',
     data: {{
       labels: entries.map(e => e.name),
       datasets: [{{
         data: entries.map(e => e.score),
-        backgroundColor: entries.map(e => compositeColor(e.score) + 'cc'),
-        borderColor: entries.map(e => compositeColor(e.score)),
+        backgroundColor: entries.map(e => e.color + 'cc'),
+        borderColor: entries.map(e => e.color),
         borderWidth: 1,
         borderRadius: 4,
       }}]
@@ -2116,81 +2272,30 @@ cats.forEach(cat => {{
       }}
     }}
   }});
-}});
-</script>
+}}
+
+// Build each chart only once it scrolls near the viewport
+const chartCanvases = document.querySelectorAll('canvas[data-cat]');
+if ('IntersectionObserver' in window) {{
+  const io = new IntersectionObserver((seen, observer) => {{
+    seen.forEach(e => {{
+      if (!e.isIntersecting) return;
+      observer.unobserve(e.target);
+      renderChart(e.target);
+    }});
+  }}, {{ rootMargin: '200px' }});
+  chartCanvases.forEach(c => io.observe(c));
+}} else {{
+  chartCanvases.forEach(renderChart);
+}}
+{data_script_end}</script>
 
 </body>
 </html>"""
 
 
-def generate_companies_html(stats):
-    """Generate the companies analytics page."""
-    data_json = json.dumps(stats)
-
-    # Build per-company model tables (server-side)
-    company_models = {}
-    for m in stats["leaderboard"]:
-        c = m.get("company", "Unknown")
-        company_models.setdefault(c, []).append(m)
-
-    company_sections = ""
-    for company in sorted(company_models):
-        models = sorted(company_models[company], key=lambda x: x.get("composite_score") or 0, reverse=True)
-        best = models[0]
-        best_comp = best.get("composite_score")
-        best_str = f"{best_comp:.2f}" if best_comp is not None else "-"
-
-        rows = ""
-        for m in models:
-            comp = m.get("composite_score")
-            comp_str = f"{comp:.2f}" if comp is not None else "-"
-            comp_color = _composite_color(comp)
-            de_val = m.get("deepeval_avg")
-            de_str = f"{de_val:.2f}" if de_val is not None else "-"
-            de_color = _deepeval_color(de_val)
-            sc_color = _score_color(m["avg_score"])
-            eff_color = _efficiency_color(m["efficiency"])
-            rows += f"""<tr>
-              <td style="font-weight:600">{m['name']}</td>
-              <td class="num" style="font-weight:700;{comp_color}">{comp_str}</td>
-              <td class="num {sc_color}" style="font-weight:600">{m['avg_score']:.2f}/5</td>
-              <td class="num" style="font-weight:600;{de_color}">{de_str}</td>
-              <td class="num">{m['avg_latency']:.1f}s</td>
-              <td class="num" style="font-weight:600;{eff_color}">{m['efficiency']:.2f}</td>
-            </tr>\n"""
-
-        c_clr = _company_color(company)
-        company_sections += f"""<details class="company-section" style="border-left:3px solid {c_clr}">
-      <summary class="company-toggle">{html_mod.escape(company)} <span class="company-count">({len(models)} model{"s" if len(models) != 1 else ""}) - best: {best_str}</span></summary>
-      <div class="table-scroll">
-        <table>
-          <thead>
-            <tr>
-              <th>Model</th>
-              <th class="num">Composite</th>
-              <th class="num">Judge</th>
-              <th class="num">DeepEval</th>
-              <th class="num">Avg Latency</th>
-              <th class="num">Efficiency</th>
-            </tr>
-          </thead>
-          <tbody>
-            {rows}
-          </tbody>
-        </table>
-      </div>
-    </details>\n"""
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>BenchPress - Companies</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-<script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3"></script>
-<style>
-  :root {{
+_COMPANIES_CSS = _minify_css("""\
+  :root {
     --bg: #0f1117;
     --surface: #1a1d27;
     --surface2: #242836;
@@ -2205,40 +2310,40 @@ def generate_companies_html(stats):
     --yellow: #eab308;
     --red: #ef4444;
     --orange: #f97316;
-  }}
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
     background: var(--bg);
     color: var(--text);
     line-height: 1.5;
-  }}
-  .header {{
+  }
+  .header {
     background: linear-gradient(135deg, #1a1d27 0%, #242836 100%);
     border-bottom: 1px solid var(--border);
     padding: 1.5rem 2.5rem;
-  }}
-  .header-inner {{
+  }
+  .header-inner {
     max-width: 1440px;
     margin: 0 auto;
-  }}
-  .header-top {{
+  }
+  .header-top {
     display: flex;
     justify-content: space-between;
     align-items: center;
     margin-bottom: 0.25rem;
-  }}
-  .header h1 {{ font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }}
-  .header .byline {{ font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }}
-  .header .meta {{ font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }}
-  .nav {{
+  }
+  .header h1 { font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }
+  .header .byline { font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }
+  .header .meta { font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }
+  .nav {
     display: flex;
     gap: 0.25rem;
     background: var(--surface2);
     border-radius: 8px;
     padding: 0.25rem;
-  }}
-  .nav-link {{
+  }
+  .nav-link {
     padding: 0.4rem 1rem;
     border-radius: 6px;
     font-size: 0.8rem;
@@ -2246,34 +2351,34 @@ def generate_companies_html(stats):
     color: var(--text2);
     text-decoration: none;
     transition: all 0.2s;
-  }}
-  .nav-link:hover {{ color: var(--text); background: rgba(255,255,255,0.05); }}
-  .nav-link.active {{ color: var(--text); background: var(--accent); }}
-  .container {{
+  }
+  .nav-link:hover { color: var(--text); background: rgba(255,255,255,0.05); }
+  .nav-link.active { color: var(--text); background: var(--accent); }
+  .container {
     max-width: 1440px;
     margin: 0 auto;
     padding: 1.5rem 2.5rem 3rem;
-  }}
-  .company-cards {{
+  }
+  .company-cards {
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(180px, 1fr));
     gap: 0.6rem;
     margin-bottom: 1.5rem;
-  }}
-  .company-card {{
+  }
+  .company-card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 8px;
     padding: 0.75rem 0.9rem;
-  }}
-  .company-card .company-name {{
+  }
+  .company-card .company-name {
     font-size: 0.65rem;
     color: var(--text2);
     text-transform: uppercase;
     letter-spacing: 0.05em;
     margin-bottom: 0.25rem;
-  }}
-  .company-card .best-model {{
+  }
+  .company-card .best-model {
     font-size: 0.85rem;
     font-weight: 700;
     color: var(--accent);
@@ -2281,38 +2386,38 @@ def generate_companies_html(stats):
     white-space: nowrap;
     overflow: hidden;
     text-overflow: ellipsis;
-  }}
-  .company-card .best-score {{
+  }
+  .company-card .best-score {
     font-size: 1.15rem;
     font-weight: 700;
     font-variant-numeric: tabular-nums;
-  }}
-  .company-card .model-count {{
+  }
+  .company-card .model-count {
     font-size: 0.7rem;
     color: var(--text2);
     margin-top: 0.15rem;
-  }}
-  .grid-full {{
+  }
+  .grid-full {
     margin-bottom: 1.5rem;
-  }}
-  .card {{
+  }
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.5rem;
-  }}
-  .card h2 {{
+  }
+  .card h2 {
     font-size: 1rem;
     font-weight: 600;
     margin-bottom: 1rem;
-  }}
-  .chart-container {{
+  }
+  .chart-container {
     position: relative;
     width: 100%;
     min-height: 320px;
     height: 320px;
-  }}
-  .info-tip {{
+  }
+  .info-tip {
     display: inline-block;
     position: relative;
     width: 16px;
@@ -2327,8 +2432,8 @@ def generate_companies_html(stats):
     margin-left: 6px;
     cursor: default;
     vertical-align: middle;
-  }}
-  .info-tip:hover::after {{
+  }
+  .info-tip:hover::after {
     content: attr(data-info);
     position: absolute;
     top: 100%;
@@ -2345,17 +2450,17 @@ def generate_companies_html(stats):
     z-index: 20;
     pointer-events: none;
     border: 1px solid var(--border);
-  }}
-  .table-scroll {{
+  }
+  .table-scroll {
     overflow-x: auto;
     -webkit-overflow-scrolling: touch;
-  }}
-  table {{
+  }
+  table {
     width: 100%;
     border-collapse: collapse;
     font-size: 0.85rem;
-  }}
-  th {{
+  }
+  th {
     text-align: left;
     padding: 0.6rem 0.75rem;
     border-bottom: 2px solid var(--border);
@@ -2365,31 +2470,31 @@ def generate_companies_html(stats):
     text-transform: uppercase;
     letter-spacing: 0.04em;
     white-space: nowrap;
-  }}
-  th.num {{ text-align: right; }}
-  td {{
+  }
+  th.num { text-align: right; }
+  td {
     padding: 0.6rem 0.75rem;
     border-bottom: 1px solid var(--border);
     font-variant-numeric: tabular-nums;
-  }}
-  td.num {{ text-align: right; }}
-  tr:last-child td {{ border-bottom: none; }}
-  tr:hover td {{ background: var(--surface2); }}
-  .heatmap-cell {{
+  }
+  td.num { text-align: right; }
+  tr:last-child td { border-bottom: none; }
+  tr:hover td { background: var(--surface2); }
+  .heatmap-cell {
     text-align: center;
     font-weight: 600;
     font-variant-numeric: tabular-nums;
     padding: 0.5rem;
     border-radius: 4px;
-  }}
-  .company-section {{
+  }
+  .company-section {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     margin-bottom: 1rem;
     overflow: hidden;
-  }}
-  .company-toggle {{
+  }
+  .company-toggle {
     padding: 1rem 1.5rem;
     cursor: pointer;
     font-weight: 600;
@@ -2398,48 +2503,118 @@ def generate_companies_html(stats):
     display: flex;
     align-items: center;
     gap: 0.5rem;
-  }}
-  .company-toggle::-webkit-details-marker {{ display: none; }}
-  .company-toggle::before {{
+  }
+  .company-toggle::-webkit-details-marker { display: none; }
+  .company-toggle::before {
     content: '\\25B6';
     font-size: 0.7rem;
     color: var(--text2);
     transition: transform 0.2s;
-  }}
-  details.company-section[open] .company-toggle::before {{
+  }
+  details.company-section[open] .company-toggle::before {
     transform: rotate(90deg);
-  }}
-  .company-count {{
+  }
+  .company-count {
     font-weight: 400;
     color: var(--text2);
     font-size: 0.85rem;
-  }}
-  .company-section .table-scroll {{
+  }
+  .company-section .table-scroll {
     padding: 0 1.5rem 1rem;
-  }}
-  .score-cell {{
+  }
+  .score-cell {
     font-weight: 600;
     font-variant-numeric: tabular-nums;
-  }}
-  .score-5 {{ color: var(--green); }}
-  .score-4 {{ color: var(--green-light); }}
-  .score-3 {{ color: var(--yellow); }}
-  .score-2 {{ color: var(--orange); }}
-  .score-1 {{ color: var(--red); }}
-  @media (max-width: 900px) {{
-    .header {{ padding: 1rem; }}
-    .header-top {{ flex-direction: column; align-items: flex-start; gap: 0.5rem; }}
-    .container {{ padding: 1rem; }}
-  }}
-  @media (max-width: 600px) {{
-    .company-cards {{ grid-template-columns: 1fr 1fr; gap: 0.5rem; }}
-    .container {{ padding: 0.75rem; }}
-    .header {{ padding: 1rem 0.75rem; }}
-    .header h1 {{ font-size: 1.2rem; }}
-    .card {{ padding: 1rem; }}
-    .card h2 {{ font-size: 0.9rem; }}
-    .chart-container {{ height: 260px; }}
-  }}
+  }
+  .score-5 { color: var(--green); }
+  .score-4 { color: var(--green-light); }
+  .score-3 { color: var(--yellow); }
+  .score-2 { color: var(--orange); }
+  .score-1 { color: var(--red); }
+  @media (max-width: 900px) {
+    .header { padding: 1rem; }
+    .header-top { flex-direction: column; align-items: flex-start; gap: 0.5rem; }
+    .container { padding: 1rem; }
+  }
+  @media (max-width: 600px) {
+    .company-cards { grid-template-columns: 1fr 1fr; gap: 0.5rem; }
+    .container { padding: 0.75rem; }
+    .header { padding: 1rem 0.75rem; }
+    .header h1 { font-size: 1.2rem; }
+    .card { padding: 1rem; }
+    .card h2 { font-size: 0.9rem; }
+    .chart-container { height: 260px; }
+  }""")
+
+
+def generate_companies_html(stats, compress_data=False, data_url=None):
+    """Generate the companies analytics page."""
+    data_script_start, data_script_end = _data_script(stats, compress_data, data_url)
+
+    # Build per-company model tables (server-side)
+    company_models = {}
+    for m in stats["leaderboard"]:
+        c = m.get("company", "Unknown")
+        company_models.setdefault(c, []).append(m)
+
+    company_sections = ""
+    for company in sorted(company_models):
+        models = sorted(company_models[company], key=lambda x: x.get("composite_score") or 0, reverse=True)
+        best = models[0]
+        best_comp = best.get("composite_score")
+        best_str = f"{best_comp:.2f}" if best_comp is not None else "-"
+
+        rows = ""
+        for m in models:
+            comp = m.get("composite_score")
+            comp_str = f"{comp:.2f}" if comp is not None else "-"
+            comp_color = _composite_color(comp)
+            de_val = m.get("deepeval_avg")
+            de_str = f"{de_val:.2f}" if de_val is not None else "-"
+            de_color = _deepeval_color(de_val)
+            sc_color = _score_color(m["avg_score"])
+            eff_color = _efficiency_color(m["efficiency"])
+            rows += f"""<tr>
+              <td style="font-weight:600">{m['name']}</td>
+              <td class="num" style="font-weight:700;{comp_color}">{comp_str}</td>
+              <td class="num {sc_color}" style="font-weight:600">{m['avg_score']:.2f}/5</td>
+              <td class="num" style="font-weight:600;{de_color}">{de_str}</td>
+              <td class="num">{m['avg_latency']:.1f}s</td>
+              <td class="num" style="font-weight:600;{eff_color}">{m['efficiency']:.2f}</td>
+            </tr>\n"""
+
+        c_clr = _company_color(company)
+        company_sections += f"""<details class="company-section" style="border-left:3px solid {c_clr}">
+      <summary class="company-toggle">{html_mod.escape(company)} <span class="company-count">({len(models)} model{"s" if len(models) != 1 else ""}) - best: {best_str}</span></summary>
+      <div class="table-scroll">
+        <table>
+          <thead>
+            <tr>
+              <th>Model</th>
+              <th class="num">Composite</th>
+              <th class="num">Judge</th>
+              <th class="num">DeepEval</th>
+              <th class="num">Avg Latency</th>
+              <th class="num">Efficiency</th>
+            </tr>
+          </thead>
+          <tbody>
+            {rows}
+          </tbody>
+        </table>
+      </div>
+    </details>\n"""
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>BenchPress - Companies</title>
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
+<script src="https://cdn.jsdelivr.net/npm/chartjs-adapter-date-fns@3"></script>
+<style>
+{_COMPANIES_CSS}
 </style>
 </head>
 <body>
@@ -2458,7 +2633,7 @@ def generate_companies_html(stats):
       </nav>
     </div>
     <p class="byline">Opinionated in scope. Objective in execution.</p>
-    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {datetime.fromisoformat(stats['generated']).strftime('%b %d, %Y %H:%M')}</div>
+    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {stats['generated_display']}</div>
   </div>
 </div>
 
@@ -2506,7 +2681,7 @@ def generate_companies_html(stats):
 </div>
 
 <script>
-const DATA = {data_json};
+{data_script_start}
 const lb = DATA.leaderboard;
 const cats = DATA.categories;
 
@@ -2754,114 +2929,14 @@ lb.forEach(m => {{
 
   table.innerHTML = headerHtml + bodyHtml;
 }})();
-</script>
+{data_script_end}</script>
 
 </body>
 </html>"""
 
 
-def generate_methodology_html(stats):
-    """Generate the methodology and focus page."""
-    prompts = load_prompts()
-
-    # Compute category/difficulty/check_type breakdowns
-    cats = Counter(p["category"] for p in prompts)
-    diffs = Counter(p["difficulty"] for p in prompts)
-    checks = Counter(p["check_type"] for p in prompts)
-
-    category_descriptions = {
-        "coding": "Bug detection (including trap prompts with no bug), code generation, debugging, architecture design, security review, refactoring, concurrency, ML implementation, and cross-language tasks. Medium to hard difficulty.",
-        "learning": "Technical explanations, factual accuracy, nuanced comparisons, calibration, and trap questions testing common misconceptions. Tests depth of understanding vs surface-level answers.",
-        "reasoning": "Fermi estimation, logic puzzles, statistical analysis, ethical tradeoffs, causal reasoning, and false premise detection. Tests whether models show their work and catch tricks.",
-        "behavioural": "Sycophancy resistance, hallucination detection, appropriate refusal, verbosity control, and unsolicited opinion avoidance. Tests character and safety alignment.",
-        "writing": "Technical writing, tone switching, anti-slop detection, constrained writing, editing, email drafting, and argumentation. Tests natural voice and format compliance.",
-        "instruction_following": "Exact format compliance, multi-constraint tasks, conflicting instructions, creative constraints, and ambiguity handling. Tests literal instruction adherence.",
-        "research": "Source synthesis, contradictory evidence handling, technical evaluation, and summarization fidelity. Tests analytical depth over breadth.",
-        "meta": "Self-knowledge, calibration, honesty under pressure, and uncertainty expression. Tests whether models know what they don't know.",
-    }
-
-    cat_rows = ""
-    for cat in sorted(cats):
-        display = cat.replace("_", " ").title()
-        subcats = sorted(set(p["subcategory"].replace("_", " ") for p in prompts if p["category"] == cat))
-        sub_str = ", ".join(subcats)
-        desc = category_descriptions.get(cat, "")
-        cat_rows += f"""<tr>
-          <td style="font-weight:600;text-transform:capitalize">{display}</td>
-          <td class="num">{cats[cat]}</td>
-          <td style="color:var(--text2);font-size:0.8rem">{sub_str}</td>
-          <td style="color:var(--text2);font-size:0.8rem">{desc}</td>
-        </tr>\n"""
-
-    diff_rows = ""
-    for d in ["easy", "medium", "hard"]:
-        if d in diffs:
-            diff_rows += f'<tr><td style="font-weight:600;text-transform:capitalize">{d}</td><td class="num">{diffs[d]}</td></tr>\n'
-
-    # Group check types into categories
-    automated_checks = []
-    judge_only_checks = []
-    noop_types = {"calibration", "reasoning", "format_check", "checklist", "analysis", "synthesis", "comparison", "behavioural"}
-    for ct in sorted(checks):
-        display = ct.replace("_", " ")
-        if ct in noop_types:
-            judge_only_checks.append((display, checks[ct]))
-        else:
-            automated_checks.append((display, checks[ct]))
-
-    auto_rows = "".join(
-        f'<tr><td>{name}</td><td class="num">{count}</td></tr>\n'
-        for name, count in automated_checks
-    )
-    judge_rows = "".join(
-        f'<tr><td>{name}</td><td class="num">{count}</td></tr>\n'
-        for name, count in judge_only_checks
-    )
-
-    # Build questions section grouped by category
-    diff_colors = {"easy": "var(--green)", "medium": "var(--yellow)", "hard": "var(--red)"}
-    questions_sections = ""
-    for cat in sorted(cats):
-        display_cat = cat.replace("_", " ").title()
-        cat_prompts = [p for p in prompts if p["category"] == cat]
-        prompt_cards = ""
-        for p in cat_prompts:
-            pid = p["id"]
-            subcat = p["subcategory"].replace("_", " ")
-            diff = p["difficulty"]
-            diff_color = diff_colors.get(diff, "var(--text2)")
-            prompt_text = html_mod.escape(p["prompt"])
-            ideal_text = html_mod.escape(p.get("ideal", ""))
-            criteria = p.get("criteria", [])
-            criteria_html = " ".join(
-                f'<span class="criteria-tag">{html_mod.escape(c)}</span>'
-                for c in criteria
-            )
-            check = p.get("check_type", "").replace("_", " ")
-
-            prompt_cards += f"""<div class="prompt-card" data-category="{cat}" data-difficulty="{diff}" data-check="{p.get('check_type', '')}">
-          <div class="prompt-header">
-            <span class="prompt-id">{pid}</span>
-            <span class="prompt-subcat">{subcat}</span>
-            <span class="prompt-diff" style="color:{diff_color}">{diff}</span>
-            <span class="prompt-check">{check}</span>
-          </div>
-          <div class="prompt-criteria">{criteria_html}</div>
-        </div>\n"""
-
-        questions_sections += f"""<details class="category-section" open>
-      <summary class="category-toggle">{display_cat} <span class="category-count">{cats[cat]} prompts</span></summary>
-      {prompt_cards}
-    </details>\n"""
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>BenchPress - Methodology</title>
-<style>
-  :root {{
+_METHODOLOGY_CSS = _minify_css("""\
+  :root {
     --bg: #0f1117;
     --surface: #1a1d27;
     --surface2: #242836;
@@ -2876,40 +2951,40 @@ def generate_methodology_html(stats):
     --yellow: #eab308;
     --red: #ef4444;
     --orange: #f97316;
-  }}
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
     background: var(--bg);
     color: var(--text);
     line-height: 1.6;
-  }}
-  .header {{
+  }
+  .header {
     background: linear-gradient(135deg, #1a1d27 0%, #242836 100%);
     border-bottom: 1px solid var(--border);
     padding: 1.5rem 2.5rem;
-  }}
-  .header-inner {{
+  }
+  .header-inner {
     max-width: 1440px;
     margin: 0 auto;
-  }}
-  .header-top {{
+  }
+  .header-top {
     display: flex;
     justify-content: space-between;
     align-items: center;
     margin-bottom: 0.25rem;
-  }}
-  .header h1 {{ font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }}
-  .header .byline {{ font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }}
-  .header .meta {{ font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }}
-  .nav {{
+  }
+  .header h1 { font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }
+  .header .byline { font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }
+  .header .meta { font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }
+  .nav {
     display: flex;
     gap: 0.25rem;
     background: var(--surface2);
     border-radius: 8px;
     padding: 0.25rem;
-  }}
-  .nav-link {{
+  }
+  .nav-link {
     padding: 0.4rem 1rem;
     border-radius: 6px;
     font-size: 0.8rem;
@@ -2917,55 +2992,55 @@ def generate_methodology_html(stats):
     color: var(--text2);
     text-decoration: none;
     transition: all 0.2s;
-  }}
-  .nav-link:hover {{ color: var(--text); background: rgba(255,255,255,0.05); }}
-  .nav-link.active {{ color: var(--text); background: var(--accent); }}
-  .container {{
+  }
+  .nav-link:hover { color: var(--text); background: rgba(255,255,255,0.05); }
+  .nav-link.active { color: var(--text); background: var(--accent); }
+  .container {
     max-width: 900px;
     margin: 0 auto;
     padding: 2rem 2.5rem 3rem;
-  }}
-  .card {{
+  }
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.5rem;
     margin-bottom: 1.5rem;
-  }}
-  .card h2 {{
+  }
+  .card h2 {
     font-size: 1.1rem;
     font-weight: 600;
     margin-bottom: 0.75rem;
     color: var(--text);
-  }}
-  .card h3 {{
+  }
+  .card h3 {
     font-size: 0.9rem;
     font-weight: 600;
     margin-top: 1rem;
     margin-bottom: 0.5rem;
     color: var(--accent2);
-  }}
-  .card p {{
+  }
+  .card p {
     color: var(--text2);
     font-size: 0.85rem;
     margin-bottom: 0.75rem;
-  }}
-  .card ul {{
+  }
+  .card ul {
     color: var(--text2);
     font-size: 0.85rem;
     margin-left: 1.25rem;
     margin-bottom: 0.75rem;
-  }}
-  .card li {{
+  }
+  .card li {
     margin-bottom: 0.3rem;
-  }}
-  table {{
+  }
+  table {
     width: 100%;
     border-collapse: collapse;
     font-size: 0.85rem;
     margin-bottom: 0.5rem;
-  }}
-  th {{
+  }
+  th {
     text-align: left;
     padding: 0.5rem 0.75rem;
     border-bottom: 2px solid var(--border);
@@ -2974,35 +3049,35 @@ def generate_methodology_html(stats):
     font-size: 0.75rem;
     text-transform: uppercase;
     letter-spacing: 0.04em;
-  }}
-  th.num {{ text-align: right; }}
-  td {{
+  }
+  th.num { text-align: right; }
+  td {
     padding: 0.5rem 0.75rem;
     border-bottom: 1px solid var(--border);
-  }}
-  td.num {{ text-align: right; font-variant-numeric: tabular-nums; }}
-  tr:last-child td {{ border-bottom: none; }}
-  tr:hover td {{ background: var(--surface2); }}
-  .grid-2 {{
+  }
+  td.num { text-align: right; font-variant-numeric: tabular-nums; }
+  tr:last-child td { border-bottom: none; }
+  tr:hover td { background: var(--surface2); }
+  .grid-2 {
     display: grid;
     grid-template-columns: 1fr 1fr;
     gap: 1.5rem;
     margin-bottom: 1.5rem;
-  }}
-  .scoring-scale {{
+  }
+  .scoring-scale {
     display: grid;
     grid-template-columns: auto 1fr;
     gap: 0.25rem 0.75rem;
     font-size: 0.85rem;
-  }}
-  .scoring-scale .score {{ font-weight: 700; font-variant-numeric: tabular-nums; }}
-  .scoring-scale .desc {{ color: var(--text2); }}
-  .score-5 {{ color: var(--green); }}
-  .score-4 {{ color: var(--green-light); }}
-  .score-3 {{ color: var(--yellow); }}
-  .score-2 {{ color: var(--orange); }}
-  .score-1 {{ color: var(--red); }}
-  .highlight {{
+  }
+  .scoring-scale .score { font-weight: 700; font-variant-numeric: tabular-nums; }
+  .scoring-scale .desc { color: var(--text2); }
+  .score-5 { color: var(--green); }
+  .score-4 { color: var(--green-light); }
+  .score-3 { color: var(--yellow); }
+  .score-2 { color: var(--orange); }
+  .score-1 { color: var(--red); }
+  .highlight {
     background: var(--surface2);
     border-radius: 6px;
     padding: 1rem;
@@ -3010,55 +3085,55 @@ def generate_methodology_html(stats):
     font-size: 0.85rem;
     color: var(--text2);
     border-left: 3px solid var(--accent);
-  }}
-  .kpi-row {{
+  }
+  .kpi-row {
     display: grid;
     grid-template-columns: repeat(4, 1fr);
     gap: 1rem;
     margin-bottom: 1.5rem;
-  }}
-  .kpi {{
+  }
+  .kpi {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.25rem;
     text-align: center;
-  }}
-  .kpi .value {{
+  }
+  .kpi .value {
     font-size: 1.8rem;
     font-weight: 700;
     font-variant-numeric: tabular-nums;
-  }}
-  .kpi .label {{
+  }
+  .kpi .label {
     font-size: 0.75rem;
     color: var(--text2);
     text-transform: uppercase;
     letter-spacing: 0.05em;
     margin-top: 0.25rem;
-  }}
-  @media (max-width: 900px) {{
-    .header {{ padding: 1rem; }}
-    .header-top {{ flex-direction: column; align-items: flex-start; gap: 0.5rem; }}
-    .container {{ padding: 1rem; }}
-    .grid-2 {{ grid-template-columns: 1fr; }}
-    .kpi-row {{ grid-template-columns: repeat(2, 1fr); }}
-  }}
-  @media (max-width: 600px) {{
-    .container {{ padding: 0.75rem; }}
-    .header {{ padding: 1rem 0.75rem; }}
-    .header h1 {{ font-size: 1.2rem; }}
-    .card {{ padding: 1rem; }}
-    .kpi-row {{ grid-template-columns: 1fr 1fr; }}
-    .kpi .value {{ font-size: 1.4rem; }}
-  }}
-  .category-section {{
+  }
+  @media (max-width: 900px) {
+    .header { padding: 1rem; }
+    .header-top { flex-direction: column; align-items: flex-start; gap: 0.5rem; }
+    .container { padding: 1rem; }
+    .grid-2 { grid-template-columns: 1fr; }
+    .kpi-row { grid-template-columns: repeat(2, 1fr); }
+  }
+  @media (max-width: 600px) {
+    .container { padding: 0.75rem; }
+    .header { padding: 1rem 0.75rem; }
+    .header h1 { font-size: 1.2rem; }
+    .card { padding: 1rem; }
+    .kpi-row { grid-template-columns: 1fr 1fr; }
+    .kpi .value { font-size: 1.4rem; }
+  }
+  .category-section {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     margin-bottom: 1rem;
     overflow: hidden;
-  }}
-  .category-toggle {{
+  }
+  .category-toggle {
     padding: 1rem 1.5rem;
     font-size: 1.05rem;
     font-weight: 600;
@@ -3067,40 +3142,40 @@ def generate_methodology_html(stats):
     display: flex;
     align-items: center;
     gap: 0.75rem;
-  }}
-  .category-toggle::-webkit-details-marker {{ display: none; }}
-  .category-toggle::before {{
+  }
+  .category-toggle::-webkit-details-marker { display: none; }
+  .category-toggle::before {
     content: '\\25B6';
     font-size: 0.7rem;
     color: var(--accent);
     transition: transform 0.2s;
-  }}
-  details[open] > .category-toggle::before {{
+  }
+  details[open] > .category-toggle::before {
     transform: rotate(90deg);
-  }}
-  .category-count {{
+  }
+  .category-count {
     font-size: 0.75rem;
     font-weight: 500;
     color: var(--text2);
     background: var(--surface2);
     padding: 0.15rem 0.5rem;
     border-radius: 4px;
-  }}
-  .prompt-card {{
+  }
+  .prompt-card {
     padding: 1rem 1.5rem;
     border-top: 1px solid var(--border);
-  }}
-  .prompt-card:hover {{
+  }
+  .prompt-card:hover {
     background: rgba(255,255,255,0.02);
-  }}
-  .prompt-header {{
+  }
+  .prompt-header {
     display: flex;
     align-items: center;
     gap: 0.75rem;
     margin-bottom: 0.6rem;
     flex-wrap: wrap;
-  }}
-  .prompt-id {{
+  }
+  .prompt-id {
     font-weight: 700;
     font-size: 0.85rem;
     color: var(--accent);
@@ -3108,28 +3183,28 @@ def generate_methodology_html(stats):
     padding: 0.1rem 0.5rem;
     border-radius: 4px;
     font-family: monospace;
-  }}
-  .prompt-subcat {{
+  }
+  .prompt-subcat {
     font-size: 0.8rem;
     font-weight: 600;
     color: var(--text);
     text-transform: capitalize;
-  }}
-  .prompt-diff {{
+  }
+  .prompt-diff {
     font-size: 0.7rem;
     font-weight: 600;
     text-transform: uppercase;
     letter-spacing: 0.04em;
-  }}
-  .prompt-check {{
+  }
+  .prompt-check {
     font-size: 0.7rem;
     color: var(--text2);
     background: var(--surface2);
     padding: 0.1rem 0.4rem;
     border-radius: 3px;
     text-transform: capitalize;
-  }}
-  .prompt-text {{
+  }
+  .prompt-text {
     font-size: 0.85rem;
     color: var(--text);
     line-height: 1.6;
@@ -3140,22 +3215,22 @@ def generate_methodology_html(stats):
     border: 1px solid var(--border);
     margin-bottom: 0.6rem;
     font-family: 'Inter', -apple-system, sans-serif;
-  }}
-  .prompt-ideal {{
+  }
+  .prompt-ideal {
     font-size: 0.8rem;
     color: var(--text2);
     line-height: 1.5;
     margin-bottom: 0.5rem;
-  }}
-  .prompt-ideal strong {{
+  }
+  .prompt-ideal strong {
     color: var(--accent2);
-  }}
-  .prompt-criteria {{
+  }
+  .prompt-criteria {
     display: flex;
     flex-wrap: wrap;
     gap: 0.35rem;
-  }}
-  .criteria-tag {{
+  }
+  .criteria-tag {
     font-size: 0.7rem;
     padding: 0.1rem 0.4rem;
     border-radius: 3px;
@@ -3163,15 +3238,15 @@ def generate_methodology_html(stats):
     color: var(--accent2);
     font-weight: 500;
     text-transform: capitalize;
-  }}
-  .section-divider {{
+  }
+  .section-divider {
     font-size: 1.3rem;
     font-weight: 700;
     margin: 2rem 0 1rem;
     padding-bottom: 0.5rem;
     border-bottom: 2px solid var(--border);
-  }}
-  .filter-toolbar {{
+  }
+  .filter-toolbar {
     display: flex;
     flex-wrap: wrap;
     gap: 0.75rem;
@@ -3181,8 +3256,8 @@ def generate_methodology_html(stats):
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
-  }}
-  .filter-toolbar input[type="text"] {{
+  }
+  .filter-toolbar input[type="text"] {
     flex: 1;
     min-width: 200px;
     padding: 0.5rem 0.75rem;
@@ -3192,11 +3267,11 @@ def generate_methodology_html(stats):
     border-radius: 6px;
     font-size: 0.85rem;
     outline: none;
-  }}
-  .filter-toolbar input[type="text"]:focus {{
+  }
+  .filter-toolbar input[type="text"]:focus {
     border-color: var(--accent);
-  }}
-  .filter-toolbar select {{
+  }
+  .filter-toolbar select {
     padding: 0.5rem 0.75rem;
     background: var(--surface2);
     color: var(--text);
@@ -3204,12 +3279,116 @@ def generate_methodology_html(stats):
     border-radius: 6px;
     font-size: 0.8rem;
     cursor: pointer;
-  }}
-  .filter-toolbar .filter-count {{
+  }
+  .filter-toolbar .filter-count {
     font-size: 0.8rem;
     color: var(--text2);
     margin-left: auto;
-  }}
+  }""")
+
+
+def generate_methodology_html(stats):
+    """Generate the methodology and focus page."""
+    prompts = load_prompts()
+
+    # Compute category/difficulty/check_type breakdowns
+    cats = Counter(p["category"] for p in prompts)
+    diffs = Counter(p["difficulty"] for p in prompts)
+    checks = Counter(p["check_type"] for p in prompts)
+
+    category_descriptions = {
+        "coding": "Bug detection (including trap prompts with no bug), code generation, debugging, architecture design, security review, refactoring, concurrency, ML implementation, and cross-language tasks. Medium to hard difficulty.",
+        "learning": "Technical explanations, factual accuracy, nuanced comparisons, calibration, and trap questions testing common misconceptions. Tests depth of understanding vs surface-level answers.",
+        "reasoning": "Fermi estimation, logic puzzles, statistical analysis, ethical tradeoffs, causal reasoning, and false premise detection. Tests whether models show their work and catch tricks.",
+        "behavioural": "Sycophancy resistance, hallucination detection, appropriate refusal, verbosity control, and unsolicited opinion avoidance. Tests character and safety alignment.",
+        "writing": "Technical writing, tone switching, anti-slop detection, constrained writing, editing, email drafting, and argumentation. Tests natural voice and format compliance.",
+        "instruction_following": "Exact format compliance, multi-constraint tasks, conflicting instructions, creative constraints, and ambiguity handling. Tests literal instruction adherence.",
+        "research": "Source synthesis, contradictory evidence handling, technical evaluation, and summarization fidelity. Tests analytical depth over breadth.",
+        "meta": "Self-knowledge, calibration, honesty under pressure, and uncertainty expression. Tests whether models know what they don't know.",
+    }
+
+    cat_rows = ""
+    for cat in sorted(cats):
+        display = cat.replace("_", " ").title()
+        subcats = sorted(set(p["subcategory"].replace("_", " ") for p in prompts if p["category"] == cat))
+        sub_str = ", ".join(subcats)
+        desc = category_descriptions.get(cat, "")
+        cat_rows += f"""<tr>
+          <td style="font-weight:600;text-transform:capitalize">{display}</td>
+          <td class="num">{cats[cat]}</td>
+          <td style="color:var(--text2);font-size:0.8rem">{sub_str}</td>
+          <td style="color:var(--text2);font-size:0.8rem">{desc}</td>
+        </tr>\n"""
+
+    diff_rows = ""
+    for d in ["easy", "medium", "hard"]:
+        if d in diffs:
+            diff_rows += f'<tr><td style="font-weight:600;text-transform:capitalize">{d}</td><td class="num">{diffs[d]}</td></tr>\n'
+
+    # Group check types into categories
+    automated_checks = []
+    judge_only_checks = []
+    noop_types = {"calibration", "reasoning", "format_check", "checklist", "analysis", "synthesis", "comparison", "behavioural"}
+    for ct in sorted(checks):
+        display = ct.replace("_", " ")
+        if ct in noop_types:
+            judge_only_checks.append((display, checks[ct]))
+        else:
+            automated_checks.append((display, checks[ct]))
+
+    auto_rows = "".join(
+        f'<tr><td>{name}</td><td class="num">{count}</td></tr>\n'
+        for name, count in automated_checks
+    )
+    judge_rows = "".join(
+        f'<tr><td>{name}</td><td class="num">{count}</td></tr>\n'
+        for name, count in judge_only_checks
+    )
+
+    # Build questions section grouped by category
+    diff_colors = {"easy": "var(--green)", "medium": "var(--yellow)", "hard": "var(--red)"}
+    questions_sections = ""
+    for cat in sorted(cats):
+        display_cat = cat.replace("_", " ").title()
+        cat_prompts = [p for p in prompts if p["category"] == cat]
+        prompt_cards = ""
+        for p in cat_prompts:
+            pid = p["id"]
+            subcat = p["subcategory"].replace("_", " ")
+            diff = p["difficulty"]
+            diff_color = diff_colors.get(diff, "var(--text2)")
+            prompt_text = html_mod.escape(p["prompt"])
+            ideal_text = html_mod.escape(p.get("ideal", ""))
+            criteria = p.get("criteria", [])
+            criteria_html = " ".join(
+                f'<span class="criteria-tag">{html_mod.escape(c)}</span>'
+                for c in criteria
+            )
+            check = p.get("check_type", "").replace("_", " ")
+
+            prompt_cards += f"""<div class="prompt-card" data-category="{cat}" data-difficulty="{diff}" data-check="{p.get('check_type', '')}">
+          <div class="prompt-header">
+            <span class="prompt-id">{pid}</span>
+            <span class="prompt-subcat">{subcat}</span>
+            <span class="prompt-diff" style="color:{diff_color}">{diff}</span>
+            <span class="prompt-check">{check}</span>
+          </div>
+          <div class="prompt-criteria">{criteria_html}</div>
+        </div>\n"""
+
+        questions_sections += f"""<details class="category-section" open>
+      <summary class="category-toggle">{display_cat} <span class="category-count">{cats[cat]} prompts</span></summary>
+      {prompt_cards}
+    </details>\n"""
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>BenchPress - Methodology</title>
+<style>
+{_METHODOLOGY_CSS}
 </style>
 </head>
 <body>
@@ -3228,7 +3407,7 @@ def generate_methodology_html(stats):
       </nav>
     </div>
     <p class="byline">Opinionated in scope. Objective in execution.</p>
-    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {datetime.fromisoformat(stats['generated']).strftime('%b %d, %Y %H:%M')}</div>
+    <div class="meta">{stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; {len(stats['categories'])} categories{f' &middot; Judges: {", ".join(stats["judge_models"])}' if stats.get("judge_models") else ''} &middot; Updated {stats['generated_display']}</div>
   </div>
 </div>
 
@@ -3527,144 +3706,8 @@ def generate_methodology_html(stats):
 </html>"""
 
 
-def generate_judges_html(stats):
-    """Generate the judges analysis page."""
-    data_json = json.dumps(stats)
-
-    judge_global = stats.get("judge_global", {})
-    judge_by_category = stats.get("judge_by_category", {})
-    judge_by_difficulty = stats.get("judge_by_difficulty", {})
-    judge_by_model = stats.get("judge_by_model", {})
-    judge_pairwise = stats.get("judge_pairwise", {})
-    judge_pairwise_matrix_raw = stats.get("judge_pairwise_matrix", {})
-    judge_pairwise_matrix = {tuple(k.split("|", 1)): v for k, v in judge_pairwise_matrix_raw.items()}
-    judge_score_dists = stats.get("judge_score_distributions", {})
-    judge_vs_deepeval = stats.get("judge_vs_deepeval", {})
-    biggest_disagreements = stats.get("biggest_disagreements", [])
-    all_judges = sorted(judge_global.keys())
-
-    # No judges at all - show a placeholder
-    if not all_judges:
-        return f"""<!DOCTYPE html>
-<html lang="en"><head><meta charset="utf-8"><title>BenchPress - Judges</title>
-<style>body{{font-family:sans-serif;background:#0f1117;color:#e4e7f0;padding:3rem;text-align:center}}
-a{{color:#6c72ff}}</style></head>
-<body><h1>No judge data available yet</h1><p>Run evaluations with multiple judges to see analysis here.</p>
-<p><a href="index.html">Back to overview</a></p></body></html>"""
-
-    # KPI cards
-    judge_total_scored = {}
-    for jname, dist in judge_score_dists.items():
-        judge_total_scored[jname] = sum(dist.values())
-
-    # Find strictest / most lenient
-    sorted_judges = sorted(all_judges, key=lambda j: judge_global.get(j, 0))
-    strictest = sorted_judges[0] if sorted_judges else "-"
-    most_lenient = sorted_judges[-1] if sorted_judges else "-"
-
-    max_scored = max(judge_total_scored.values()) if judge_total_scored else 0
-
-    kpi_cards = ""
-    for jname in all_judges:
-        avg = judge_global.get(jname, 0)
-        total = judge_total_scored.get(jname, 0)
-        badge = ""
-        if jname == strictest and len(all_judges) > 1:
-            badge = '<span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(239,68,68,0.15);color:#ef4444;margin-left:0.5rem">Strictest</span>'
-        elif jname == most_lenient and len(all_judges) > 1:
-            badge = '<span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(34,197,94,0.15);color:#22c55e;margin-left:0.5rem">Most Lenient</span>'
-        progress_badge = ""
-        if max_scored > 0 and total < max_scored * 0.8:
-            pct = round(100 * total / max_scored)
-            progress_badge = f' <span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(234,179,8,0.15);color:#eab308;margin-left:0.25rem">{pct}% complete</span>'
-        kpi_cards += f"""<div class="kpi">
-          <div class="label">{html_mod.escape(jname)}{badge}</div>
-          <div class="value">{avg:.2f}<span style="font-size:0.9rem;color:var(--text2)">/5</span></div>
-          <div class="sub">{total} prompts scored{progress_badge}</div>
-        </div>\n"""
-
-    # Pairwise agreement heatmap
-    def _agree_heatmap_color(pct):
-        if pct >= 90: return "rgba(34,197,94,0.25)"
-        if pct >= 80: return "rgba(134,239,172,0.2)"
-        if pct >= 70: return "rgba(234,179,8,0.2)"
-        if pct >= 60: return "rgba(249,115,22,0.2)"
-        return "rgba(239,68,68,0.2)"
-
-    def _agree_text_color(pct):
-        if pct >= 80: return "#22c55e"
-        if pct >= 60: return "#eab308"
-        return "#ef4444"
-
-    heatmap_html = ""
-    if len(all_judges) >= 2:
-        # Build header row
-        hdr_cells = '<th style="min-width:100px"></th>'
-        for j in all_judges:
-            hdr_cells += f'<th style="text-align:center;font-size:0.75rem;padding:0.5rem;color:var(--text2)">{html_mod.escape(j)}</th>'
-        # Build body rows
-        body_rows = ""
-        for ja in all_judges:
-            cells = f'<td style="font-weight:600;font-size:0.75rem;white-space:nowrap;padding:0.5rem 0.75rem">{html_mod.escape(ja)}</td>'
-            for jb in all_judges:
-                pdata = judge_pairwise_matrix.get((ja, jb))
-                if pdata and pdata["self"]:
-                    cells += '<td style="text-align:center;padding:0.5rem;background:var(--surface);color:var(--text2);font-size:0.7rem">-</td>'
-                elif pdata:
-                    bg = _agree_heatmap_color(pdata["agree_pct"])
-                    tc = _agree_text_color(pdata["agree_pct"])
-                    cells += f'<td style="text-align:center;padding:0.5rem;background:{bg}" title="Avg diff: {pdata["avg_diff"]:.2f} | {pdata["n"]} prompts compared"><div style="font-size:0.95rem;font-weight:700;color:{tc}">{pdata["agree_pct"]}%</div><div style="font-size:0.65rem;color:var(--text2);margin-top:2px">diff {pdata["avg_diff"]:.2f}</div></td>'
-                else:
-                    cells += '<td style="text-align:center;padding:0.5rem;color:var(--text2);font-size:0.7rem">n/a</td>'
-            body_rows += f"<tr>{cells}</tr>\n"
-        heatmap_html = f"""<table style="border-collapse:collapse;width:auto">
-          <thead><tr>{hdr_cells}</tr></thead>
-          <tbody>{body_rows}</tbody>
-        </table>"""
-
-    # Judge vs DeepEval rows
-    jvd_rows = ""
-    for jname in all_judges:
-        jvd = judge_vs_deepeval.get(jname, {})
-        div_val = jvd.get("avg_divergence")
-        if div_val is not None:
-            div_color = "#22c55e" if div_val <= 0.10 else "#eab308" if div_val <= 0.20 else "#ef4444"
-            jvd_rows += f"""<tr>
-              <td style="font-weight:600">{html_mod.escape(jname)}</td>
-              <td class="num" style="font-weight:600;color:{div_color}">{div_val:.4f}</td>
-            </tr>\n"""
-
-    # Biggest disagreements table rows
-    disagree_rows = ""
-    for d in biggest_disagreements[:20]:
-        score_cells = ""
-        for jname in all_judges:
-            sc = d["scores"].get(jname)
-            if sc is not None:
-                sc_color = _score_color(sc)
-                score_cells += f'<td class="num {sc_color}" style="font-weight:600">{sc}/5</td>'
-            else:
-                score_cells += '<td class="num" style="color:var(--text2)">-</td>'
-        spread_color = "#ef4444" if d["spread"] >= 3 else "#eab308" if d["spread"] >= 2 else "#f97316"
-        disagree_rows += f"""<tr>
-          <td style="font-weight:600;color:var(--accent)">{html_mod.escape(d['prompt_id'])}</td>
-          <td>{html_mod.escape(d['model'])}</td>
-          <td>{html_mod.escape(d['category'])}</td>
-          {score_cells}
-          <td class="num" style="font-weight:700;color:{spread_color}">{d['spread']}</td>
-        </tr>\n"""
-
-    judge_score_headers = "".join(f'<th class="num">{html_mod.escape(j)}</th>' for j in all_judges)
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>BenchPress - Judge Analysis</title>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-<style>
-  :root {{
+_JUDGES_CSS = _minify_css("""\
+  :root {
     --bg: #0f1117;
     --surface: #1a1d27;
     --surface2: #242836;
@@ -3679,40 +3722,40 @@ a{{color:#6c72ff}}</style></head>
     --yellow: #eab308;
     --red: #ef4444;
     --orange: #f97316;
-  }}
-  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
     background: var(--bg);
     color: var(--text);
     line-height: 1.5;
-  }}
-  .header {{
+  }
+  .header {
     background: linear-gradient(135deg, #1a1d27 0%, #242836 100%);
     border-bottom: 1px solid var(--border);
     padding: 1.5rem 2.5rem;
-  }}
-  .header-inner {{
+  }
+  .header-inner {
     max-width: 1440px;
     margin: 0 auto;
-  }}
-  .header-top {{
+  }
+  .header-top {
     display: flex;
     justify-content: space-between;
     align-items: center;
     margin-bottom: 0.25rem;
-  }}
-  .header h1 {{ font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }}
-  .header .byline {{ font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }}
-  .header .meta {{ font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }}
-  .nav {{
+  }
+  .header h1 { font-size: 1.5rem; font-weight: 700; letter-spacing: -0.02em; margin: 0; }
+  .header .byline { font-size: 0.85rem; color: var(--text2); margin: 0.2rem 0 0; }
+  .header .meta { font-size: 0.75rem; color: var(--text2); margin-top: 0.5rem; }
+  .nav {
     display: flex;
     gap: 0.25rem;
     background: var(--surface2);
     border-radius: 8px;
     padding: 0.25rem;
-  }}
-  .nav-link {{
+  }
+  .nav-link {
     padding: 0.4rem 1rem;
     border-radius: 6px;
     font-size: 0.8rem;
@@ -3720,83 +3763,83 @@ a{{color:#6c72ff}}</style></head>
     color: var(--text2);
     text-decoration: none;
     transition: all 0.2s;
-  }}
-  .nav-link:hover {{ color: var(--text); background: rgba(255,255,255,0.05); }}
-  .nav-link.active {{ color: var(--text); background: var(--accent); }}
-  .container {{
+  }
+  .nav-link:hover { color: var(--text); background: rgba(255,255,255,0.05); }
+  .nav-link.active { color: var(--text); background: var(--accent); }
+  .container {
     max-width: 1440px;
     margin: 0 auto;
     padding: 1.5rem 2.5rem 3rem;
-  }}
-  .kpi-row {{
+  }
+  .kpi-row {
     display: grid;
     grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
     gap: 1rem;
     margin-bottom: 1.5rem;
-  }}
-  .kpi {{
+  }
+  .kpi {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.25rem;
-  }}
-  .kpi .label {{
+  }
+  .kpi .label {
     font-size: 0.75rem;
     color: var(--text2);
     text-transform: uppercase;
     letter-spacing: 0.05em;
     margin-bottom: 0.5rem;
-  }}
-  .kpi .value {{
+  }
+  .kpi .value {
     font-size: 1.8rem;
     font-weight: 700;
     font-variant-numeric: tabular-nums;
-  }}
-  .kpi .sub {{
+  }
+  .kpi .sub {
     font-size: 0.8rem;
     color: var(--text2);
     margin-top: 0.25rem;
-  }}
-  .grid-2 {{
+  }
+  .grid-2 {
     display: grid;
     grid-template-columns: 1fr 1fr;
     gap: 1.5rem;
     margin-bottom: 1.5rem;
     align-items: stretch;
-  }}
-  .grid-full {{
+  }
+  .grid-full {
     margin-bottom: 1.5rem;
-  }}
-  .card {{
+  }
+  .card {
     background: var(--surface);
     border: 1px solid var(--border);
     border-radius: 10px;
     padding: 1.5rem;
     display: flex;
     flex-direction: column;
-  }}
-  .card h2 {{
+  }
+  .card h2 {
     font-size: 1rem;
     font-weight: 600;
     margin-bottom: 1rem;
     color: var(--text);
-  }}
-  .card .chart-container {{
+  }
+  .card .chart-container {
     flex: 1;
-  }}
-  .chart-container {{
+  }
+  .chart-container {
     position: relative;
     width: 100%;
     min-height: 320px;
     height: 320px;
-  }}
-  .chart-container-wide {{
+  }
+  .chart-container-wide {
     position: relative;
     width: 100%;
     min-height: 400px;
     height: 400px;
-  }}
-  .info-tip {{
+  }
+  .info-tip {
     display: inline-block;
     position: relative;
     width: 16px;
@@ -3811,8 +3854,8 @@ a{{color:#6c72ff}}</style></head>
     margin-left: 6px;
     cursor: default;
     vertical-align: middle;
-  }}
-  .info-tip:hover::after {{
+  }
+  .info-tip:hover::after {
     content: attr(data-info);
     position: absolute;
     top: 100%;
@@ -3829,13 +3872,13 @@ a{{color:#6c72ff}}</style></head>
     z-index: 20;
     pointer-events: none;
     border: 1px solid var(--border);
-  }}
-  table {{
+  }
+  table {
     width: 100%;
     border-collapse: collapse;
     font-size: 0.85rem;
-  }}
-  th {{
+  }
+  th {
     text-align: left;
     padding: 0.6rem 0.75rem;
     border-bottom: 2px solid var(--border);
@@ -3845,26 +3888,26 @@ a{{color:#6c72ff}}</style></head>
     text-transform: uppercase;
     letter-spacing: 0.04em;
     white-space: nowrap;
-  }}
-  th.num {{ text-align: right; }}
-  td {{
+  }
+  th.num { text-align: right; }
+  td {
     padding: 0.6rem 0.75rem;
     border-bottom: 1px solid var(--border);
     font-variant-numeric: tabular-nums;
-  }}
-  td.num {{ text-align: right; }}
-  tr:last-child td {{ border-bottom: none; }}
-  tr:hover td {{ background: var(--surface2); }}
-  .table-scroll {{
+  }
+  td.num { text-align: right; }
+  tr:last-child td { border-bottom: none; }
+  tr:hover td { background: var(--surface2); }
+  .table-scroll {
     overflow-x: auto;
     -webkit-overflow-scrolling: touch;
-  }}
-  .score-5 {{ color: var(--green); }}
-  .score-4 {{ color: var(--green-light); }}
-  .score-3 {{ color: var(--yellow); }}
-  .score-2 {{ color: var(--orange); }}
-  .score-1 {{ color: var(--red); }}
-  .section-title {{
+  }
+  .score-5 { color: var(--green); }
+  .score-4 { color: var(--green-light); }
+  .score-3 { color: var(--yellow); }
+  .score-2 { color: var(--orange); }
+  .score-1 { color: var(--red); }
+  .section-title {
     font-size: 0.7rem;
     text-transform: uppercase;
     letter-spacing: 0.08em;
@@ -3872,17 +3915,157 @@ a{{color:#6c72ff}}</style></head>
     margin-bottom: 1rem;
     padding-bottom: 0.5rem;
     border-bottom: 1px solid var(--border);
-  }}
-  @media (max-width: 1100px) {{
-    .grid-2 {{ grid-template-columns: 1fr; }}
-  }}
-  @media (max-width: 600px) {{
-    .kpi-row {{ grid-template-columns: 1fr 1fr; gap: 0.75rem; }}
-    .container {{ padding: 0.75rem; }}
-    .header {{ padding: 1rem 0.75rem; }}
-    .chart-container {{ height: 260px; min-height: 260px; }}
-    .chart-container-wide {{ height: 300px; min-height: 300px; }}
-  }}
+  }
+  @media (max-width: 1100px) {
+    .grid-2 { grid-template-columns: 1fr; }
+  }
+  @media (max-width: 600px) {
+    .kpi-row { grid-template-columns: 1fr 1fr; gap: 0.75rem; }
+    .container { padding: 0.75rem; }
+    .header { padding: 1rem 0.75rem; }
+    .chart-container { height: 260px; min-height: 260px; }
+    .chart-container-wide { height: 300px; min-height: 300px; }
+  }""")
+
+
+def generate_judges_html(stats, compress_data=False, data_url=None):
+    """Generate the judges analysis page."""
+    data_script_start, data_script_end = _data_script(stats, compress_data, data_url)
+
+    judge_global = stats.get("judge_global", {})
+    judge_by_category = stats.get("judge_by_category", {})
+    judge_by_difficulty = stats.get("judge_by_difficulty", {})
+    judge_by_model = stats.get("judge_by_model", {})
+    judge_pairwise = stats.get("judge_pairwise", {})
+    judge_pairwise_matrix_raw = stats.get("judge_pairwise_matrix", {})
+    judge_pairwise_matrix = {tuple(k.split("|", 1)): v for k, v in judge_pairwise_matrix_raw.items()}
+    judge_score_dists = stats.get("judge_score_distributions", {})
+    judge_vs_deepeval = stats.get("judge_vs_deepeval", {})
+    biggest_disagreements = stats.get("biggest_disagreements", [])
+    all_judges = sorted(judge_global.keys())
+
+    # No judges at all - show a placeholder
+    if not all_judges:
+        return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>BenchPress - Judges</title>
+<style>body{{font-family:sans-serif;background:#0f1117;color:#e4e7f0;padding:3rem;text-align:center}}
+a{{color:#6c72ff}}</style></head>
+<body><h1>No judge data available yet</h1><p>Run evaluations with multiple judges to see analysis here.</p>
+<p><a href="index.html">Back to overview</a></p></body></html>"""
+
+    # KPI cards
+    judge_total_scored = {}
+    for jname, dist in judge_score_dists.items():
+        judge_total_scored[jname] = sum(dist.values())
+
+    # Find strictest / most lenient
+    sorted_judges = sorted(all_judges, key=lambda j: judge_global.get(j, 0))
+    strictest = sorted_judges[0] if sorted_judges else "-"
+    most_lenient = sorted_judges[-1] if sorted_judges else "-"
+
+    max_scored = max(judge_total_scored.values()) if judge_total_scored else 0
+
+    kpi_cards = ""
+    for jname in all_judges:
+        avg = judge_global.get(jname, 0)
+        total = judge_total_scored.get(jname, 0)
+        badge = ""
+        if jname == strictest and len(all_judges) > 1:
+            badge = '<span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(239,68,68,0.15);color:#ef4444;margin-left:0.5rem">Strictest</span>'
+        elif jname == most_lenient and len(all_judges) > 1:
+            badge = '<span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(34,197,94,0.15);color:#22c55e;margin-left:0.5rem">Most Lenient</span>'
+        progress_badge = ""
+        if max_scored > 0 and total < max_scored * 0.8:
+            pct = round(100 * total / max_scored)
+            progress_badge = f' <span style="display:inline-block;padding:0.15rem 0.5rem;border-radius:4px;font-size:0.7rem;font-weight:600;background:rgba(234,179,8,0.15);color:#eab308;margin-left:0.25rem">{pct}% complete</span>'
+        kpi_cards += f"""<div class="kpi">
+          <div class="label">{html_mod.escape(jname)}{badge}</div>
+          <div class="value">{avg:.2f}<span style="font-size:0.9rem;color:var(--text2)">/5</span></div>
+          <div class="sub">{total} prompts scored{progress_badge}</div>
+        </div>\n"""
+
+    # Pairwise agreement heatmap
+    def _agree_heatmap_color(pct):
+        if pct >= 90: return "rgba(34,197,94,0.25)"
+        if pct >= 80: return "rgba(134,239,172,0.2)"
+        if pct >= 70: return "rgba(234,179,8,0.2)"
+        if pct >= 60: return "rgba(249,115,22,0.2)"
+        return "rgba(239,68,68,0.2)"
+
+    def _agree_text_color(pct):
+        if pct >= 80: return "#22c55e"
+        if pct >= 60: return "#eab308"
+        return "#ef4444"
+
+    heatmap_html = ""
+    if len(all_judges) >= 2:
+        # Build header row
+        hdr_cells = '<th style="min-width:100px"></th>'
+        for j in all_judges:
+            hdr_cells += f'<th style="text-align:center;font-size:0.75rem;padding:0.5rem;color:var(--text2)">{html_mod.escape(j)}</th>'
+        # Build body rows
+        body_rows = ""
+        for ja in all_judges:
+            cells = f'<td style="font-weight:600;font-size:0.75rem;white-space:nowrap;padding:0.5rem 0.75rem">{html_mod.escape(ja)}</td>'
+            for jb in all_judges:
+                pdata = judge_pairwise_matrix.get((ja, jb))
+                if pdata and pdata["self"]:
+                    cells += '<td style="text-align:center;padding:0.5rem;background:var(--surface);color:var(--text2);font-size:0.7rem">-</td>'
+                elif pdata:
+                    bg = _agree_heatmap_color(pdata["agree_pct"])
+                    tc = _agree_text_color(pdata["agree_pct"])
+                    cells += f'<td style="text-align:center;padding:0.5rem;background:{bg}" title="Avg diff: {pdata["avg_diff"]:.2f} | {pdata["n"]} prompts compared"><div style="font-size:0.95rem;font-weight:700;color:{tc}">{pdata["agree_pct"]}%</div><div style="font-size:0.65rem;color:var(--text2);margin-top:2px">diff {pdata["avg_diff"]:.2f}</div></td>'
+                else:
+                    cells += '<td style="text-align:center;padding:0.5rem;color:var(--text2);font-size:0.7rem">n/a</td>'
+            body_rows += f"<tr>{cells}</tr>\n"
+        heatmap_html = f"""<table style="border-collapse:collapse;width:auto">
+          <thead><tr>{hdr_cells}</tr></thead>
+          <tbody>{body_rows}</tbody>
+        </table>"""
+
+    # Judge vs DeepEval rows
+    jvd_rows = ""
+    for jname in all_judges:
+        jvd = judge_vs_deepeval.get(jname, {})
+        div_val = jvd.get("avg_divergence")
+        if div_val is not None:
+            div_color = "#22c55e" if div_val <= 0.10 else "#eab308" if div_val <= 0.20 else "#ef4444"
+            jvd_rows += f"""<tr>
+              <td style="font-weight:600">{html_mod.escape(jname)}</td>
+              <td class="num" style="font-weight:600;color:{div_color}">{div_val:.4f}</td>
+            </tr>\n"""
+
+    # Biggest disagreements table rows
+    disagree_rows = ""
+    for d in biggest_disagreements[:20]:
+        score_cells = ""
+        for jname in all_judges:
+            sc = d["scores"].get(jname)
+            if sc is not None:
+                sc_color = _score_color(sc)
+                score_cells += f'<td class="num {sc_color}" style="font-weight:600">{sc}/5</td>'
+            else:
+                score_cells += '<td class="num" style="color:var(--text2)">-</td>'
+        spread_color = "#ef4444" if d["spread"] >= 3 else "#eab308" if d["spread"] >= 2 else "#f97316"
+        disagree_rows += f"""<tr>
+          <td style="font-weight:600;color:var(--accent)">{html_mod.escape(d['prompt_id'])}</td>
+          <td>{html_mod.escape(d['model'])}</td>
+          <td>{html_mod.escape(d['category'])}</td>
+          {score_cells}
+          <td class="num" style="font-weight:700;color:{spread_color}">{d['spread']}</td>
+        </tr>\n"""
+
+    judge_score_headers = "".join(f'<th class="num">{html_mod.escape(j)}</th>' for j in all_judges)
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>BenchPress - Judge Analysis</title>
+<script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
+<style>
+{_JUDGES_CSS}
 </style>
 </head>
 <body>
@@ -3894,7 +4077,7 @@ a{{color:#6c72ff}}</style></head>
       {_nav_html("judges.html", stats)}
     </div>
     <p class="byline">How do different judges score models?</p>
-    <div class="meta">{len(all_judges)} judge(s) &middot; {stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; Updated {datetime.fromisoformat(stats['generated']).strftime('%b %d, %Y %H:%M')}</div>
+    <div class="meta">{len(all_judges)} judge(s) &middot; {stats['total_models']} models &middot; {stats['total_prompts']} prompts &middot; Updated {stats['generated_display']}</div>
   </div>
 </div>
 
@@ -3983,7 +4166,7 @@ a{{color:#6c72ff}}</style></head>
 </div>
 
 <script>
-const DATA = {data_json};
+{data_script_start}
 const COLORS = [
   '#6c72ff', '#4ecdc4', '#f97316', '#22c55e', '#ec4899',
   '#eab308', '#8b5cf6', '#06b6d4', '#ef4444', '#84cc16'
@@ -4180,12 +4363,20 @@ const judges = Object.keys(DATA.judge_global || {{}}).sort();
     }}
   }});
 }})();
-</script>
+{data_script_end}</script>
 
 </body>
 </html>"""
 
 
+def _write_page(path, page_html, gzip_copy=False):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page_html)
+    if gzip_copy:
+        with gzip.open(path + ".gz", "wb", compresslevel=6) as f:
+            f.write(page_html.encode())
+
+
 def generate_dashboard(output_path=None):
     """Main entry point - generate dashboard HTML files."""
     if output_path is None:
@@ -4195,55 +4386,57 @@ def generate_dashboard(output_path=None):
         print("No results directory found.")
         return None
 
-    models = load_all_results()
-    if not models:
-        print("No model results found.")
-        return None
-
     config = load_config()
     judges_cfg = config.get("judges", [])
     judge_models = [j["model"] for j in judges_cfg]
-
     eval_file = config.get("eval", {}).get("eval_file")
-    prompts = load_prompts(eval_file)
     composite_config = config.get("composite", {})
     models_cfg = config.get("models", {})
-    stats = compute_stats(models, prompts, judge_models=judge_models, composite_config=composite_config, models_cfg=models_cfg)
+
+    # Unchanged inputs reuse the last run's stats, skipping the load and aggregation
+    try:
+        cache_key = _stats_cache_key(eval_file, judge_models, composite_config, models_cfg)
+    except OSError:
+        cache_key = None
+    stats = _cached_stats(cache_key) if cache_key else None
+    if stats is not None:
+        generated = datetime.now()
+        stats["generated"] = generated.isoformat()
+        stats["generated_display"] = generated.strftime("%b %d, %Y %H:%M")
+    else:
+        models = load_all_results()
+        if not models:
+            print("No model results found.")
+            return None
+        prompts = load_prompts(eval_file)
+        stats = compute_stats(models, prompts, judge_models=judge_models, composite_config=composite_config,
+                              models_cfg=models_cfg)
+        if cache_key:
+            try:
+                _store_stats(cache_key, stats)
+            except OSError as e:
+                print(f"  Warning: could not cache dashboard stats: {e}")
 
     # Ensure output directory exists
     out_dir = os.path.dirname(output_path)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
 
-    # Main dashboard
-    html = generate_html(stats)
-    with open(output_path, "w") as f:
-        f.write(html)
-
-    # Categories page
-    cat_path = os.path.join(out_dir or ".", "categories.html")
-    cat_html = generate_categories_html(stats)
-    with open(cat_path, "w") as f:
-        f.write(cat_html)
-
-    # Companies page
-    companies_path = os.path.join(out_dir or ".", "companies.html")
-    companies_html = generate_companies_html(stats)
-    with open(companies_path, "w") as f:
-        f.write(companies_html)
-
-    # Methodology page
-    meth_path = os.path.join(out_dir or ".", "methodology.html")
-    meth_html = generate_methodology_html(stats)
-    with open(meth_path, "w") as f:
-        f.write(meth_html)
-
-
-    # Judges page
-    judges_path = os.path.join(out_dir or ".", "judges.html")
-    judges_html = generate_judges_html(stats)
-    with open(judges_path, "w") as f:
-        f.write(judges_html)
+    # Optional pre-compressed copies for servers that can send .gz directly
+    output_cfg = config.get("output", {})
+    gzip_copy = output_cfg.get("dashboard_gzip", False)
+    compress = output_cfg.get("dashboard_compress_data", False)
+    base = out_dir or "."
+    # One data file shared by every page, so the browser fetches and caches it once
+    data_url = None
+    if output_cfg.get("dashboard_external_data", False):
+        data_url = DATA_FILE
+        _write_page(os.path.join(base, DATA_FILE), jsonio.dumps(stats), gzip_copy)
+    _write_page(output_path, generate_html(stats, compress, data_url), gzip_copy)
+    _write_page(os.path.join(base, "categories.html"), generate_categories_html(stats, compress, data_url), gzip_copy)
+    _write_page(os.path.join(base, "companies.html"), generate_companies_html(stats, compress, data_url), gzip_copy)
+    _write_page(os.path.join(base, "methodology.html"), generate_methodology_html(stats), gzip_copy)
+    _write_page(os.path.join(base, "judges.html"), generate_judges_html(stats, compress, data_url), gzip_copy)
 
     return output_path
 
@@ -0,0 +1,68 @@
+"""JSON read/write helpers for results and eval files.
+
+Uses orjson when it's installed (several times faster on large results
+files) and falls back to the stdlib json module otherwise. Both backends
+produce UTF-8 output with the same shape, so files are interchangeable.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Compact single-line JSON, e.g. for JSONL records."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_pretty(obj) -> bytes:
+    """Two-space indented JSON as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+def load(path: str):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_pretty(obj, path: str):
+    with open(path, "wb") as f:
+        f.write(dumps_pretty(obj))
+
+
+def merge_runs_log(path: str, data: dict) -> dict:
+    """Merge run entries appended to a JSONL runs log into results data.
+
+    Entries already present (same pid and timestamp) are skipped, so a crash
+    between consolidating and removing the log can't duplicate runs. A
+    missing log leaves data as it is.
+    """
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return data
+    with f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted write
+            runs = data.setdefault("runs", {}).setdefault(entry.pop("pid"), [])
+            if not any(r.get("timestamp") == entry.get("timestamp") for r in runs):
+                runs.append(entry)
+    return data
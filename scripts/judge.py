@@ -4,11 +4,20 @@ Uses a separate LLM call to score each response against the prompt's
 ideal answer and criteria, replacing manual human scoring.
 """
 
+import asyncio
 import json
 import re
+import statistics
 
+from scripts import jsonio
+from scripts.ratelimit import LimitedProvider, aretry, retry
 
-JUDGE_PROMPT = """\
+
+# Markdown code fence around a judge reply, e.g. ```json {...} ```
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+JUDGE_RUBRIC = """\
 You are an expert evaluator for LLM responses. Score the response on a 1-5 scale:
 
   5 - Excellent: Fully addresses the prompt, accurate, well-structured, meets all criteria
@@ -23,20 +32,56 @@ Guidelines:
 - Reward appropriate hedging, asking for clarification, or refusing harmful requests
 - Consider auto-check flags as additional signal (failures should lower the score)
 - Be strict but fair - a 3 is average, 5 is genuinely excellent
+- Very long responses and ideal answers are cut short and end in "...[truncated]";
+  judge the text shown and don't penalise the cut itself
+
+"""
 
+JUDGE_PROMPT = JUDGE_RUBRIC + """\
 Return ONLY a JSON object (no markdown fences, no extra text):
 {"score": <1-5>, "rationale": "<1-2 sentence explanation>"}
 """
 
 
-def build_judge_prompt(prompt_meta: dict, response: str, auto_checks: dict) -> str:
-    """Assemble the user message for the judge LLM call."""
+# Appended for the one retry after an unparseable or out-of-range reply
+JUDGE_JSON_REMINDER = (
+    "\n\nYour previous reply could not be used. Reply with ONLY the JSON object "
+    'described above, e.g. {"score": 3, "rationale": "..."}.'
+)
+
+# Output cap per judged item for judges with short_output: true in their
+# params: a score and a 1-2 sentence rationale fit comfortably, and a
+# rambling judge stops early. Opt-in, because reasoning judges can spend
+# all of it thinking and never reach the JSON
+JUDGE_MAX_TOKENS = 150
+
+# Input caps per judged item, so one runaway response can't blow up the
+# judge's prompt (and its cost and latency)
+JUDGE_MAX_RESPONSE_CHARS = 8000
+JUDGE_MAX_IDEAL_CHARS = 2000
+TRUNCATION_MARKER = "\n...[truncated]"
+
+
+JUDGE_PROMPT_BATCH = JUDGE_RUBRIC + """\
+Several responses follow, each under its own === ITEM n === header. Score each
+one independently, as if it were the only item.
+
+Return ONLY a JSON array with one object per item (no markdown fences, no extra text):
+[{"id": <n>, "score": <1-5>, "rationale": "<1-2 sentence explanation>"}, ...]
+"""
+
+
+def _truncate(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit] + TRUNCATION_MARKER
+
+
+def _item_sections(prompt_meta: dict, response: str, auto_checks: dict) -> list[str]:
+    """Prompt, ideal, criteria, flags and response sections for one judged item."""
     parts = [
-        JUDGE_PROMPT,
         "\n--- ORIGINAL PROMPT ---",
         prompt_meta.get("prompt", ""),
         "\n--- IDEAL ANSWER ---",
-        prompt_meta.get("ideal", ""),
+        _truncate(prompt_meta.get("ideal", ""), JUDGE_MAX_IDEAL_CHARS),
         "\n--- CRITERIA ---",
     ]
 
@@ -54,14 +99,27 @@ def build_judge_prompt(prompt_meta: dict, response: str, auto_checks: dict) -> s
             parts.append(f"- {f}")
 
     parts.append("\n--- RESPONSE TO EVALUATE ---")
-    parts.append(response)
+    parts.append(_truncate(response, JUDGE_MAX_RESPONSE_CHARS))
+    return parts
+
+
+def build_judge_prompt(prompt_meta: dict, response: str, auto_checks: dict) -> str:
+    """Assemble the user message for the judge LLM call."""
+    return "\n".join([JUDGE_PROMPT, *_item_sections(prompt_meta, response, auto_checks)])
+
 
+def build_batch_judge_prompt(batch) -> str:
+    """One judge message covering several (prompt_meta, response, auto_checks) items."""
+    parts = [JUDGE_PROMPT_BATCH]
+    for i, (prompt_meta, response, auto_checks) in enumerate(batch):
+        parts.append(f"\n=== ITEM {i} ===")
+        parts.extend(_item_sections(prompt_meta, response, auto_checks))
     return "\n".join(parts)
 
 
-def _extract_json_object(text: str) -> str | None:
-    """Find the outermost {...} in text, handling nested braces."""
-    start = text.find("{")
+def _extract_balanced(text: str, opener: str, closer: str) -> str | None:
+    """Find the outermost opener...closer span in text, skipping JSON strings."""
+    start = text.find(opener)
     if start == -1:
         return None
     depth = 0
@@ -80,15 +138,41 @@ def _extract_json_object(text: str) -> str | None:
             continue
         if in_string:
             continue
-        if c == "{":
+        if c == opener:
             depth += 1
-        elif c == "}":
+        elif c == closer:
             depth -= 1
             if depth == 0:
                 return text[start:i + 1]
     return None
 
 
+def _decoded_span(text: str, opener: str) -> str | None:
+    """The JSON value starting at the first opener, if it parses cleanly.
+
+    json's C scanner finds where the value ends, so trailing prose is fine
+    and well-formed replies never reach the per-character loop.
+    """
+    start = text.find(opener)
+    if start == -1:
+        return None
+    try:
+        _, end = _DECODER.raw_decode(text, start)
+    except ValueError:
+        return None
+    return text[start:end]
+
+
+def _extract_json_object(text: str) -> str | None:
+    """Find the outermost {...} in text, handling nested braces."""
+    return _decoded_span(text, "{") or _extract_balanced(text, "{", "}")
+
+
+def _extract_json_array(text: str) -> str | None:
+    """Find the outermost [...] in text, handling nested brackets."""
+    return _decoded_span(text, "[") or _extract_balanced(text, "[", "]")
+
+
 def parse_judge_response(raw: str) -> dict:
     """Extract score and rationale JSON from judge output.
 
@@ -97,13 +181,21 @@ def parse_judge_response(raw: str) -> dict:
     """
     text = raw.strip()
 
+    # Most judges return bare JSON as instructed; skip the scan for those
+    try:
+        parsed = jsonio.loads(text)
+    except (json.JSONDecodeError, ValueError):
+        parsed = None
+    if isinstance(parsed, dict):
+        return _checked_score(parsed)
+
     # Try to find JSON object directly first (handles backticks inside values)
     extracted = _extract_json_object(text)
     if extracted:
         text = extracted
     else:
         # Fall back to stripping markdown code fences wrapping the response
-        fence_match = re.search(r"```(?:json)?\s*(.*?)\s*```", text, re.DOTALL)
+        fence_match = _FENCE_RE.search(text)
         if fence_match:
             text = fence_match.group(1).strip()
             extracted = _extract_json_object(text)
@@ -111,10 +203,14 @@ def parse_judge_response(raw: str) -> dict:
                 text = extracted
 
     try:
-        parsed = json.loads(text)
+        parsed = jsonio.loads(text)
     except (json.JSONDecodeError, ValueError):
         return {"score": None, "rationale": f"Failed to parse judge response: {raw[:200]}"}
 
+    return _checked_score(parsed)
+
+
+def _checked_score(parsed: dict) -> dict:
     score = parsed.get("score")
     rationale = parsed.get("rationale", "")
 
@@ -124,17 +220,94 @@ def parse_judge_response(raw: str) -> dict:
     return {"score": score, "rationale": rationale}
 
 
+def parse_batch_judge_response(raw: str, n: int) -> list[dict]:
+    """Extract per-item scores from batch judge output (a JSON array of n objects).
+
+    Items are matched by "id" when the judge gives them, otherwise by position.
+    The ids must be exactly 0..n-1 in any order; a reply numbered 1..n is
+    shifted back, and any other set (gaps, duplicates, negative or out of
+    range, non-integers) fails the whole batch rather than risk scoring the
+    wrong response. Without ids, items missing from the end or with invalid
+    scores get score None, like a failed single parse.
+    """
+    extracted = _extract_json_array(raw.strip())
+    try:
+        parsed = jsonio.loads(extracted) if extracted else None
+    except (json.JSONDecodeError, ValueError):
+        parsed = None
+    if not isinstance(parsed, list):
+        return [{"score": None, "rationale": f"Failed to parse judge response: {raw[:200]}"} for _ in range(n)]
+
+    items = [item for item in parsed if isinstance(item, dict)]
+    ids = _batch_ids([item.get("id") for item in items], n)
+    if ids is None:
+        return [{"score": None, "rationale": f"Batch judge ids don't match items 0-{n - 1}: {raw[:200]}"}
+                for _ in range(n)]
+
+    results = [None] * n
+    for i, item in zip(ids, items):
+        results[i] = _checked_score(item)
+    return [r or {"score": None, "rationale": "Missing from batch judge response"} for r in results]
+
+
+def _batch_ids(ids: list, n: int) -> list[int] | None:
+    """0-based slot for each returned id, or None if they can't be trusted."""
+    if all(i is None for i in ids):
+        return list(range(min(len(ids), n)))
+    # bool is an int subclass, but true/false isn't an item id
+    if any(type(i) is not int for i in ids):
+        return None
+    if sorted(ids) == list(range(n)):
+        return ids
+    if sorted(ids) == list(range(1, n + 1)):
+        return [i - 1 for i in ids]
+    return None
+
+
+def _with_defaults(judge_params: dict, n_items: int = 1) -> dict:
+    """judge_params as sent to the provider.
+
+    short_output: true stands in for a max_tokens of JUDGE_MAX_TOKENS per
+    item; without it (or an explicit max_tokens) the provider's own output
+    limit applies. Temperature is only sent when judge_params sets it, since
+    some reasoning models reject it.
+    """
+    params = dict(judge_params)
+    if params.pop("short_output", False):
+        params.setdefault("max_tokens", JUDGE_MAX_TOKENS * n_items)
+    return params
+
+
+def auto_judgement(response: str) -> dict | None:
+    """Score an empty or whitespace-only response locally, without a judge call.
+
+    Returns a judge_response()-style dict, or None if the response needs a
+    real judge. Only used for judges configured with skip_empty: true.
+    """
+    if not response or not response.strip():
+        return {"judge_score": 1, "judge_rationale": "Empty response (auto)"}
+    return None
+
+
 def judge_response(judge_provider, judge_params: dict, prompt_meta: dict,
                    response: str, auto_checks: dict) -> dict:
     """Score a response using an LLM judge.
 
+    Transient API errors (429, 5xx, connection) are retried with jittered
+    backoff, and a reply that doesn't parse to a valid score gets one retry
+    with a stricter JSON-only reminder.
     Returns {"judge_score": int|None, "judge_rationale": str}.
     Never raises - catches all exceptions so a judge failure won't crash the eval.
     """
     try:
         user_msg = build_judge_prompt(prompt_meta, response, auto_checks)
-        content, _usage = judge_provider.complete(user_msg, judge_params)
+        params = _with_defaults(judge_params)
+        content, _usage = retry(lambda: judge_provider.complete(user_msg, params))
         result = parse_judge_response(content)
+        if result["score"] is None:
+            retry_msg = user_msg + JUDGE_JSON_REMINDER
+            content, _usage = retry(lambda: judge_provider.complete(retry_msg, params))
+            result = parse_judge_response(content)
         return {
             "judge_score": result["score"],
             "judge_rationale": result["rationale"],
@@ -144,3 +317,129 @@ def judge_response(judge_provider, judge_params: dict, prompt_meta: dict,
             "judge_score": None,
             "judge_rationale": f"Judge error: {e}",
         }
+
+
+async def ajudge_response(judge_provider, judge_params: dict, prompt_meta: dict,
+                          response: str, auto_checks: dict) -> dict:
+    """Async variant of judge_response(); same contract, never raises."""
+    async def complete(msg, params):
+        if isinstance(judge_provider, LimitedProvider):
+            return await judge_provider.acomplete(msg, params)  # retries on its own
+        return await aretry(lambda: judge_provider.acomplete(msg, params))
+
+    try:
+        user_msg = build_judge_prompt(prompt_meta, response, auto_checks)
+        params = _with_defaults(judge_params)
+        content, _usage = await complete(user_msg, params)
+        result = parse_judge_response(content)
+        if result["score"] is None:
+            content, _usage = await complete(user_msg + JUDGE_JSON_REMINDER, params)
+            result = parse_judge_response(content)
+        return {
+            "judge_score": result["score"],
+            "judge_rationale": result["rationale"],
+        }
+    except Exception as e:
+        return {
+            "judge_score": None,
+            "judge_rationale": f"Judge error: {e}",
+        }
+
+
+async def ajudge_batch(judge_provider, judge_params: dict, batch) -> list[dict]:
+    """Score several (prompt_meta, response, auto_checks) items with one judge call.
+
+    Returns one ajudge_response()-style dict per item, in order. Never raises.
+    """
+    # JSON modes only allow a top-level object, and a batch reply is an array
+    judge_params = _with_defaults({k: v for k, v in judge_params.items() if k != "json_mode"}, len(batch))
+    try:
+        content, _usage = await judge_provider.acomplete(build_batch_judge_prompt(batch), judge_params)
+        results = parse_batch_judge_response(content, len(batch))
+    except Exception as e:
+        return [{"judge_score": None, "judge_rationale": f"Judge error: {e}"} for _ in batch]
+    return [{"judge_score": r["score"], "judge_rationale": r["rationale"]} for r in results]
+
+
+def judge_summary(judge_scores: dict) -> dict:
+    """Aggregate fields for a run's judge_scores ({judge name: {"score": ...}}).
+
+    The median is less swayed than the mean by one outlying judge.
+    """
+    valid = [v["score"] for v in judge_scores.values() if isinstance(v, dict) and v.get("score") is not None]
+    return {
+        "judge_score_avg": round(sum(valid) / len(valid), 2) if valid else None,
+        "judge_score_median": statistics.median(valid) if valid else None,
+        "judge_count": len(valid),
+    }
+
+
+async def judge_ensemble(judges: dict, prompt_meta: dict, response: str, auto_checks: dict,
+                         judge=None) -> dict:
+    """Score one response with several judges at once.
+
+    judges maps judge name -> (judge_provider, judge_params). The calls run
+    concurrently, so wall-clock time is that of the slowest judge. judge, if
+    given, replaces ajudge_response and is called as judge(name, provider,
+    params, prompt_meta, response, auto_checks), e.g. to add caching. Returns
+    {"judge_scores": {name: {"score", "rationale"}}} plus judge_summary().
+    A judge that raises gets a failed score; the others still count.
+    """
+    if judge is None:
+        async def judge(_name, *args):
+            return await ajudge_response(*args)
+
+    async def one(name, provider, params):
+        try:
+            return await judge(name, provider, params, prompt_meta, response, auto_checks)
+        except Exception as e:
+            return {"judge_score": None, "judge_rationale": f"Judge error: {e}"}
+
+    results = await asyncio.gather(*(
+        one(name, provider, params) for name, (provider, params) in judges.items()
+    ))
+    judge_scores = {
+        name: {"score": jr["judge_score"], "rationale": jr["judge_rationale"]}
+        for name, jr in zip(judges, results)
+    }
+    return {"judge_scores": judge_scores, **judge_summary(judge_scores)}
+
+
+async def judge_all_async(items, concurrency: int = 32, judge=None, on_done=None) -> list:
+    """Run many judgements concurrently, at most `concurrency` in flight.
+
+    items are argument tuples for judge, which defaults to ajudge_response, i.e.
+    (judge_provider, judge_params, prompt_meta, response, auto_checks). Pass a
+    wrapper with its own signature (e.g. the cached variant) to change that.
+    on_done(index, result) is called as each judgement finishes, for progress.
+    Results come back in item order; an exception raised by judge is returned
+    in its slot instead of cancelling the rest.
+    """
+    judge = judge or ajudge_response
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i, item):
+        async with sem:
+            try:
+                result = await judge(*item)
+            except Exception as e:
+                result = e
+        if on_done is not None:
+            on_done(i, result)
+        return result
+
+    return await asyncio.gather(*(one(i, item) for i, item in enumerate(items)))
+
+
+_PREFLIGHT_META = {"prompt": "What is 2 + 2?", "ideal": "4", "criteria": ["States the correct sum"]}
+
+
+def judge_preflight(judge_provider, judge_params: dict):
+    """Score one tiny known-answer item to check the judge is usable.
+
+    Catches a wrong key, base_url or model before a long run is spent on
+    calls that can only fail. Raises RuntimeError if no valid score comes back.
+    """
+    jr = judge_response(judge_provider, judge_params, _PREFLIGHT_META, "4", {"flags": []})
+    if jr["judge_score"] is None:
+        raise RuntimeError(f"Judge preflight failed: {jr['judge_rationale']}")
@@ -1,5 +1,6 @@
 """API providers for different LLM services."""
 
+import asyncio
 import os
 import re
 import json
@@ -40,17 +41,105 @@ class ModelResponse:
 
 
 class Provider(ABC):
+    # True when batch_complete() uses a native batch API rather than one call per prompt
+    supports_batch = False
+
     @abstractmethod
     def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
         """Returns (content, usage_dict)."""
         ...
 
+    def batch_complete(self, prompts: list[str], params: dict) -> list:
+        """Complete several prompts. Returns one (content, usage) per prompt, in
+        order, or the Exception raised for that prompt."""
+        results = []
+        for prompt in prompts:
+            try:
+                results.append(self.complete(prompt, params))
+            except Exception as e:
+                results.append(e)
+        return results
 
-class AnthropicProvider(Provider):
-    def __init__(self, model: str, api_key: str):
+    async def acomplete(self, prompt: str, params: dict) -> tuple[str, dict]:
+        """Async variant of complete(). Falls back to a worker thread."""
+        return await asyncio.to_thread(self.complete, prompt, params)
+
+    def close(self):
+        """Release any connections held by the provider."""
+
+    async def aclose(self):
+        """Release any async resources held by the provider."""
+
+
+def _h2_installed() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# One pooled client per provider is reused for every call in a run, so
+# connections (and their TLS sessions) stay alive between prompts.
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+HTTP2 = _h2_installed()
+
+
+class HTTPProvider(Provider):
+    """Base for providers that talk to a JSON-over-HTTP API via httpx.
+
+    Subclasses describe the request with _request() and decode the reply
+    with _parse(); the sync and async clients share both. HTTP/2 is used
+    when the optional h2 package is installed.
+    """
+
+    def __init__(self, model: str, **client_kwargs):
         self.model = model
-        self.api_key = api_key
-        self.client = httpx.Client(
+        client_kwargs.setdefault("limits", HTTP_LIMITS)
+        client_kwargs.setdefault("http2", HTTP2)
+        self._client_kwargs = client_kwargs
+        self.client = httpx.Client(**client_kwargs)
+        self._aclient = None
+
+    @abstractmethod
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
+        """Returns (url, keyword args for client.post)."""
+        ...
+
+    @abstractmethod
+    def _parse(self, data: dict) -> tuple[str, dict]:
+        """Returns (content, usage_dict) from the decoded JSON body."""
+        ...
+
+    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+        url, kwargs = self._request(prompt, params)
+        resp = self.client.post(url, **kwargs)
+        resp.raise_for_status()
+        return self._parse(resp.json())
+
+    async def acomplete(self, prompt: str, params: dict) -> tuple[str, dict]:
+        # The async client is bound to the running event loop, so it is
+        # created lazily and dropped again in aclose().
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(**self._client_kwargs)
+        url, kwargs = self._request(prompt, params)
+        resp = await self._aclient.post(url, **kwargs)
+        resp.raise_for_status()
+        return self._parse(resp.json())
+
+    def close(self):
+        self.client.close()
+
+    async def aclose(self):
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+
+class AnthropicProvider(HTTPProvider):
+    def __init__(self, model: str, api_key: str):
+        super().__init__(
+            model,
             base_url="https://api.anthropic.com",
             headers={
                 "x-api-key": api_key,
@@ -59,16 +148,18 @@ class AnthropicProvider(Provider):
             },
             timeout=120,
         )
+        self.api_key = api_key
 
-    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
+        # The Messages API has no JSON mode; the prompt has to ask for JSON
         body = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
-            **params,
+            **{k: v for k, v in params.items() if k != "json_mode"},
         }
-        resp = self.client.post("/v1/messages", json=body)
-        resp.raise_for_status()
-        data = resp.json()
+        return "/v1/messages", {"json": body}
+
+    def _parse(self, data: dict) -> tuple[str, dict]:
         try:
             content = "".join(b["text"] for b in data["content"] if b["type"] == "text")
         except (KeyError, IndexError, TypeError) as e:
@@ -80,19 +171,28 @@ class AnthropicProvider(Provider):
         return content, usage
 
 
-class OpenAIProvider(Provider):
-    def __init__(self, model: str, api_key: str, base_url: str = "https://api.openai.com/v1"):
-        self.model = model
-        self.client = httpx.Client(
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+
+
+class OpenAIProvider(HTTPProvider):
+    BATCH_POLL_INTERVAL = 30
+    # Give up polling after the 24h completion window, then fall back to live calls
+    BATCH_MAX_WAIT = 24 * 3600
+    BATCH_DONE = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, model: str, api_key: str, base_url: str = OPENAI_BASE_URL):
+        # Only OpenAI itself has the Batch API; compatible servers don't
+        self.supports_batch = base_url.rstrip("/") == OPENAI_BASE_URL
+        # No client-wide Content-Type: json= sets it per request, and the
+        # batch file upload needs multipart.
+        super().__init__(
+            model,
             base_url=base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=300,
         )
 
-    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
         p = dict(params)
         # OpenAI reasoning models (o-series, gpt-5) don't support temperature
         if self.model.startswith(("o1", "o3", "o4", "gpt-5.3")) or self.model == "gpt-5":
@@ -100,14 +200,16 @@ class OpenAIProvider(Provider):
         # Newer OpenAI models require max_completion_tokens instead of max_tokens
         if "max_tokens" in p and self.model.startswith(("gpt-5", "gpt-4.1", "o1", "o3", "o4")):
             p["max_completion_tokens"] = p.pop("max_tokens")
+        if p.pop("json_mode", False):
+            p["response_format"] = {"type": "json_object"}
         body = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
             **p,
         }
-        resp = self.client.post("/chat/completions", json=body)
-        resp.raise_for_status()
-        data = resp.json()
+        return "/chat/completions", {"json": body}
+
+    def _parse(self, data: dict) -> tuple[str, dict]:
         try:
             content = data["choices"][0]["message"]["content"]
         except (KeyError, IndexError, TypeError) as e:
@@ -118,14 +220,89 @@ class OpenAIProvider(Provider):
         }
         return content, usage
 
-
-class GoogleProvider(Provider):
+    def batch_complete(self, prompts: list[str], params: dict) -> list:
+        """Run prompts through the Batch API (/files + /batches), polling until done.
+
+        Batch jobs are billed at a discount and don't count against the
+        per-minute rate limits, but can take minutes to hours to finish. If the
+        job isn't done within BATCH_MAX_WAIT it is cancelled and the prompts
+        are sent one by one; prompts an expired job left unfinished are too.
+        Endpoints without the Batch API always go one by one.
+        """
+        if not self.supports_batch:
+            return super().batch_complete(prompts, params)
+        lines = []
+        for i, prompt in enumerate(prompts):
+            path, kwargs = self._request(prompt, params)
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": f"/v1{path}",
+                "body": kwargs["json"],
+            }))
+        resp = self.client.post(
+            "/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", "\n".join(lines).encode(), "application/jsonl")},
+        )
+        resp.raise_for_status()
+        resp = self.client.post("/batches", json={
+            "input_file_id": resp.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        resp.raise_for_status()
+        batch = resp.json()
+
+        deadline = time.monotonic() + self.BATCH_MAX_WAIT
+        while batch["status"] not in self.BATCH_DONE:
+            if time.monotonic() >= deadline:
+                try:
+                    self.client.post(f"/batches/{batch['id']}/cancel")
+                except httpx.HTTPError:
+                    pass
+                return super().batch_complete(prompts, params)
+            time.sleep(self.BATCH_POLL_INTERVAL)
+            resp = self.client.get(f"/batches/{batch['id']}")
+            resp.raise_for_status()
+            batch = resp.json()
+
+        results = [RuntimeError(f"Batch {batch['id']} {batch['status']}: no result")] * len(prompts)
+        answered = set()
+        for file_key in ("output_file_id", "error_file_id"):
+            if not batch.get(file_key):
+                continue
+            resp = self.client.get(f"/files/{batch[file_key]}/content")
+            resp.raise_for_status()
+            for line in resp.text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                i = int(item["custom_id"])
+                answered.add(i)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    detail = item.get("error") or response.get("body", {}).get("error")
+                    results[i] = RuntimeError(f"Batch request failed: {detail}")
+                    continue
+                try:
+                    results[i] = self._parse(response["body"])
+                except ValueError as e:
+                    results[i] = e
+        if batch["status"] == "expired":
+            missing = [i for i in range(len(prompts)) if i not in answered]
+            retried = super().batch_complete([prompts[i] for i in missing], params)
+            for i, result in zip(missing, retried):
+                results[i] = result
+        return results
+
+
+class GoogleProvider(HTTPProvider):
     def __init__(self, model: str, api_key: str):
-        self.model = model
+        super().__init__(model, timeout=120)
         self.api_key = api_key
-        self.client = httpx.Client(timeout=120)
 
-    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
         body = {
             "contents": [{"parts": [{"text": prompt}]}],
@@ -134,9 +311,11 @@ class GoogleProvider(Provider):
                 "temperature": params.get("temperature", 0),
             },
         }
-        resp = self.client.post(url, json=body, params={"key": self.api_key})
-        resp.raise_for_status()
-        data = resp.json()
+        if params.get("json_mode"):
+            body["generationConfig"]["responseMimeType"] = "application/json"
+        return url, {"json": body, "params": {"key": self.api_key}}
+
+    def _parse(self, data: dict) -> tuple[str, dict]:
         try:
             content = data["candidates"][0]["content"]["parts"][0]["text"]
         except (KeyError, IndexError, TypeError) as e:
@@ -149,24 +328,27 @@ class GoogleProvider(Provider):
         return content, usage
 
 
-class OllamaProvider(Provider):
+class OllamaProvider(HTTPProvider):
     def __init__(self, model: str, base_url: str = "http://localhost:11434/v1"):
-        self.model = model
-        self.client = httpx.Client(
+        super().__init__(
+            model,
             base_url=base_url,
             headers={"Content-Type": "application/json"},
             timeout=600,
         )
 
-    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
+        p = dict(params)
+        if p.pop("json_mode", False):
+            p["response_format"] = {"type": "json_object"}
         body = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
-            **params,
+            **p,
         }
-        resp = self.client.post("/chat/completions", json=body)
-        resp.raise_for_status()
-        data = resp.json()
+        return "/chat/completions", {"json": body}
+
+    def _parse(self, data: dict) -> tuple[str, dict]:
         try:
             message = data["choices"][0]["message"]
             content = message.get("content") or ""
@@ -184,10 +366,10 @@ class OllamaProvider(Provider):
         return content, usage
 
 
-class CohereProvider(Provider):
+class CohereProvider(HTTPProvider):
     def __init__(self, model: str, api_key: str):
-        self.model = model
-        self.client = httpx.Client(
+        super().__init__(
+            model,
             base_url="https://api.cohere.com",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -196,7 +378,7 @@ class CohereProvider(Provider):
             timeout=120,
         )
 
-    def complete(self, prompt: str, params: dict) -> tuple[str, dict]:
+    def _request(self, prompt: str, params: dict) -> tuple[str, dict]:
         body = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
@@ -206,9 +388,11 @@ class CohereProvider(Provider):
             body["max_tokens"] = params["max_tokens"]
         if "temperature" in params:
             body["temperature"] = params["temperature"]
-        resp = self.client.post("/v2/chat", json=body)
-        resp.raise_for_status()
-        data = resp.json()
+        if params.get("json_mode"):
+            body["response_format"] = {"type": "json_object"}
+        return "/v2/chat", {"json": body}
+
+    def _parse(self, data: dict) -> tuple[str, dict]:
         try:
             content = data["message"]["content"][0]["text"]
         except (KeyError, IndexError, TypeError) as e:
@@ -269,7 +453,7 @@ def get_provider(config: dict) -> Provider:
     if provider_type == "anthropic":
         return AnthropicProvider(config["model"], api_key)
     elif provider_type in ("openai", "openai_compatible"):
-        base_url = config.get("base_url", "https://api.openai.com/v1")
+        base_url = config.get("base_url", OPENAI_BASE_URL)
         return OpenAIProvider(config["model"], api_key, base_url)
     elif provider_type == "google":
         return GoogleProvider(config["model"], api_key)
@@ -0,0 +1,140 @@
+"""Client-side rate limiting and retry for concurrent provider calls.
+
+A token bucket spaces requests to a target requests-per-minute across all
+workers (a second bucket can meter estimated tokens-per-minute), and
+transient failures (429, 5xx, connection errors) are retried with jittered
+exponential backoff, honouring Retry-After when the API sends one.
+Bedrock's botocore errors get the same treatment when boto3 is installed.
+"""
+
+import asyncio
+import random
+import time
+
+import httpx
+
+try:
+    from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+    BOTO_TRANSPORT_ERRORS = (BotoConnectionError, HTTPClientError)
+except ImportError:
+    ClientError = None
+    BOTO_TRANSPORT_ERRORS = ()
+
+
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504, 529}
+# Bedrock error codes worth retrying, for responses without an HTTP status
+BOTO_RETRY_CODES = {"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException",
+                    "InternalServerException", "ModelNotReadyException", "ModelTimeoutException"}
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+
+class AsyncTokenBucket:
+    """Async token bucket: `async with bucket:` waits for a free request slot."""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1):
+        # More than the bucket holds can never be free; take a full bucket instead
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def estimate_tokens(prompt: str, params: dict) -> int:
+    """Rough token cost of a call: ~4 characters per input token plus the output cap."""
+    return len(prompt) // 4 + params.get("max_tokens", 0)
+
+
+def retry_delay(exc: Exception, attempt: int) -> float | None:
+    """Seconds to wait before retrying after exc, or None if it isn't retryable."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        if exc.response.status_code not in RETRY_STATUSES:
+            return None
+        retry_after = exc.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), BACKOFF_CAP)
+            except ValueError:
+                pass  # HTTP-date form; fall through to backoff
+    elif ClientError is not None and isinstance(exc, ClientError):
+        error = exc.response.get("Error", {})
+        status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status not in RETRY_STATUSES and error.get("Code") not in BOTO_RETRY_CODES:
+            return None
+    elif not isinstance(exc, (httpx.TransportError, *BOTO_TRANSPORT_ERRORS)):
+        return None
+    # Full jitter so concurrent workers don't retry in lockstep
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+async def aretry(call, attempts: int = MAX_ATTEMPTS):
+    """Await call() and retry transient failures. call is a zero-arg coroutine function."""
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except Exception as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt == attempts - 1:
+                raise
+            await asyncio.sleep(delay)
+
+
+def retry(call, attempts: int = MAX_ATTEMPTS):
+    """Synchronous counterpart of aretry(). call is a zero-arg function."""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt == attempts - 1:
+                raise
+            time.sleep(delay)
+
+
+class LimitedProvider:
+    """Wraps a provider so acomplete() waits on a limiter and retries transient errors.
+
+    token_limiter, if given, is a bucket sized in tokens per minute; each
+    call (and each retry) draws estimate_tokens() from it.
+    Everything else (complete, batch_complete, close, ...) passes through.
+    """
+
+    def __init__(self, provider, limiter: AsyncTokenBucket | None = None, attempts: int = MAX_ATTEMPTS,
+                 token_limiter: AsyncTokenBucket | None = None):
+        self.provider = provider
+        self.limiter = limiter
+        self.attempts = attempts
+        self.token_limiter = token_limiter
+
+    async def acomplete(self, prompt: str, params: dict) -> tuple[str, dict]:
+        async def call():
+            if self.token_limiter is not None:
+                await self.token_limiter.acquire(estimate_tokens(prompt, params))
+            if self.limiter is None:
+                return await self.provider.acomplete(prompt, params)
+            async with self.limiter:
+                return await self.provider.acomplete(prompt, params)
+        return await aretry(call, self.attempts)
+
+    def __getattr__(self, name):
+        return getattr(self.provider, name)
@@ -0,0 +1,104 @@
+"""Tests for scripts/cache.py - key stability, atomic writes, cached calls."""
+
+import asyncio
+import pytest
+from tests.conftest import MockProvider
+from scripts.cache import (
+    cache_key,
+    cache_get,
+    cache_put,
+    cached_acomplete,
+    cached_ajudge_response,
+)
+
+
+class TestCacheKey:
+    def test_stable_across_dict_order(self):
+        assert cache_key("m", {"a": 1, "b": 2}) == cache_key("m", {"b": 2, "a": 1})
+
+    def test_differs_on_params(self):
+        assert cache_key("m", "p", {"temperature": 0}) != cache_key("m", "p", {"temperature": 1})
+
+
+class TestCacheStore:
+    def test_roundtrip(self, tmp_path):
+        cache_put("abc", {"content": "x"}, str(tmp_path))
+        assert cache_get("abc", str(tmp_path)) == {"content": "x"}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_miss(self, tmp_path):
+        assert cache_get("missing", str(tmp_path)) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json")
+        assert cache_get("bad", str(tmp_path)) is None
+
+    def test_repeat_get_served_from_memory(self, tmp_path):
+        cache_put("abc", {"content": "x"}, str(tmp_path))
+        (tmp_path / "abc.json").unlink()
+        hit = cache_get("abc", str(tmp_path))
+        assert hit == {"content": "x"}
+        hit["content"] = "mutated"
+        assert cache_get("abc", str(tmp_path)) == {"content": "x"}
+
+
+class TestCachedComplete:
+    def test_second_call_hits_cache(self, tmp_path):
+        provider = MockProvider(response="Hello")
+        first = asyncio.run(cached_acomplete(provider, "p", {"temperature": 0}, "m", str(tmp_path)))
+        second = asyncio.run(cached_acomplete(provider, "p", {"temperature": 0}, "m", str(tmp_path)))
+        assert first[0] == second[0] == "Hello"
+        assert first[3] is False
+        assert second[3] is True
+        assert second[2] == first[2]  # original latency preserved
+        assert len(provider.calls) == 1
+
+    def test_endpoint_part_of_key(self, tmp_path):
+        from scripts.cache import endpoint_id
+        provider = MockProvider(response="Hello")
+        for base_url in ("https://openrouter.ai/api/v1", "https://api.openai.com/v1"):
+            cfg = {"provider": "openai_compatible", "model": "m", "base_url": base_url}
+            asyncio.run(cached_acomplete(provider, "p", {}, "m", str(tmp_path), endpoint_id(cfg)))
+        assert len(provider.calls) == 2
+
+    def test_errors_not_cached(self, tmp_path):
+        provider = MockProvider(error=RuntimeError("boom"))
+        with pytest.raises(RuntimeError):
+            asyncio.run(cached_acomplete(provider, "p", {}, "m", str(tmp_path)))
+        assert not list(tmp_path.glob("*.json"))
+
+
+class TestCachedJudge:
+    def test_successful_judgement_cached(self, tmp_path, mock_judge_provider, sample_prompt):
+        auto = {"flags": []}
+        for _ in range(2):
+            jr = asyncio.run(cached_ajudge_response(
+                "j", mock_judge_provider, {}, sample_prompt, "resp", auto, str(tmp_path)))
+            assert jr["judge_score"] == 4
+        assert len(mock_judge_provider.calls) == 1
+
+    def test_failed_judgement_not_cached(self, tmp_path, sample_prompt):
+        provider = MockProvider(response="not json")
+        for _ in range(2):
+            asyncio.run(cached_ajudge_response(
+                "j", provider, {}, sample_prompt, "resp", {"flags": []}, str(tmp_path)))
+        assert len(provider.calls) == 4  # each judgement retries the unparseable reply once
+
+    def test_auto_checks_part_of_key(self, tmp_path, mock_judge_provider, sample_prompt):
+        for flags in ([], ["EMPTY"]):
+            asyncio.run(cached_ajudge_response(
+                "j", mock_judge_provider, {}, sample_prompt, "resp", {"flags": flags}, str(tmp_path)))
+        assert len(mock_judge_provider.calls) == 2
+
+    def test_prompt_text_part_of_key(self, tmp_path, mock_judge_provider, sample_prompt):
+        auto = {"flags": []}
+        for ideal in (sample_prompt["ideal"], "A different ideal answer"):
+            asyncio.run(cached_ajudge_response(
+                "j", mock_judge_provider, {}, {**sample_prompt, "ideal": ideal}, "resp", auto, str(tmp_path)))
+        assert len(mock_judge_provider.calls) == 2
+
+    def test_judge_template_part_of_key(self, monkeypatch, sample_prompt):
+        from scripts import cache
+        before = cache.judge_cache_key("j", {}, sample_prompt, "resp", {})
+        monkeypatch.setattr(cache, "_JUDGE_TEMPLATE", "edited")
+        assert cache.judge_cache_key("j", {}, sample_prompt, "resp", {}) != before
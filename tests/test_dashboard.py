@@ -59,6 +59,172 @@ class TestLatestRun:
         assert latest_run({"runs": {}}, "C01") == {}
 
 
+class TestScoreColor:
+    @pytest.mark.parametrize("score,expected", [
+        (None, ""), (1, "score-1"), (1.49, "score-1"), (1.5, "score-2"), (2.5, "score-3"),
+        (3.49, "score-3"), (3.5, "score-4"), (4.5, "score-5"), (5, "score-5"),
+    ])
+    def test_thresholds(self, score, expected):
+        from scripts.dashboard import _score_color
+        assert _score_color(score) == expected
+
+
+class TestRowMemo:
+    def test_unchanged_rows_reuse_html(self, basic_prompts):
+        from scripts.dashboard import _category_row, _category_row_html, _leaderboard_row, _leaderboard_row_html
+        models = {"m1": {"runs": {"C01": [_make_run(judge_scores={"j": _make_judge(4)})]}}}
+        entry = compute_stats(models, basic_prompts)["leaderboard"][0]
+        first = _leaderboard_row(0, entry), _category_row("coding", [entry])
+        hits = _leaderboard_row_html.cache_info().hits, _category_row_html.cache_info().hits
+        again = compute_stats(models, basic_prompts)["leaderboard"][0]
+        assert (_leaderboard_row(0, again), _category_row("coding", [again])) == first
+        assert _leaderboard_row_html.cache_info().hits == hits[0] + 1
+        assert _category_row_html.cache_info().hits == hits[1] + 1
+
+
+class TestPageOutput:
+    def test_minify_css(self):
+        from scripts.dashboard import _minify_css
+        css = """
+  .a > .b {
+    font-family: 'Segoe UI', sans-serif;
+    width: calc(100% - 2rem);
+  }"""
+        assert _minify_css(css) == ".a>.b{font-family:'Segoe UI',sans-serif;width:calc(100% - 2rem);}"
+
+    def test_gzip_copy(self, tmp_path):
+        import gzip
+        from scripts.dashboard import _write_page
+        _write_page(str(tmp_path / "plain.html"), "<html>x</html>")
+        _write_page(str(tmp_path / "index.html"), "<html>é</html>", gzip_copy=True)
+        assert not (tmp_path / "plain.html.gz").exists()
+        assert gzip.decompress((tmp_path / "index.html.gz").read_bytes()).decode() == "<html>é</html>"
+
+
+class TestDataScript:
+    def test_inline_by_default(self):
+        from scripts.dashboard import _data_script
+        start, end = _data_script({"a": [1, 2], "é": "ü"})
+        assert start == 'const DATA = {"a":[1,2],"é":"ü"};'
+        assert end == ""
+
+    def test_compressed_round_trip(self, basic_prompts):
+        import base64
+        import gzip
+        import re
+        from scripts.dashboard import _data_script, generate_html
+        stats = compute_stats({"m1": {"runs": {"C01": [_make_run(judge_scores={"j": _make_judge(4)})]}}}, basic_prompts)
+        start, end = _data_script(stats, compress=True)
+        blob = re.search(r'atob\("([A-Za-z0-9+/=]+)"\)', start).group(1)
+        assert json.loads(gzip.decompress(base64.b64decode(blob))) == json.loads(json.dumps(stats))
+        assert start.startswith("(async () => {") and end.startswith("})();")
+        page = generate_html(stats, compress_data=True)
+        assert "DecompressionStream" in page and "const DATA = {" not in page
+
+    def test_external_data_fetched_with_page_extras(self):
+        from scripts.dashboard import _data_script
+        start, end = _data_script({"a": 1}, compress=True, data_url="data.json", extra={"b": [2]})
+        assert 'await fetch("data.json")' in start
+        assert 'Object.assign(DATA, {"b":[2]});' in start
+        assert '"a"' not in start and end.startswith("})();")
+
+
+class TestCategoryChartEntries:
+    def test_sorted_best_first_without_unscored(self):
+        from scripts.dashboard import _category_chart_entries
+        lb = [
+            {"name": "a", "cat_composite": {"coding": 0.6, "writing": None}},
+            {"name": "b", "cat_composite": {"coding": 0.9}},
+            {"name": "c"},
+        ]
+        entries = _category_chart_entries(lb, ["coding", "writing"])
+        assert entries == {
+            "coding": [{"name": "b", "score": 0.9, "color": "#4ade80"},
+                       {"name": "a", "score": 0.6, "color": "#ef4444"}],
+            "writing": [],
+        }
+
+    def test_page_renders_charts_lazily(self, basic_prompts):
+        from scripts.dashboard import generate_categories_html
+        stats = compute_stats({"m1": {"runs": {"C01": [_make_run(judge_scores={"j": _make_judge(4)})]}}}, basic_prompts)
+        page = generate_categories_html(stats)
+        assert 'data-cat="coding"' in page and 'data-cat="reasoning"' in page
+        assert "new IntersectionObserver" in page
+        assert '"cat_entries":{"coding":[{"name":"m1"' in page
+
+    @pytest.mark.parametrize("score,color", [
+        (0.95, "#22c55e"), (0.9499, "#4ade80"), (0.85, "#86efac"), (0.8, "#eab308"), (0.7, "#f97316"), (0.69, "#ef4444"),
+    ])
+    def test_colour_bands_match_page_script(self, score, color):
+        from scripts.dashboard import _composite_hex
+        assert _composite_hex(score) == color
+
+
+class TestComposite:
+    def test_weights_and_fallbacks(self):
+        from scripts.dashboard import _composite
+        assert _composite(5, 0.5, 0.5, 0.5) == 0.75
+        assert _composite(3, None, 0.5, 0.5) == 0.5
+        assert _composite(None, 0.8, 0.5, 0.5) == 0.8
+        assert _composite(None, None, 0.5, 0.5) is None
+
+
+class TestLoadAllResults:
+    def test_skips_comparison_and_corrupt_files(self, tmp_path, monkeypatch, capsys):
+        from scripts import dashboard
+        monkeypatch.setattr(dashboard, "RESULTS_DIR", str(tmp_path))
+        (tmp_path / "model-a.json").write_text(json.dumps({"model": "a", "runs": {}}))
+        (tmp_path / "comparison.json").write_text("{}")
+        (tmp_path / "broken.json").write_text("{not json")
+        models = dashboard.load_all_results()
+        assert models == {"model-a": {"model": "a", "runs": {}}}
+        assert "broken.json" in capsys.readouterr().out
+
+    def test_keeps_sorted_order(self, tmp_path, monkeypatch):
+        from scripts import dashboard
+        monkeypatch.setattr(dashboard, "RESULTS_DIR", str(tmp_path))
+        names = ["zeta", "alpha", "mid", "beta"]
+        for n in names:
+            (tmp_path / f"{n}.json").write_text(json.dumps({"model": n}))
+        assert list(dashboard.load_all_results()) == sorted(names)
+
+    def test_missing_dir(self, tmp_path, monkeypatch):
+        from scripts import dashboard
+        monkeypatch.setattr(dashboard, "RESULTS_DIR", str(tmp_path / "nope"))
+        assert dashboard.load_all_results() == {}
+
+    def test_merges_runs_logs(self, tmp_path, monkeypatch):
+        from scripts import dashboard
+        monkeypatch.setattr(dashboard, "RESULTS_DIR", str(tmp_path))
+        (tmp_path / "a.json").write_text(json.dumps({"runs": {"T1": [{"timestamp": "t1"}]}}))
+        (tmp_path / "a.runs.jsonl").write_text(json.dumps({"pid": "T2", "timestamp": "t2"}) + "\n")
+        (tmp_path / "b.runs.jsonl").write_text(json.dumps({"pid": "T1", "timestamp": "t3"}) + "\n")
+        models = dashboard.load_all_results()
+        assert models["a"]["runs"] == {"T1": [{"timestamp": "t1"}], "T2": [{"timestamp": "t2"}]}
+        assert models["b"] == {"model_name": "b", "runs": {"T1": [{"timestamp": "t3"}]}}
+
+
+class TestStatsCache:
+    def test_hit_until_inputs_change(self, tmp_path, monkeypatch):
+        import os
+        from scripts import dashboard
+        monkeypatch.setattr(dashboard, "RESULTS_DIR", str(tmp_path))
+        result = tmp_path / "m.json"
+        result.write_text("{}")
+        eval_file = tmp_path / "eval.json"
+        eval_file.write_text("{}")
+
+        key = dashboard._stats_cache_key(str(eval_file), ["j"], {})
+        assert dashboard._cached_stats(key) is None
+        dashboard._store_stats(key, {"total_models": 1})
+        assert dashboard._cached_stats(key) == {"total_models": 1}
+        assert dashboard._stats_cache_key(str(eval_file), ["j"], {}) == key
+
+        assert dashboard._stats_cache_key(str(eval_file), ["j2"], {}) != key
+        os.utime(result, ns=(0, 0))
+        assert dashboard._stats_cache_key(str(eval_file), ["j"], {}) != key
+
+
 class TestComputeStats:
     def test_basic_aggregation(self, basic_prompts):
         models = {
@@ -184,6 +350,30 @@ class TestComputeStats:
         # Should be sorted by composite/score descending
         assert lb[0]["name"] == "high-model"
 
+    def test_median_latency_is_upper_median(self, basic_prompts):
+        runs = {}
+        for pid, lat in (("C01", 1.0), ("R01", 3.0)):
+            r = _make_run()
+            r["latency_s"] = lat
+            runs[pid] = [r]
+        stats = compute_stats({"m": {"runs": runs}}, basic_prompts)
+        assert stats["leaderboard"][0]["median_latency"] == 3.0
+
+    def test_flags_collected_per_prompt(self, basic_prompts):
+        models = {
+            "model-a": {"runs": {
+                "C01": [_make_run(flags=["TRAP_MISSED", "EMPTY_RESPONSE"])],
+                "R01": [_make_run(error="boom", flags=["API_ERROR"])],
+            }},
+            "model-b": {"runs": {"C01": [_make_run(flags=["TOO_LONG"])]}},
+        }
+        stats = compute_stats(models, basic_prompts)
+        assert stats["flags"] == [{
+            "id": "C01",
+            "subcategory": "basics",
+            "models": {"model-a": ["TRAP_MISSED"], "model-b": ["TOO_LONG"]},
+        }]
+
 
 class TestLeaderboardRowEscaping:
     """Model names and companies with HTML special chars must be escaped."""
@@ -239,5 +239,7 @@ class TestDashboardGeneration:
         assert result is not None
         index_path = docs_dir / "index.html"
         assert index_path.exists()
+        assert not (docs_dir / "index.html.gz").exists()
+        assert not (docs_dir / "data.json").exists()
         html_content = index_path.read_text()
         assert "<html" in html_content or "<!DOCTYPE" in html_content.upper() or "<table" in html_content
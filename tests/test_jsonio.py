@@ -0,0 +1,41 @@
+"""Tests for scripts/jsonio.py - orjson and stdlib backends."""
+
+import json
+
+import pytest
+
+from scripts import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "orjson", None)
+    elif jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJsonio:
+    def test_round_trip(self, backend, tmp_path):
+        data = {"runs": {"P1": [{"content": "héllo ✓", "latency_s": 1.5, "flags": []}]}}
+        path = str(tmp_path / "r.json")
+        jsonio.dump_pretty(data, path)
+        assert jsonio.load(path) == data
+
+    def test_pretty_is_indented_utf8(self, backend):
+        out = jsonio.dumps_pretty({"a": "✓"})
+        assert out.decode() == '{\n  "a": "✓"\n}'
+
+    def test_dumps_single_line(self, backend):
+        out = jsonio.dumps({"a": [1, 2], "b": "x\ny"})
+        assert "\n" not in out
+        assert json.loads(out) == {"a": [1, 2], "b": "x\ny"}
+
+    def test_int_keys_stringified(self, backend):
+        assert json.loads(jsonio.dumps({1: "a"})) == {"1": "a"}
+        assert json.loads(jsonio.dumps_pretty({1: "a"})) == {"1": "a"}
+
+    def test_invalid_raises_json_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            jsonio.loads('{"a": ')
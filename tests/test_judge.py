@@ -1,11 +1,18 @@
 """Tests for scripts/judge.py - JSON extraction, parsing, prompt building, scoring."""
 
 import pytest
+from scripts import jsonio
 from scripts.judge import (
+    _extract_json_array,
     _extract_json_object,
+    build_batch_judge_prompt,
+    parse_batch_judge_response,
     parse_judge_response,
     build_judge_prompt,
     judge_response,
+    JUDGE_MAX_IDEAL_CHARS,
+    JUDGE_MAX_RESPONSE_CHARS,
+    JUDGE_MAX_TOKENS,
     JUDGE_PROMPT,
 )
 
@@ -42,6 +49,11 @@ class TestExtractJsonObject:
         text = '{"a": 1} {"b": 2}'
         assert _extract_json_object(text) == '{"a": 1}'
 
+    def test_malformed_object_falls_back_to_scanner(self):
+        # Not valid JSON, so the C decoder bails and the brace scanner takes over
+        text = "Score: {score: 4, 'rationale': 'ok'} done"
+        assert _extract_json_object(text) == "{score: 4, 'rationale': 'ok'}"
+
 
 # ── parse_judge_response ──
 
@@ -91,6 +103,13 @@ class TestParseJudgeResponse:
         assert result["score"] == 3
         assert result["rationale"] == ""
 
+    def test_clean_json_skips_brace_scan(self):
+        from unittest.mock import patch
+        with patch("scripts.judge._extract_json_object") as scan:
+            result = parse_judge_response('  {"score": 5, "rationale": "Clean."}\n')
+        assert result == {"score": 5, "rationale": "Clean."}
+        scan.assert_not_called()
+
 
 # ── build_judge_prompt ──
 
@@ -122,6 +141,17 @@ class TestBuildJudgePrompt:
         result = build_judge_prompt(meta, "R", {"flags": []})
         assert "Single criterion" in result
 
+    def test_truncates_long_response_and_ideal(self):
+        meta = {"prompt": "P", "ideal": "i" * (JUDGE_MAX_IDEAL_CHARS + 50), "criteria": []}
+        result = build_judge_prompt(meta, "r" * (JUDGE_MAX_RESPONSE_CHARS + 50), {"flags": []})
+        assert "i" * JUDGE_MAX_IDEAL_CHARS + "\n...[truncated]" in result
+        assert "i" * (JUDGE_MAX_IDEAL_CHARS + 1) not in result
+        assert result.endswith("r" * JUDGE_MAX_RESPONSE_CHARS + "\n...[truncated]")
+
+    def test_short_response_untouched(self):
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        assert build_judge_prompt(meta, "R", {"flags": []}).endswith("\nR")
+
 
 # ── judge_response ──
 
@@ -155,3 +185,255 @@ class TestJudgeResponse:
         # Should not raise
         result = judge_response(provider, {}, meta, "Response", {"flags": []})
         assert result["judge_score"] is None
+
+    def test_unparseable_reply_retried_once_with_reminder(self):
+        from scripts.judge import JUDGE_JSON_REMINDER
+        from tests.conftest import MockProvider
+
+        class FixesItself(MockProvider):
+            def complete(self, prompt, params):
+                self.calls.append({"prompt": prompt, "params": params})
+                if len(self.calls) == 1:
+                    return "I'd give this a four.", {}
+                return '{"score": 4, "rationale": "ok"}', {}
+
+        provider = FixesItself()
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        result = judge_response(provider, {"temperature": 0.7}, meta, "Response", {"flags": []})
+        assert result["judge_score"] == 4
+        assert provider.calls[1]["prompt"].endswith(JUDGE_JSON_REMINDER)
+        assert provider.calls[1]["params"] == {"temperature": 0.7}
+
+    def test_transient_error_retried(self, monkeypatch):
+        import httpx
+        from scripts import ratelimit
+        from tests.conftest import MockProvider
+        monkeypatch.setattr(ratelimit.time, "sleep", lambda s: None)
+
+        class Flaky(MockProvider):
+            def complete(self, prompt, params):
+                self.calls.append(prompt)
+                if len(self.calls) == 1:
+                    raise httpx.ConnectError("reset")
+                return '{"score": 5, "rationale": "ok"}', {}
+
+        provider = Flaky()
+        result = judge_response(provider, {}, {"prompt": "P"}, "Response", {"flags": []})
+        assert result["judge_score"] == 5 and len(provider.calls) == 2
+
+    def test_default_params_overridable(self, mock_judge_provider):
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        judge_response(mock_judge_provider, {"short_output": True}, meta, "Response", {"flags": []})
+        judge_response(mock_judge_provider, {"max_tokens": 1024, "short_output": True}, meta, "Response", {"flags": []})
+        assert mock_judge_provider.calls[0]["params"] == {"max_tokens": JUDGE_MAX_TOKENS}
+        assert mock_judge_provider.calls[1]["params"] == {"max_tokens": 1024}
+
+    def test_no_max_tokens_keeps_provider_default(self, mock_judge_provider):
+        from scripts.providers import GoogleProvider, OpenAIProvider
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        judge_response(mock_judge_provider, {}, meta, "Response", {"flags": []})
+        params = mock_judge_provider.calls[0]["params"]
+        assert "max_tokens" not in params
+        _, kwargs = GoogleProvider("gemini-2.5-flash", "k")._request("p", params)
+        assert kwargs["json"]["generationConfig"]["maxOutputTokens"] == 4096
+        _, kwargs = OpenAIProvider("o3", "k")._request("p", params)
+        assert "max_completion_tokens" not in kwargs["json"] and "max_tokens" not in kwargs["json"]
+
+    def test_temperature_only_sent_when_configured(self):
+        from scripts.providers import OpenAIProvider
+        from tests.conftest import MockProvider
+        provider = MockProvider(response="not json")
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        judge_response(provider, {}, meta, "Response", {"flags": []})
+        assert [c["params"] for c in provider.calls] == [{}, {}]  # first call and the reparse retry
+        _, kwargs = OpenAIProvider("gpt-5.1", "k")._request("p", provider.calls[0]["params"])
+        assert "temperature" not in kwargs["json"]
+
+
+# ── ajudge_response ──
+
+class TestAsyncJudgeResponse:
+    def test_successful_scoring(self, mock_judge_provider):
+        import asyncio
+        from scripts.judge import ajudge_response
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        result = asyncio.run(ajudge_response(mock_judge_provider, {}, meta, "Response", {"flags": []}))
+        assert result["judge_score"] == 4
+        assert len(mock_judge_provider.calls) == 1
+
+    def test_never_raises(self):
+        import asyncio
+        from scripts.judge import ajudge_response
+        from tests.conftest import MockProvider
+        provider = MockProvider(error=RuntimeError("API down"))
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        result = asyncio.run(ajudge_response(provider, {}, meta, "Response", {"flags": []}))
+        assert result["judge_score"] is None
+        assert "Judge error" in result["judge_rationale"]
+
+
+# ── judge_ensemble ──
+
+class TestJudgeEnsemble:
+    def test_median_resists_outlier(self):
+        import asyncio
+        from scripts.judge import judge_ensemble
+        from tests.conftest import MockProvider
+        judges = {
+            name: (MockProvider(response=f'{{"score": {score}, "rationale": "r"}}'), {})
+            for name, score in (("a", 5), ("b", 4), ("c", 1))
+        }
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        result = asyncio.run(judge_ensemble(judges, meta, "Response", {"flags": []}))
+        assert result["judge_scores"]["c"] == {"score": 1, "rationale": "r"}
+        assert result["judge_score_median"] == 4
+        assert result["judge_score_avg"] == 3.33
+        assert result["judge_count"] == 3
+
+    def test_custom_judge_callable(self, mock_judge_provider):
+        import asyncio
+        from scripts.judge import judge_ensemble
+        seen = []
+
+        async def judge(name, provider, params, prompt_meta, response, auto_checks):
+            seen.append((name, params))
+            return {"judge_score": 2, "judge_rationale": name}
+
+        judges = {"a": (mock_judge_provider, {"x": 1}), "b": (mock_judge_provider, {})}
+        result = asyncio.run(judge_ensemble(judges, {"prompt": "P"}, "R", {"flags": []}, judge=judge))
+        assert seen == [("a", {"x": 1}), ("b", {})]
+        assert result["judge_scores"]["b"] == {"score": 2, "rationale": "b"}
+        assert mock_judge_provider.calls == []
+
+    def test_raising_judge_keeps_other_scores(self, mock_judge_provider):
+        import asyncio
+        from scripts.judge import judge_ensemble
+
+        async def judge(name, *args):
+            if name == "bad":
+                raise RuntimeError("boom")
+            return {"judge_score": 4, "judge_rationale": "ok"}
+
+        judges = {"good": (mock_judge_provider, {}), "bad": (mock_judge_provider, {})}
+        result = asyncio.run(judge_ensemble(judges, {"prompt": "P"}, "R", {"flags": []}, judge=judge))
+        assert result["judge_scores"]["bad"] == {"score": None, "rationale": "Judge error: boom"}
+        assert result["judge_score_avg"] == 4
+        assert result["judge_count"] == 1
+
+    def test_summary_skips_failed_judges(self):
+        from scripts.judge import judge_summary
+        summary = judge_summary({"a": {"score": 2}, "b": {"score": 5}, "c": {"score": None}})
+        assert summary == {"judge_score_avg": 3.5, "judge_score_median": 3.5, "judge_count": 2}
+        assert judge_summary({})["judge_score_median"] is None
+
+
+# ── judge_all_async ──
+
+class TestJudgeAllAsync:
+    def test_bounded_concurrency_and_order(self):
+        import asyncio
+        from scripts.judge import judge_all_async
+        in_flight = peak = 0
+        done = []
+
+        async def judge(n):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 * (5 - n % 5))
+            in_flight -= 1
+            if n == 3:
+                raise RuntimeError("boom")
+            return {"judge_score": n}
+
+        results = asyncio.run(judge_all_async([(n,) for n in range(10)], concurrency=3, judge=judge,
+                                              on_done=lambda i, r: done.append(i)))
+        assert peak == 3
+        assert [r["judge_score"] for i, r in enumerate(results) if i != 3] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert isinstance(results[3], RuntimeError)
+        assert sorted(done) == list(range(10)) and done != list(range(10))
+
+    def test_defaults_to_ajudge_response(self, mock_judge_provider):
+        import asyncio
+        from scripts.judge import judge_all_async
+        meta = {"prompt": "P", "ideal": "I", "criteria": []}
+        items = [(mock_judge_provider, {}, meta, f"R{i}", {"flags": []}) for i in range(4)]
+        results = asyncio.run(judge_all_async(items))
+        assert [r["judge_score"] for r in results] == [4, 4, 4, 4]
+
+
+# ── judge_preflight ──
+
+class TestJudgePreflight:
+    def test_preflight_raises_on_unusable_judge(self, mock_judge_provider):
+        from scripts.judge import judge_preflight
+        from tests.conftest import MockProvider
+        judge_preflight(mock_judge_provider, {})
+        with pytest.raises(RuntimeError, match="preflight"):
+            judge_preflight(MockProvider(error=RuntimeError("401 Unauthorized")), {})
+
+
+# ── batch judging ──
+
+class TestBatchJudge:
+    META = {"prompt": "P", "ideal": "I", "criteria": ["c1"]}
+
+    def test_prompt_has_every_item(self):
+        batch = [(self.META, "first answer", {"flags": ["TOO_SHORT"]}), (self.META, "second answer", {"flags": []})]
+        prompt = build_batch_judge_prompt(batch)
+        assert "=== ITEM 0 ===" in prompt and "=== ITEM 1 ===" in prompt
+        assert prompt.index("first answer") < prompt.index("=== ITEM 1 ===") < prompt.index("second answer")
+        assert prompt.count("TOO_SHORT") == 1
+        assert "JSON array" in prompt
+
+    def test_extract_array_with_brackets_in_strings(self):
+        text = 'Scores:\n[{"id": 0, "score": 4, "rationale": "uses a[i] ]"}] done'
+        assert _extract_json_array(text) == '[{"id": 0, "score": 4, "rationale": "uses a[i] ]"}]'
+
+    def test_parse_matches_ids_and_flags_invalid(self):
+        raw = '```json\n[{"id": 2, "score": 5, "rationale": "c"}, {"id": 0, "score": 3, "rationale": "a"}, {"id": 1, "score": 9}]\n```'
+        results = parse_batch_judge_response(raw, 3)
+        assert [r["score"] for r in results] == [3, None, 5]
+        assert "Invalid score" in results[1]["rationale"]
+
+    def test_parse_positional_flags_missing(self):
+        results = parse_batch_judge_response('[{"score": 2, "rationale": "x"}]', 2)
+        assert [r["score"] for r in results] == [2, None]
+        assert "Missing" in results[1]["rationale"]
+
+    def test_parse_one_based_ids_shifted(self):
+        raw = '[{"id": 1, "score": 2, "rationale": "a"}, {"id": 2, "score": 4, "rationale": "b"}, {"id": 3, "score": 5, "rationale": "c"}]'
+        assert [r["score"] for r in parse_batch_judge_response(raw, 3)] == [2, 4, 5]
+
+    @pytest.mark.parametrize("ids", [[1, 2], [0, 0, 1], [0, 3, 1], [0, -1, 1], [0, 1], [True, False, 2], ["0", "1", "2"], [0, None, 2]])
+    def test_parse_untrusted_ids_fail_whole_batch(self, ids):
+        raw = jsonio.dumps([{"id": i, "score": 4, "rationale": "x"} for i in ids])
+        results = parse_batch_judge_response(raw, 3)
+        assert [r["score"] for r in results] == [None, None, None]
+        assert "ids don't match" in results[0]["rationale"]
+
+    def test_parse_positional_without_ids(self):
+        results = parse_batch_judge_response('[{"score": 2, "rationale": "x"}, {"score": 4, "rationale": "y"}]', 2)
+        assert [r["score"] for r in results] == [2, 4]
+
+    def test_parse_garbage(self):
+        results = parse_batch_judge_response("no idea", 2)
+        assert [r["score"] for r in results] == [None, None]
+        assert results[0]["rationale"].startswith("Failed to parse")
+
+    def test_ajudge_batch_one_call(self):
+        import asyncio
+        from scripts.judge import ajudge_batch
+        from tests.conftest import MockProvider
+        provider = MockProvider(response='[{"id": 0, "score": 4, "rationale": "a"}, {"id": 1, "score": 2, "rationale": "b"}]')
+        results = asyncio.run(ajudge_batch(provider, {}, [(self.META, "r0", {}), (self.META, "r1", {})]))
+        assert [r["judge_score"] for r in results] == [4, 2]
+        assert len(provider.calls) == 1
+
+    def test_ajudge_batch_never_raises(self):
+        import asyncio
+        from scripts.judge import ajudge_batch
+        from tests.conftest import MockProvider
+        results = asyncio.run(ajudge_batch(MockProvider(error=RuntimeError("down")), {}, [(self.META, "r", {})] * 2))
+        assert [r["judge_score"] for r in results] == [None, None]
+        assert "down" in results[0]["judge_rationale"]
@@ -1,5 +1,6 @@
 """Tests for scripts/providers.py - sanitization, factory, dataclass, ABC."""
 
+import json
 import os
 import pytest
 from scripts.providers import (
@@ -159,3 +160,189 @@ class TestGetProvider:
         cfg = {"provider": "openai", "model": "gpt-test", "api_key_env": "none"}
         p = get_provider(cfg)
         assert isinstance(p, OpenAIProvider)
+
+
+# ── Async completion ──
+
+class TestAsyncComplete:
+    def test_http_provider_uses_async_client(self):
+        import asyncio
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, json={
+                "choices": [{"message": {"content": "Hi"}}],
+                "usage": {"prompt_tokens": 3, "completion_tokens": 1},
+            })
+
+        p = OpenAIProvider("gpt-test", "none", base_url="http://x")
+        p._client_kwargs["transport"] = httpx.MockTransport(handler)
+
+        async def go():
+            try:
+                return await p.acomplete("Hello", {})
+            finally:
+                await p.aclose()
+
+        content, usage = asyncio.run(go())
+        assert content == "Hi"
+        assert usage == {"input_tokens": 3, "output_tokens": 1}
+        assert p._aclient is None
+
+    def test_sync_provider_falls_back_to_thread(self, mock_provider):
+        import asyncio
+        content, usage = asyncio.run(mock_provider.acomplete("Hello", {}))
+        assert content == "Mock response"
+        assert mock_provider.calls[0]["prompt"] == "Hello"
+
+
+class TestConnectionPool:
+    def test_client_reused_across_calls(self):
+        import httpx
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"choices": [{"message": {"content": "Hi"}}], "usage": {}})
+
+        p = OpenAIProvider("gpt-test", "none", base_url="http://x")
+        p.client = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://x")
+        client = p.client
+        p.complete("a", {})
+        p.complete("b", {})
+        assert len(seen) == 2
+        assert p.client is client
+
+    def test_keepalive_limits_applied(self):
+        from scripts.providers import HTTP_LIMITS
+        p = OpenAIProvider("gpt-test", "none", base_url="http://x")
+        assert p._client_kwargs["limits"] is HTTP_LIMITS
+        p.close()
+
+    def test_close_closes_sync_client(self):
+        p = OpenAIProvider("gpt-test", "none", base_url="http://x")
+        p.close()
+        assert p.client.is_closed
+
+
+class TestBatchComplete:
+    def test_default_calls_complete_per_prompt(self, mock_provider):
+        results = mock_provider.batch_complete(["a", "b"], {})
+        assert results == [("Mock response", mock_provider.usage)] * 2
+        assert [c["prompt"] for c in mock_provider.calls] == ["a", "b"]
+
+    def test_default_captures_errors(self):
+        from tests.conftest import MockProvider
+        results = MockProvider(error=RuntimeError("boom")).batch_complete(["a"], {})
+        assert isinstance(results[0], RuntimeError)
+
+    def test_openai_batch_api_flow(self):
+        import httpx
+        uploaded = {}
+        polls = []
+
+        def ok(i):
+            return json.dumps({"custom_id": str(i), "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": f"answer {i}"}}],
+                "usage": {"prompt_tokens": 3, "completion_tokens": 2},
+            }}})
+
+        def handler(request):
+            path = request.url.path
+            if request.method == "POST" and path == "/v1/files":
+                assert request.headers["content-type"].startswith("multipart/form-data")
+                uploaded["body"] = request.content.decode()
+                return httpx.Response(200, json={"id": "file-in"})
+            if request.method == "POST" and path == "/v1/batches":
+                body = json.loads(request.content)
+                assert body["input_file_id"] == "file-in"
+                assert body["endpoint"] == "/v1/chat/completions"
+                return httpx.Response(200, json={"id": "batch-1", "status": "validating"})
+            if path == "/v1/batches/batch-1":
+                polls.append(1)
+                status = "completed" if len(polls) > 1 else "in_progress"
+                return httpx.Response(200, json={"id": "batch-1", "status": status,
+                                                 "output_file_id": "file-out", "error_file_id": "file-err"})
+            if path == "/v1/files/file-out/content":
+                return httpx.Response(200, text=ok(0) + "\n" + ok(2) + "\n")
+            if path == "/v1/files/file-err/content":
+                return httpx.Response(200, text=json.dumps({"custom_id": "1", "response": {
+                    "status_code": 429, "body": {"error": {"message": "rate limited"}}}}))
+            return httpx.Response(404)
+
+        p = OpenAIProvider("gpt-test", "none", base_url="http://x/v1")
+        p.client = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://x/v1")
+        p.supports_batch = True
+        p.BATCH_POLL_INTERVAL = 0
+
+        results = p.batch_complete(["q0", "q1", "q2"], {"max_tokens": 10})
+
+        lines = [json.loads(l) for l in uploaded["body"].splitlines() if l.startswith("{")]
+        assert [l["custom_id"] for l in lines] == ["0", "1", "2"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        assert lines[0]["body"]["messages"][0]["content"] == "q0"
+        assert len(polls) == 2
+        assert results[0] == ("answer 0", {"input_tokens": 3, "output_tokens": 2})
+        assert isinstance(results[1], RuntimeError) and "rate limited" in str(results[1])
+        assert results[2][0] == "answer 2"
+
+    def test_batch_only_on_native_openai(self):
+        assert OpenAIProvider("gpt-4o", "k").supports_batch
+        assert OpenAIProvider("gpt-4o", "k", base_url="https://api.openai.com/v1/").supports_batch
+        assert not OpenAIProvider("m", "k", base_url="http://localhost:8000/v1").supports_batch
+
+    def _batch_provider(self, batch_status, output=""):
+        import httpx
+        seen = []
+
+        def handler(request):
+            path = request.url.path
+            seen.append((request.method, path))
+            if path == "/v1/files":
+                return httpx.Response(200, json={"id": "file-in"})
+            if path == "/v1/batches":
+                return httpx.Response(200, json={"id": "b1", "status": "in_progress"})
+            if path == "/v1/batches/b1":
+                return httpx.Response(200, json={"id": "b1", "status": batch_status, "output_file_id": "out"})
+            if path == "/v1/files/out/content":
+                return httpx.Response(200, text=output)
+            if path == "/v1/chat/completions":
+                prompt = json.loads(request.content)["messages"][0]["content"]
+                return httpx.Response(200, json={"choices": [{"message": {"content": f"live {prompt}"}}]})
+            return httpx.Response(200, json={})
+
+        p = OpenAIProvider("gpt-test", "none")
+        p.client = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://x/v1")
+        p.BATCH_POLL_INTERVAL = 0
+        return p, seen
+
+    def test_batch_deadline_cancels_and_falls_back(self):
+        p, seen = self._batch_provider("in_progress")
+        p.BATCH_MAX_WAIT = 0
+        results = p.batch_complete(["q0", "q1"], {})
+        assert ("POST", "/v1/batches/b1/cancel") in seen
+        assert [r[0] for r in results] == ["live q0", "live q1"]
+
+    def test_expired_batch_completes_missing_prompts_live(self):
+        done = json.dumps({"custom_id": "0", "response": {"status_code": 200, "body": {
+            "choices": [{"message": {"content": "batched q0"}}]}}})
+        p, seen = self._batch_provider("expired", output=done)
+        results = p.batch_complete(["q0", "q1"], {})
+        assert [r[0] for r in results] == ["batched q0", "live q1"]
+        assert seen.count(("POST", "/v1/chat/completions")) == 1
+
+
+class TestJsonMode:
+    def test_openai_sets_response_format(self):
+        _, kwargs = OpenAIProvider("gpt-4o", "k")._request("p", {"json_mode": True, "temperature": 0})
+        assert kwargs["json"]["response_format"] == {"type": "json_object"}
+        assert "json_mode" not in kwargs["json"]
+
+    def test_google_sets_mime_type(self):
+        _, kwargs = GoogleProvider("gemini", "k")._request("p", {"json_mode": True})
+        assert kwargs["json"]["generationConfig"]["responseMimeType"] == "application/json"
+
+    def test_anthropic_drops_flag(self):
+        _, kwargs = AnthropicProvider("claude", "k")._request("p", {"json_mode": True, "max_tokens": 5})
+        assert "json_mode" not in kwargs["json"] and "response_format" not in kwargs["json"]
+        assert kwargs["json"]["max_tokens"] == 5
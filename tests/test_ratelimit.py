@@ -0,0 +1,176 @@
+"""Tests for scripts/ratelimit.py - token bucket, retry policy, provider wrapper."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from scripts import ratelimit
+from scripts.ratelimit import AsyncTokenBucket, LimitedProvider, aretry, estimate_tokens, retry, retry_delay
+from tests.conftest import MockProvider
+
+
+def _status_error(code, headers=None):
+    request = httpx.Request("POST", "http://x")
+    response = httpx.Response(code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("err", request=request, response=response)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    slept = []
+
+    async def fake_sleep(s):
+        slept.append(s)
+
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake_sleep)
+    return slept
+
+
+class TestTokenBucket:
+    def test_spaces_requests(self):
+        bucket = AsyncTokenBucket(requests_per_minute=1200)  # one per 50ms
+
+        async def go():
+            t0 = time.monotonic()
+            for _ in range(4):
+                async with bucket:
+                    pass
+            return time.monotonic() - t0
+
+        # First token is available immediately, the next three wait ~50ms each
+        assert asyncio.run(go()) >= 0.14
+
+    def test_burst_allows_immediate_calls(self):
+        bucket = AsyncTokenBucket(requests_per_minute=1, burst=3)
+
+        async def go():
+            t0 = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            return time.monotonic() - t0
+
+        assert asyncio.run(go()) < 0.05
+
+    def test_acquire_amount(self, monkeypatch):
+        slept = []
+
+        async def stop_sleep(s):
+            slept.append(s)
+            raise asyncio.CancelledError
+
+        monkeypatch.setattr(ratelimit.asyncio, "sleep", stop_sleep)
+        bucket = AsyncTokenBucket(requests_per_minute=60, burst=100)
+        asyncio.run(bucket.acquire(90))
+        assert slept == []
+        # 10 left, 30 wanted: wait for the missing 20 at 1 token/s
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(bucket.acquire(30))
+        assert slept[0] == pytest.approx(20, abs=0.1)
+
+    def test_amount_capped_at_capacity(self):
+        bucket = AsyncTokenBucket(requests_per_minute=60, burst=10)
+        asyncio.run(asyncio.wait_for(bucket.acquire(1000), 1))
+        assert bucket.tokens < 1
+
+
+class TestRetryDelay:
+    def test_honours_retry_after(self):
+        assert retry_delay(_status_error(429, {"retry-after": "7"}), 0) == 7.0
+
+    def test_retry_after_capped(self):
+        assert retry_delay(_status_error(429, {"retry-after": "9999"}), 0) == ratelimit.BACKOFF_CAP
+
+    def test_backoff_grows_and_is_jittered(self):
+        for attempt in range(4):
+            d = retry_delay(_status_error(503), attempt)
+            assert 0 <= d <= ratelimit.BACKOFF_BASE * 2 ** attempt
+
+    def test_transport_errors_retryable(self):
+        assert retry_delay(httpx.ConnectError("down"), 0) is not None
+
+    def test_client_errors_not_retryable(self):
+        assert retry_delay(_status_error(400), 0) is None
+        assert retry_delay(ValueError("bad json"), 0) is None
+
+    def test_bedrock_throttling_and_5xx_retryable(self, monkeypatch):
+        # Stands in for botocore's ClientError, which keeps the parsed error in .response
+        class ClientError(Exception):
+            def __init__(self, code, status):
+                self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+        monkeypatch.setattr(ratelimit, "ClientError", ClientError)
+        assert retry_delay(ClientError("ThrottlingException", 429), 0) is not None
+        assert retry_delay(ClientError("InternalServerException", 500), 0) is not None
+        assert retry_delay(ClientError("ThrottlingException", None), 0) is not None
+        assert retry_delay(ClientError("ValidationException", 400), 0) is None
+
+
+class TestAretry:
+    def test_retries_then_succeeds(self, no_sleep):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _status_error(429, {"retry-after": "2"})
+            return "ok"
+
+        assert asyncio.run(aretry(call)) == "ok"
+        assert len(calls) == 3
+        assert no_sleep == [2.0, 2.0]
+
+    def test_gives_up_after_attempts(self, no_sleep):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            raise _status_error(500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(aretry(call, attempts=3))
+        assert len(calls) == 3
+
+    def test_non_retryable_raises_immediately(self, no_sleep):
+        calls = []
+
+        async def call():
+            calls.append(1)
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            asyncio.run(aretry(call))
+        assert len(calls) == 1 and no_sleep == []
+
+
+class TestRetry:
+    def test_sync_retries_then_succeeds(self, monkeypatch):
+        slept, calls = [], []
+        monkeypatch.setattr(ratelimit.time, "sleep", slept.append)
+
+        def call():
+            calls.append(1)
+            if len(calls) < 2:
+                raise httpx.ConnectError("reset")
+            return "ok"
+
+        assert retry(call) == "ok"
+        assert len(calls) == 2 and len(slept) == 1
+
+
+class TestLimitedProvider:
+    def test_passes_through(self):
+        inner = MockProvider(response="hi")
+        wrapped = LimitedProvider(inner, AsyncTokenBucket(6000))
+        assert asyncio.run(wrapped.acomplete("p", {})) == ("hi", inner.usage)
+        assert wrapped.calls == inner.calls
+        assert wrapped.supports_batch is False
+
+    def test_token_limiter_draws_estimate(self):
+        inner = MockProvider(response="hi")
+        tokens = AsyncTokenBucket(60000, burst=1000)
+        wrapped = LimitedProvider(inner, token_limiter=tokens)
+        asyncio.run(wrapped.acomplete("x" * 400, {"max_tokens": 150}))
+        assert estimate_tokens("x" * 400, {"max_tokens": 150}) == 250
+        assert tokens.tokens == pytest.approx(750, abs=5)
@@ -1,6 +1,7 @@
 """Tests for run.py - data layer, cmd_rejudge, cmd_eval, cmd_compare, cmd_migrate_judges."""
 
 import argparse
+import contextlib
 import json
 import os
 import pytest
@@ -61,6 +62,12 @@ class TestSaveModelResults:
         run.save_model_results("test", data)
         assert "updated" in data
 
+    def test_uses_given_updated_at(self, tmp_results_dir):
+        import run
+        data = {"model_name": "test", "runs": {}}
+        run.save_model_results("test", data, updated_at="2026-01-01T00:00:00")
+        assert data["updated"] == "2026-01-01T00:00:00"
+
 
 class TestListEvaluatedModels:
     def test_finds_json_files(self, tmp_results_dir):
@@ -83,6 +90,20 @@ class TestListEvaluatedModels:
         import run
         assert run.list_evaluated_models() == []
 
+    def test_missing_dir(self, tmp_path, monkeypatch):
+        import run
+        monkeypatch.setattr(run, "RESULTS_DIR", str(tmp_path / "nope"))
+        assert run.list_evaluated_models() == []
+
+    def test_includes_log_only_models_and_ignores_tmp_files(self, tmp_results_dir):
+        import run
+        (tmp_results_dir / "b.json").write_text("{}")
+        (tmp_results_dir / "a.json").write_text("{}")
+        (tmp_results_dir / "a.runs.jsonl").write_text("")
+        (tmp_results_dir / "a.json.tmp").write_text("")
+        (tmp_results_dir / "c.runs.jsonl").write_text("")
+        assert run.list_evaluated_models() == ["a", "b", "c"]
+
 
 class TestFilterPrompts:
     def setup_method(self):
@@ -124,6 +145,11 @@ class TestFilterPrompts:
         result = filter_prompts(self.prompts)
         assert len(result) == 3
 
+    def test_keeps_eval_order(self):
+        from run import filter_prompts
+        result = filter_prompts(self.prompts, ids=["R01", "C01"])
+        assert [p["id"] for p in result] == ["C01", "R01"]
+
 
 class TestLatestRun:
     def test_single_run(self):
@@ -261,6 +287,122 @@ class TestCmdRejudgeMerge:
         assert scores["new-judge"]["score"] == 4
 
 
+class TestCmdRejudge:
+    def _run(self, tmp_path, tmp_results_dir, monkeypatch, provider, force=False, judges="  - model: j1\n  - model: j2\n",
+             contents=("answer 0", "answer 1", "answer 2"), preflight=False, seed=True):
+        import run
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "models:\n  j1: {provider: openai, model: a}\n  j2: {provider: openai, model: b}\n"
+            f"judges:\n{judges}"
+            f"eval:\n  eval_file: {tmp_path / 'eval.json'}\n  delay_between_calls: 0\n"
+        )
+        (tmp_path / "eval.json").write_text(json.dumps({"prompts": [
+            {"id": f"T0{i}", "category": "c", "subcategory": "s", "difficulty": "easy",
+             "prompt": "p", "ideal": "i", "criteria": [], "check_type": "reasoning"}
+            for i in range(3)
+        ]}))
+        if seed:
+            run.save_model_results("m1", {"model_name": "m1", "runs": {
+                f"T0{i}": [{"content": content, "auto_checks": {"flags": []}, "judge_scores": {}}]
+                for i, content in enumerate(contents)
+            }})
+        args = argparse.Namespace(config=str(config_file), judge=None, models=["m1"], force=force)
+        # The preflight call is skipped by default so call counts cover real judgements only
+        skip_preflight = contextlib.nullcontext() if preflight else patch("scripts.judge.judge_preflight")
+        with patch("scripts.providers.get_provider", return_value=provider), \
+             patch.object(run, "regenerate_dashboard_in_background"), skip_preflight:
+            run.cmd_rejudge(args)
+        return run.load_model_results("m1")
+
+    def test_judges_every_prompt(self, tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider, capsys):
+        data = self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider)
+        for pid in ("T00", "T01", "T02"):
+            latest = data["runs"][pid][-1]
+            assert set(latest["judge_scores"]) == {"j1", "j2"}
+            assert latest["judge_score_avg"] == 4.0 and latest["judge_count"] == 2
+        assert len(mock_judge_provider.calls) == 6
+        assert "Done: 6 judged, 0 skipped, 0 errors" in capsys.readouterr().out
+
+    def test_pass_shares_one_timestamp(self, tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider):
+        data = self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider)
+        stamps = {js["judged_at"] for runs in data["runs"].values() for js in runs[-1]["judge_scores"].values()}
+        assert stamps == {data["updated"]}
+
+    def test_failures_counted_and_cached_hits_reused(self, tmp_path, tmp_results_dir, monkeypatch,
+                                                    mock_judge_provider, capsys):
+        from tests.conftest import MockProvider
+        data = self._run(tmp_path, tmp_results_dir, monkeypatch, MockProvider(error=RuntimeError("down")))
+        assert data["runs"]["T00"][-1]["judge_score_avg"] is None
+        assert "Done: 0 judged, 0 skipped, 6 errors" in capsys.readouterr().out
+        self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider)
+        assert len(mock_judge_provider.calls) == 6
+        # Same responses again with --force: the judge cache is bypassed
+        self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider, force=True)
+        assert len(mock_judge_provider.calls) == 12
+
+    def test_batch_size_packs_items_per_call(self, tmp_path, tmp_results_dir, monkeypatch, capsys):
+        import re
+        from tests.conftest import MockProvider
+
+        class BatchJudge(MockProvider):
+            def complete(self, prompt, params):
+                self.calls.append(prompt)
+                n = len(re.findall(r"=== ITEM \d+ ===", prompt))
+                return json.dumps([{"id": i, "score": 5, "rationale": "ok"} for i in range(n)]), {}
+
+        judge = BatchJudge()
+        data = self._run(tmp_path, tmp_results_dir, monkeypatch, judge,
+                         judges="  - model: j1\n    batch_size: 2\n")
+        assert len(judge.calls) == 2  # 3 prompts in batches of 2
+        assert all(data["runs"][f"T0{i}"][-1]["judge_scores"]["j1"]["score"] == 5 for i in range(3))
+        assert "Done: 3 judged" in capsys.readouterr().out
+        # Batched judgements are cached too
+        self._run(tmp_path, tmp_results_dir, monkeypatch, judge, judges="  - model: j1\n    batch_size: 2\n")
+        assert len(judge.calls) == 2
+
+    def test_preflight_drops_broken_judge(self, tmp_path, tmp_results_dir, monkeypatch, capsys):
+        from tests.conftest import MockProvider
+        provider = MockProvider(response="not json")
+        with pytest.raises(SystemExit):
+            self._run(tmp_path, tmp_results_dir, monkeypatch, provider, preflight=True)
+        assert all("What is 2 + 2?" in c["prompt"] for c in provider.calls)
+        out = capsys.readouterr().out
+        assert "Judge preflight failed" in out and "No judges passed the preflight check." in out
+
+    def test_skip_empty_scores_blank_responses_locally(self, tmp_path, tmp_results_dir, monkeypatch,
+                                                      mock_judge_provider, capsys):
+        data = self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider,
+                         judges="  - model: j1\n    skip_empty: true\n", contents=("answer", "  \n", ""))
+        assert len(mock_judge_provider.calls) == 1
+        assert data["runs"]["T00"][-1]["judge_scores"]["j1"]["score"] == 4
+        assert data["runs"]["T01"][-1]["judge_scores"]["j1"]["score"] == 1
+        assert data["runs"]["T02"][-1]["judge_scores"]["j1"]["rationale"] == "Empty response (auto)"
+        assert "Done: 3 judged" in capsys.readouterr().out
+
+    def test_preflight_skipped_when_nothing_pending(self, tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider):
+        self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider)
+        self._run(tmp_path, tmp_results_dir, monkeypatch, mock_judge_provider, preflight=True, seed=False)
+        assert len(mock_judge_provider.calls) == 6  # everything already scored, so no preflight call
+
+
+class TestJudgePending:
+    def test_failing_judge_abandoned(self, capsys):
+        import asyncio
+        import run
+        from tests.conftest import MockProvider
+        provider = MockProvider(error=RuntimeError("down"))
+        judges = {"j1": {"provider": provider, "params": {}}}
+        pending = [(f"T{i:02d}", "j1", {"prompt": "p"}, "answer", {"flags": []}) for i in range(25)]
+
+        results = asyncio.run(run._judge_pending("m1", pending, judges, 1, None, max_failure_rate=0.5))
+
+        assert len(provider.calls) == run.JUDGE_FAILURE_MIN_SAMPLES
+        assert all(r["judge_score"] is None for r in results[:run.JUDGE_FAILURE_MIN_SAMPLES])
+        assert all(isinstance(r, run.JudgeAborted) for r in results[run.JUDGE_FAILURE_MIN_SAMPLES:])
+        assert "skipping its remaining items" in capsys.readouterr().out
+
+
 # ── cmd_migrate_judges ──
 
 class TestCmdMigrateJudges:
@@ -491,3 +633,370 @@ class TestCmdCompareConfig:
         )
         # Should not raise - previously it called load_config() with no args
         run.cmd_compare(args)
+
+
+class TestCmdCompareOutput:
+    def _setup(self, tmp_path, tmp_results_dir, monkeypatch):
+        import run
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("models: {}\njudges: []\n")
+        ef = tmp_path / "eval.json"
+        ef.write_text(json.dumps({"prompts": [
+            {"id": f"T0{i}", "category": cat, "subcategory": "s", "difficulty": "easy",
+             "prompt": "p", "ideal": "i", "criteria": [], "check_type": "reasoning"}
+            for i, cat in enumerate(["coding", "coding", "writing"])
+        ]}))
+        monkeypatch.setattr(run, "EVAL_FILE", str(ef))
+
+        def entry(score, flags=()):
+            return [{"timestamp": "t", "content": "c", "latency_s": 1.0, "output_tokens": 5,
+                     "auto_checks": {"flags": list(flags)}, "judge_score_avg": score}]
+
+        run.save_model_results("m1", {"model_name": "m1", "runs": {
+            "T00": entry(4.0), "T01": entry(2.0), "T02": entry(5.0, ["EMPTY"]),
+        }})
+        run.save_model_results("m2", {"model_name": "m2", "runs": {"T00": entry(3.0), "T01": entry(None)}})
+        return argparse.Namespace(config=str(config_file), models=[], ids=None,
+                                  category=None, difficulty=None, save=False)
+
+    def test_leaderboard_and_categories(self, tmp_path, tmp_results_dir, monkeypatch, capsys):
+        import run
+        run.cmd_compare(self._setup(tmp_path, tmp_results_dir, monkeypatch))
+        out = capsys.readouterr().out
+        lines = out.splitlines()
+        m1 = next(l for l in lines if l.startswith("m1 "))
+        m2 = next(l for l in lines if l.startswith("m2 "))
+        assert "3.67/5" in m1 and "3/3" in m1
+        assert "3.00/5" in m2 and "1/2" in m2
+        coding = next(l for l in lines if l.startswith("coding"))
+        writing = next(l for l in lines if l.startswith("writing"))
+        assert coding.split()[1:] == ["3.00", "3.00"]
+        assert writing.split()[1:] == ["5.00", "—"]
+        assert "m1: EMPTY" in out
+
+    def test_median_column(self, tmp_path, tmp_results_dir, monkeypatch, capsys):
+        import run
+        args = self._setup(tmp_path, tmp_results_dir, monkeypatch)
+        data = run.load_model_results("m2")
+        data["runs"]["T00"][0]["judge_score_median"] = 2.0
+        data["runs"]["T01"][0].update(judge_score_avg=3.0, judge_scores={
+            "a": {"score": 1}, "b": {"score": 2}, "c": {"score": 6}})
+        run.save_model_results("m2", data)
+        run.cmd_compare(args)
+        m2 = next(l for l in capsys.readouterr().out.splitlines() if l.startswith("m2 "))
+        # stored median 2.0 on T00; T01 predates the field, so it's taken from judge_scores
+        assert m2.split()[3] == "2.00"
+
+    def test_save_writes_markdown(self, tmp_path, tmp_results_dir, monkeypatch):
+        import run
+        args = self._setup(tmp_path, tmp_results_dir, monkeypatch)
+        args.save = True
+        run.cmd_compare(args)
+        md = (tmp_results_dir / "comparison.md").read_text()
+        assert "| m1 |" in md
+        assert "**m1**: score=5.0 ⚠ EMPTY" in md
+        assert "**m2**: score=None" in md
+
+
+class TestCmdModels:
+    def test_counts_judged_and_deepeval(self, tmp_results_dir, capsys):
+        import run
+        run.save_model_results("m1", {"model_name": "m1", "created": "2026-01-01", "runs": {
+            "T00": [{"judge_score_avg": 4.0, "deepeval_scores": {"correctness": 0.8}}],
+            "T01": [{"judge_score_avg": None, "deepeval_scores": {"correctness": None}}],
+            "T02": [{"judge_score_avg": None}, {"judge_score_avg": 3.0}],
+        }}, updated_at="2026-02-01T00:00:00")
+        run.cmd_models(argparse.Namespace())
+        line = next(l for l in capsys.readouterr().out.splitlines() if "m1" in l)
+        assert " 3 prompts,  2 judged,  1 deepeval  (updated: 2026-02-01)" in line
+
+
+class TestBackgroundDashboard:
+    def test_spawns_detached_process(self, tmp_results_dir):
+        import subprocess
+        import sys
+        import run
+        with patch("subprocess.Popen") as popen:
+            run.regenerate_dashboard_in_background()
+        args, kwargs = popen.call_args
+        assert args[0] == [sys.executable, "-m", "scripts.dashboard"]
+        assert kwargs["start_new_session"] is True
+        assert kwargs["stdout"].name == str(tmp_results_dir / ".dashboard.log")
+        assert kwargs["stderr"] is subprocess.STDOUT
+
+    def test_warns_when_last_rebuild_crashed(self, tmp_results_dir, capsys):
+        import run
+        (tmp_results_dir / ".dashboard.log").write_text("Traceback (most recent call last):\n  ...\nKeyError: 'x'\n")
+        with patch("subprocess.Popen"):
+            run.regenerate_dashboard_in_background()
+        assert "last dashboard rebuild failed" in capsys.readouterr().out
+
+
+class TestRequestsPerMinute:
+    def test_explicit_rate_wins(self):
+        import run
+        assert run.requests_per_minute({"requests_per_minute": 120, "delay_between_calls": 1}) == 120
+
+    def test_derived_from_delay(self):
+        import run
+        assert run.requests_per_minute({"delay_between_calls": 0.5}) == 120
+        assert run.requests_per_minute({}) == 60
+
+    def test_zero_delay_unlimited(self):
+        import run
+        assert run.requests_per_minute({"delay_between_calls": 0}) is None
+
+
+class TestLazyImports:
+    def test_import_does_not_load_providers(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, run; "
+            "heavy = [m for m in ('httpx', 'yaml', 'dotenv', 'scripts.providers', 'scripts.dashboard') "
+            "if m in sys.modules]; "
+            "print(heavy)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "[]"
+
+
+# ── cmd_eval concurrent loop ──
+
+class TestEvalPrompts:
+    def _prompts(self, n):
+        return [
+            {"id": f"T{i:02d}", "category": "coding", "subcategory": "test",
+             "difficulty": "easy", "prompt": f"Prompt {i}", "ideal": "i",
+             "criteria": [], "check_type": "reasoning"}
+            for i in range(n)
+        ]
+
+    def test_all_prompts_saved_with_judge_scores(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+        from tests.conftest import MockProvider
+
+        provider = MockProvider(response="A reasonably long response body.")
+        judge = MockProvider(response='{"score": 4, "rationale": "Good."}')
+        judges = {"judge-model": {"provider": judge, "params": {}}}
+        model_data = run.load_model_results("test-model")
+        prompts = self._prompts(5)
+
+        asyncio.run(run._eval_prompts(
+            "test-model", sample_config["models"]["test-model"], model_data,
+            prompts, provider, judges, sample_config,
+        ))
+
+        saved = run.load_model_results("test-model")
+        assert sorted(saved["runs"]) == [p["id"] for p in prompts]
+        assert len(provider.calls) == 5
+        assert len(list((tmp_results_dir / ".judge_cache").glob("*.json"))) == 5
+        for pid in saved["runs"]:
+            entry = saved["runs"][pid][-1]
+            assert entry["judge_scores"]["judge-model"]["score"] == 4
+            assert entry["judge_score_avg"] == 4.0
+
+    def test_provider_error_recorded(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+        from tests.conftest import MockProvider
+
+        provider = MockProvider(error=RuntimeError("boom"))
+        model_data = run.load_model_results("test-model")
+
+        asyncio.run(run._eval_prompts(
+            "test-model", sample_config["models"]["test-model"], model_data,
+            self._prompts(2), provider, {}, sample_config,
+        ))
+
+        entry = run.load_model_results("test-model")["runs"]["T00"][-1]
+        assert entry["error"] == "boom"
+        assert entry["auto_checks"]["flags"] == ["API_ERROR"]
+
+    def test_log_consolidated_and_removed(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+        from tests.conftest import MockProvider
+
+        provider = MockProvider(response="A reasonably long response body.")
+        model_data = run.load_model_results("test-model")
+
+        asyncio.run(run._eval_prompts(
+            "test-model", sample_config["models"]["test-model"], model_data,
+            self._prompts(3), provider, {}, sample_config,
+        ))
+
+        assert not os.path.exists(run.runs_log_path("test-model"))
+        with open(run.model_path("test-model")) as f:
+            assert len(json.load(f)["runs"]) == 3
+
+    def test_judging_overlaps_next_model_call(self, tmp_results_dir, sample_config):
+        """With one eval slot, prompt 2's model call must start while prompt 1 is being judged."""
+        import asyncio
+        import run
+        from tests.conftest import MockProvider
+
+        provider = MockProvider(response="A reasonably long response body.")
+
+        class BlockingJudge(MockProvider):
+            async def acomplete(self, prompt, params):
+                # Only completes once the model has moved on to the second prompt
+                while len(provider.calls) < 2:
+                    await asyncio.sleep(0.01)
+                return '{"score": 4, "rationale": "ok"}', {}
+
+        judges = {"judge-model": {"provider": BlockingJudge(), "params": {}}}
+        sample_config["eval"]["concurrency"] = 1
+        model_data = run.load_model_results("test-model")
+
+        async def go():
+            await asyncio.wait_for(run._eval_prompts(
+                "test-model", sample_config["models"]["test-model"], model_data,
+                self._prompts(2), provider, judges, sample_config,
+            ), timeout=5)
+
+        asyncio.run(go())
+        saved = run.load_model_results("test-model")
+        assert [saved["runs"][pid][-1]["judge_score_avg"] for pid in ("T00", "T01")] == [4.0, 4.0]
+
+    def _batch_provider(self):
+        from tests.conftest import MockProvider
+
+        class BatchProvider(MockProvider):
+            supports_batch = True
+            batches = []
+
+            def batch_complete(self, prompts, params):
+                self.batches.append(prompts)
+                return [(f"Batched answer to {p}", {"output_tokens": 3}) for p in prompts]
+
+        return BatchProvider()
+
+    def test_batch_api_used_when_enabled(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+
+        provider = self._batch_provider()
+        model_cfg = dict(sample_config["models"]["test-model"], use_batch_api=True)
+        model_data = run.load_model_results("test-model")
+        prompts = self._prompts(run.BATCH_MIN_PROMPTS)
+
+        asyncio.run(run._eval_prompts("test-model", model_cfg, model_data, prompts, provider, {}, sample_config))
+
+        assert len(provider.batches) == 1 and len(provider.batches[0]) == len(prompts)
+        assert provider.calls == []
+        entry = run.load_model_results("test-model")["runs"]["T03"][-1]
+        assert entry["content"] == "Batched answer to Prompt 3"
+        assert entry["batch"] is True
+        assert entry["latency_s"] is None
+
+    def test_batch_results_cached(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+
+        provider = self._batch_provider()
+        model_cfg = dict(sample_config["models"]["test-model"], use_batch_api=True)
+        prompts = self._prompts(run.BATCH_MIN_PROMPTS)
+        for _ in range(2):
+            model_data = run.load_model_results("test-model")
+            asyncio.run(run._eval_prompts("test-model", model_cfg, model_data, prompts, provider, {}, sample_config))
+
+        assert len(provider.batches) == 1
+        assert run.load_model_results("test-model")["runs"]["T00"][-1]["cached"] is True
+
+    def test_small_runs_skip_batch(self, tmp_results_dir, sample_config):
+        import asyncio
+        import run
+
+        provider = self._batch_provider()
+        model_cfg = dict(sample_config["models"]["test-model"], use_batch_api=True)
+        model_data = run.load_model_results("test-model")
+
+        asyncio.run(run._eval_prompts("test-model", model_cfg, model_data, self._prompts(3), provider, {}, sample_config))
+
+        assert provider.batches == []
+        assert len(provider.calls) == 3
+
+
+class TestRunsLog:
+    def test_append_replayed_on_load(self, tmp_results_dir):
+        import run
+        run.append_run("m", "P1", {"timestamp": "t1", "content": "a"})
+        run.append_run("m", "P1", {"timestamp": "t2", "content": "b"})
+        data = run.load_model_results("m")
+        assert [r["content"] for r in data["runs"]["P1"]] == ["a", "b"]
+        assert "pid" not in data["runs"]["P1"][0]
+
+    def test_replay_skips_consolidated_entries(self, tmp_results_dir):
+        import run
+        run.save_model_results("m", {"model_name": "m", "runs": {"P1": [{"timestamp": "t1"}]}})
+        run.append_run("m", "P1", {"timestamp": "t1"})
+        run.append_run("m", "P1", {"timestamp": "t2"})
+        data = run.load_model_results("m")
+        assert [r["timestamp"] for r in data["runs"]["P1"]] == ["t1", "t2"]
+
+    def test_torn_last_line_ignored(self, tmp_results_dir):
+        import run
+        run.append_run("m", "P1", {"timestamp": "t1"})
+        with open(run.runs_log_path("m"), "a") as f:
+            f.write('{"pid": "P2", "timest')
+        data = run.load_model_results("m")
+        assert list(data["runs"]) == ["P1"]
+
+    def test_consolidate_removes_log(self, tmp_results_dir):
+        import run
+        run.append_run("m", "P1", {"timestamp": "t1"})
+        data = run.load_model_results("m")
+        run.consolidate_model_results("m", data)
+        assert not os.path.exists(run.runs_log_path("m"))
+        assert run.load_model_results("m")["runs"]["P1"] == [{"timestamp": "t1"}]
+
+
+class TestModelRunsIndex:
+    @pytest.fixture(params=["ijson", "fallback"])
+    def parser(self, request, monkeypatch):
+        import sys
+        if request.param == "fallback":
+            monkeypatch.setitem(sys.modules, "ijson", None)
+        else:
+            pytest.importorskip("ijson")
+        return request.param
+
+    def _save(self):
+        import run
+        run.save_model_results("m", {"model_name": "m", "created": "2026-01-01", "runs": {
+            "P1": [
+                {"timestamp": "t1", "content": "old", "judge_score_avg": 2.0},
+                {"timestamp": "t2", "content": "new", "latency_s": 1.5,
+                 "auto_checks": {"flags": ["EMPTY"]},
+                 "judge_scores": {"j1": {"score": 4, "rationale": "long text"}},
+                 "judge_score_avg": 4.0},
+            ],
+            "P2": [],
+        }})
+
+    def test_strips_text_keeps_metadata(self, tmp_results_dir, parser):
+        import run
+        self._save()
+        idx = run.load_model_runs_index("m")
+        assert idx["created"] == "2026-01-01"
+        assert idx["updated"]
+        assert list(idx["runs"]) == ["P1", "P2"]
+        assert idx["runs"]["P2"] == []
+        old, new = idx["runs"]["P1"]
+        assert "content" not in old and "content" not in new
+        assert new["judge_scores"] == {"j1": {"score": 4}}
+        assert new["latency_s"] == 1.5 and isinstance(new["latency_s"], float)
+        assert new["auto_checks"]["flags"] == ["EMPTY"]
+
+    def test_includes_unconsolidated_log(self, tmp_results_dir, parser):
+        import run
+        self._save()
+        run.append_run("m", "P3", {"timestamp": "t3", "content": "x", "judge_score_avg": 5.0})
+        idx = run.load_model_runs_index("m")
+        assert idx["runs"]["P3"] == [{"timestamp": "t3", "judge_score_avg": 5.0}]
+
+    def test_missing_model(self, tmp_results_dir, parser):
+        import run
+        assert run.load_model_runs_index("nope")["runs"] == {}